@@ -0,0 +1,40 @@
+"""
+Arabic text normalization for searching.
+
+fold_arabic maps the spelling variants people type interchangeably onto one
+form, so "أحمد", "احمد" and "أَحْمَد" all match each other. It folds the text
+of rows as they are indexed for searching and the words of each query. It
+is also registered as the SQL function arabic_fold on the application's
+connections, for the migrations that fill the index; the schema itself
+(triggers) does not use it, so other SQLite tools can write to the tables.
+"""
+import re
+import unicodedata
+
+# Tashkeel (harakat, tanween, shadda, sukun, ...), superscript alef,
+# Quranic annotation marks and tatweel
+_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+
+_LETTER_FOLDS = str.maketrans({
+    "\u0622": "\u0627",  # alef with madda -> alef
+    "\u0623": "\u0627",  # alef with hamza above -> alef
+    "\u0625": "\u0627",  # alef with hamza below -> alef
+    "\u0671": "\u0627",  # alef wasla -> alef
+    "\u0629": "\u0647",  # taa marbuta -> haa
+    "\u0649": "\u064a",  # alef maqsura -> yaa
+    "\u0624": "\u0648",  # waw with hamza -> waw
+    "\u0626": "\u064a",  # yaa with hamza -> yaa
+})
+
+def fold_arabic(text) -> str:
+    """Returns text folded for comparison ("" for None).
+
+    Presentation forms are decomposed (NFKC), diacritics and tatweel removed,
+    alef/hamza, taa marbuta and alef maqsura variants unified, and Latin
+    letters lower-cased.
+    """
+    if not isinstance(text, str):
+        return "" if text is None else str(text)
+    text = unicodedata.normalize("NFKC", text)
+    text = _DIACRITICS.sub("", text)
+    return text.translate(_LETTER_FOLDS).casefold()
@@ -0,0 +1,204 @@
+"""
+Read-through cache for the query functions in backend.database.
+
+The UI runs the same reads again and again within seconds (opening the fees
+page, going back to the dashboard, ...). Query results are kept in memory,
+keyed by function and arguments, and tagged with the tables they were read
+from:
+
+- every table has a version counter, bumped by the write functions
+- an entry is only served while the versions of its tables are unchanged
+- writes made by another process are detected through PRAGMA data_version,
+  and drop every entry
+- a write inside a larger transaction (e.g. a group commit) bumps its tables
+  again when the transaction ends, so results read meanwhile through other
+  connections, which could not see the write yet, do not stay cached
+
+The cache holds at most max_entries results and evicts the least recently
+used one first. Cached results are shared between callers and must be
+treated as read-only.
+"""
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+
+class CacheStats:
+    """Thread-safe counters describing cache usage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def record_eviction(self):
+        with self._lock:
+            self.evictions += 1
+
+    def record_invalidation(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        """Returns the current counters as a plain dictionary."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+class QueryCache:
+    """LRU cache of query results, invalidated per table.
+
+    Attributes:
+        max_entries: Maximum number of results kept.
+        version_source: Callable returning the database's data_version (or
+            None when it cannot be read right now); a change means another
+            process wrote to the database.
+        after_transaction: Callable scheduling a function to run when the
+            current write transaction ends (or right away outside one).
+        stats: CacheStats with hit/miss/eviction/invalidation counters.
+    """
+
+    def __init__(self, max_entries: int = 256, version_source=None, after_transaction=None):
+        self.max_entries = max_entries
+        self.version_source = version_source
+        self.after_transaction = after_transaction
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (tables, versions, value)
+        self._versions = {}            # table -> write counter
+        self._data_version = None
+        # Counts changes to every table at once: clear() and writes by other processes
+        self._generation = 0
+
+    # --- Invalidation ---
+
+    def bump(self, *tables):
+        """Marks the given tables as written; entries read from them go stale."""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            if self._entries:
+                self.stats.record_invalidation()
+            self._entries.clear()
+            self._data_version = None
+            self._generation += 1
+
+    def versions(self, *tables) -> tuple:
+        """Returns a token that changes whenever one of the tables is written.
+
+        Writes by other processes and clear() change the token of every table.
+        """
+        self._check_data_version()
+        with self._lock:
+            return (self._generation, *(self._versions.get(table, 0) for table in tables))
+
+    def _check_data_version(self):
+        """Clears the cache if another process has written since the last check."""
+        if self.version_source is None:
+            return
+        data_version = self.version_source()
+        if data_version is None:
+            return
+        with self._lock:
+            if data_version != self._data_version:
+                if self._data_version is not None:
+                    self._generation += 1
+                    if self._entries:
+                        self._entries.clear()
+                        self.stats.record_invalidation()
+                self._data_version = data_version
+
+    # --- Lookup ---
+
+    def get(self, key, tables, load):
+        """Returns the cached result for key, calling load() on a miss.
+
+        Args:
+            key: Hashable key identifying the query and its arguments.
+            tables: Names of the tables the result is read from.
+            load: Function computing the result.
+        """
+        self._check_data_version()
+        with self._lock:
+            versions = tuple(self._versions.get(table, 0) for table in tables)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == versions:
+                self._entries.move_to_end(key)
+                self.stats.record_hit()
+                return entry[2]
+
+        self.stats.record_miss()
+        # Loaded outside the lock so slow queries do not block other lookups.
+        # The versions were taken before loading: if a write lands meanwhile,
+        # the entry is stored already stale and is reloaded on the next call.
+        value = load()
+        with self._lock:
+            self._entries[key] = (tables, versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.record_eviction()
+        return value
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- Decorators ---
+
+    def cached(self, *tables):
+        """Decorator caching a query function's results, tagged with tables.
+
+        Calls with unhashable arguments (e.g. lists) are passed straight through.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (func.__name__, args, tuple(sorted(kwargs.items())))
+                try:
+                    hash(key)
+                except TypeError:
+                    return func(*args, **kwargs)
+                return self.get(key, tables, lambda: func(*args, **kwargs))
+            return wrapper
+        return decorator
+
+    def invalidates(self, *tables):
+        """Decorator bumping the given tables after a write function returns (or raises)."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.bump(*tables)
+                    if self.after_transaction is not None:
+                        self.after_transaction(lambda: self.bump(*tables))
+            return wrapper
+        return decorator
@@ -0,0 +1,475 @@
+"""
+Connection management for the students.db SQLite database.
+
+Instead of opening and closing a connection for every statement, the
+application keeps a small set of long-lived connections:
+
+- a pool of read connections, each lent to one thread at a time
+- a single writer connection guarded by a lock, so writes are serialized
+
+Connections are opened in autocommit mode; the writer context manager wraps
+its block in an explicit transaction. Counters for opens, reuses and time
+spent waiting for a connection are kept so the overhead can be measured.
+
+Every new connection gets the same performance profile (WAL journal, NORMAL
+sync, cache/mmap sizes, ...) and the application's SQL functions (arabic_fold,
+used by the search index triggers). The defaults below can be overridden per
+installation through rows in the settings table named "sqlite.<pragma>",
+e.g. ("sqlite.cache_size", "-32000"); overrides apply on the next start.
+"""
+import queue
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from .arabic import fold_arabic
+
+# Default database file, relative to the working directory (as before)
+DB_PATH = "students.db"
+
+# Settings table key prefix for profile overrides
+PROFILE_SETTING_PREFIX = "sqlite."
+
+# PRAGMAs applied to every new connection, in order
+DEFAULT_PROFILE = {
+    "journal_mode": "WAL",     # Readers and writers (and backups) no longer block each other
+    "synchronous": "NORMAL",   # Safe with WAL; fsync on checkpoint instead of every commit
+    "cache_size": -16000,      # Negative means KiB: 16 MB page cache per connection
+    "mmap_size": 134217728,    # Memory-map up to 128 MB of the database file
+    "temp_store": "MEMORY",    # Temporary tables and sort indices in memory
+    "busy_timeout": 5000       # Milliseconds to wait on a locked database
+}
+
+# SQLite's own defaults, used as the "before" baseline in benchmarks
+LEGACY_PROFILE = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL"
+}
+
+# Pages copied per step by backup_to() when reporting progress (4 MB at 4 KB pages)
+BACKUP_STEP_PAGES = 1024
+
+# PRAGMA values must be plain words or integers (they cannot be bound as parameters)
+_PRAGMA_VALUE = re.compile(r"^-?\d+$|^[A-Za-z_]+$")
+
+
+class ConnectionStats:
+    """Thread-safe counters describing connection usage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero."""
+        with self._lock:
+            self.opens = 0
+            self.reuses = 0
+            self.waits = 0
+            self.wait_time = 0.0
+
+    def record_open(self):
+        with self._lock:
+            self.opens += 1
+
+    def record_reuse(self):
+        with self._lock:
+            self.reuses += 1
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.waits += 1
+            self.wait_time += seconds
+
+    def snapshot(self) -> dict:
+        """Returns the current counters as a plain dictionary."""
+        with self._lock:
+            return {
+                "opens": self.opens,
+                "reuses": self.reuses,
+                "waits": self.waits,
+                "wait_time": self.wait_time
+            }
+
+
+class ConnectionManager:
+    """Hands out long-lived SQLite connections to the database functions.
+
+    Attributes:
+        path: Path of the SQLite database file.
+        max_readers: Maximum number of read connections kept in the pool.
+        cached_statements: Size of each connection's prepared statement cache.
+        timeout: Seconds to wait for a lock or a free read connection.
+        stats: ConnectionStats with open/reuse/wait counters.
+        profile: PRAGMA name -> value applied to each new connection.
+    """
+
+    def __init__(self, path: str = DB_PATH, max_readers: int = 4,
+                 cached_statements: int = 256, timeout: float = 5.0,
+                 profile: dict = None, load_overrides: bool = True):
+        self.path = path
+        self.max_readers = max_readers
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self.stats = ConnectionStats()
+        self.profile = dict(DEFAULT_PROFILE if profile is None else profile)
+
+        # Overrides from the settings table are read once, on the first open
+        self._load_overrides = load_overrides
+        self._profile_lock = threading.Lock()
+
+        self._idle_readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._lent_readers = set()     # Readers currently lent to a thread
+        self._retired_readers = set()  # Readers lent out when close() ran; closed on return
+        self._pool_lock = threading.Lock()
+        # True after close(), until a connection is opened again
+        self.closed = False
+
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        # Functions run on the writer connection before every COMMIT
+        self._before_commit = []
+
+        # Per-thread bookkeeping so nested calls reuse the same connection
+        self._local = threading.local()
+
+    # --- Connection Creation ---
+
+    def _open(self) -> sqlite3.Connection:
+        """Opens a new connection to the database file."""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,  # Transactions are managed explicitly
+            check_same_thread=False,  # Pooled connections move between threads
+            cached_statements=self.cached_statements
+        )
+        self.stats.record_open()
+        # Needed by the search index triggers on every write to the indexed tables
+        conn.create_function("arabic_fold", 1, fold_arabic, deterministic=True)
+        self._apply_profile(conn)
+        return conn
+
+    def _apply_profile(self, conn: sqlite3.Connection):
+        """Applies the performance profile PRAGMAs to a new connection."""
+        with self._profile_lock:
+            if self._load_overrides:
+                self._load_overrides = False
+                self.profile.update(self._read_profile_overrides(conn))
+            profile = dict(self.profile)
+
+        for name, value in profile.items():
+            try:
+                conn.execute(f"PRAGMA {name}={value}")
+            except sqlite3.Error as e:
+                print(f"Database error applying PRAGMA {name}={value}: {e}")
+
+    @staticmethod
+    def _read_profile_overrides(conn: sqlite3.Connection) -> dict:
+        """Reads "sqlite.<pragma>" rows from the settings table, if it exists."""
+        try:
+            rows = conn.execute(
+                "SELECT key, value FROM settings WHERE key LIKE ?",
+                (PROFILE_SETTING_PREFIX + "%",)
+            ).fetchall()
+        except sqlite3.Error:
+            # No settings table yet (first run)
+            return {}
+
+        overrides = {}
+        for key, value in rows:
+            name = key[len(PROFILE_SETTING_PREFIX):]
+            value = str(value).strip()
+            if name.isidentifier() and _PRAGMA_VALUE.match(value):
+                overrides[name] = value
+            else:
+                print(f"Ignoring invalid database profile setting '{key}' = '{value}'")
+        return overrides
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """Returns the writer connection, opening it on first use."""
+        if self._writer is None:
+            self._writer = self._open()
+            self.closed = False
+        else:
+            self.stats.record_reuse()
+        return self._writer
+
+    def _discard_writer(self):
+        """Closes the writer connection (rolling back anything left open); the next use opens a new one."""
+        conn, self._writer = self._writer, None
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Database error closing the writer connection: {e}")
+
+    def _rollback(self, conn: sqlite3.Connection):
+        """Rolls back the writer's transaction, discarding the connection if even that fails."""
+        if not conn.in_transaction:
+            return
+        try:
+            conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            print(f"Database error rolling back: {e}")
+            self._discard_writer()
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Takes a read connection from the pool, opening or waiting as needed."""
+        conn = self._take_reader()
+        with self._pool_lock:
+            self._lent_readers.add(conn)
+        return conn
+
+    def _take_reader(self) -> sqlite3.Connection:
+        """Takes an idle reader, opens a new one, or waits for one to be returned."""
+        try:
+            conn = self._idle_readers.get_nowait()
+            self.stats.record_reuse()
+            return conn
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if self._reader_count < self.max_readers:
+                self._reader_count += 1
+                try:
+                    conn = self._open()
+                except Exception:
+                    self._reader_count -= 1
+                    raise
+                self.closed = False
+                return conn
+
+        # Pool exhausted: wait for another thread to return a connection
+        started = time.perf_counter()
+        try:
+            conn = self._idle_readers.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("timed out waiting for a database connection")
+        self.stats.record_wait(time.perf_counter() - started)
+        self.stats.record_reuse()
+        return conn
+
+    def _release_reader(self, conn: sqlite3.Connection):
+        """Returns a lent reader to the pool, or closes it if close() ran meanwhile."""
+        with self._pool_lock:
+            self._lent_readers.discard(conn)
+            retired = conn in self._retired_readers
+            self._retired_readers.discard(conn)
+        if retired:
+            conn.close()
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle_readers.put(conn)
+
+    # --- Context Managers ---
+
+    @contextmanager
+    def reader(self):
+        """Yields a connection for read-only statements.
+
+        Nested calls on the same thread reuse the connection already lent to
+        it. A thread that currently holds the writer reads through the writer,
+        so it sees its own uncommitted changes.
+        """
+        if getattr(self._local, "writer_depth", 0):
+            yield self._writer
+            return
+
+        conn = getattr(self._local, "reader", None)
+        if conn is not None:
+            self._local.reader_depth += 1
+            self.stats.record_reuse()
+            try:
+                yield conn
+            finally:
+                self._local.reader_depth -= 1
+            return
+
+        conn = self._acquire_reader()
+        self._local.reader = conn
+        self._local.reader_depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            self._local.reader_depth = 0
+            self._release_reader(conn)
+
+    @contextmanager
+    def read_transaction(self):
+        """Yields a read connection inside a single read transaction.
+
+        All statements in the block see the same snapshot of the database.
+        """
+        with self.reader() as conn:
+            if conn.in_transaction:
+                # Already inside a transaction (nested call or writer)
+                yield conn
+                return
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+
+    @contextmanager
+    def writer(self):
+        """Yields the writer connection inside a transaction.
+
+        The block is committed when it finishes and rolled back if it (or a
+        before_commit function, or the COMMIT) raises. Callbacks registered
+        with after_transaction run once the transaction has ended either way.
+        Nested calls on the same thread run inside a savepoint of the outer
+        transaction: if a nested block raises, only its own changes are undone
+        and the outer block may catch the error and carry on.
+        """
+        started = time.perf_counter()
+        if not self._writer_lock.acquire(timeout=self.timeout):
+            raise sqlite3.OperationalError("timed out waiting for the database writer")
+        waited = time.perf_counter() - started
+        try:
+            depth = getattr(self._local, "writer_depth", 0)
+            if depth:
+                conn = self._writer
+                savepoint = f"writer_{depth}"
+                conn.execute(f"SAVEPOINT {savepoint}")
+                self._local.writer_depth = depth + 1
+                try:
+                    yield conn
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute(f"ROLLBACK TO {savepoint}")
+                        conn.execute(f"RELEASE {savepoint}")
+                    raise
+                else:
+                    conn.execute(f"RELEASE {savepoint}")
+                finally:
+                    self._local.writer_depth = depth
+                return
+
+            if waited > 0.001:
+                self.stats.record_wait(waited)
+            conn = self._get_writer()
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.writer_depth = 1
+            self._local.after_transaction = []
+            try:
+                try:
+                    yield conn
+                    for function in self._before_commit:
+                        function(conn)
+                except BaseException:
+                    self._rollback(conn)
+                    raise
+                try:
+                    conn.execute("COMMIT")
+                except BaseException:
+                    # e.g. SQLITE_BUSY: leave no transaction open for the next BEGIN
+                    self._rollback(conn)
+                    raise
+            finally:
+                self._local.writer_depth = 0
+                callbacks, self._local.after_transaction = self._local.after_transaction, []
+                # The transaction has ended (committed, rolled back or discarded with its connection)
+                for callback in callbacks:
+                    callback()
+        finally:
+            self._writer_lock.release()
+
+    def before_commit(self, function):
+        """Registers function(conn) to run on the writer connection before every COMMIT.
+
+        It runs inside the outermost write transaction, after the block, so
+        its writes are committed (or rolled back) with the block's. An
+        exception from it rolls the transaction back.
+        """
+        self._before_commit.append(function)
+
+    def after_transaction(self, callback):
+        """Runs callback once the current thread's write transaction has ended.
+
+        Runs it right away when the thread is not inside writer(). Used to
+        invalidate cached reads only once other connections can see (or will
+        never see) the changes.
+        """
+        if getattr(self._local, "writer_depth", 0):
+            self._local.after_transaction.append(callback)
+        else:
+            callback()
+
+    def data_version(self):
+        """Returns PRAGMA data_version as seen by the writer connection.
+
+        The value changes whenever another connection commits. Every write
+        made by this process goes through the writer, so in practice a change
+        means another process wrote to the database. Returns None when another
+        thread is holding the writer, instead of waiting for it.
+        """
+        if not self._writer_lock.acquire(blocking=False):
+            return None
+        try:
+            conn = self._writer if self._writer is not None else self._get_writer()
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+        finally:
+            self._writer_lock.release()
+
+    # --- Maintenance ---
+
+    def checkpoint(self):
+        """Copies the WAL contents back into the main database file."""
+        with self._writer_lock:
+            conn = self._get_writer()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def backup_to(self, destination: str, progress=None, pages: int = BACKUP_STEP_PAGES):
+        """Writes a consistent copy of the database to another file.
+
+        Uses SQLite's online backup API, so it is safe while the application
+        is reading and writing, and includes changes still in the WAL.
+
+        Args:
+            destination: Path of the copy.
+            progress: Optional function called with the fraction copied so far
+                (0.0-1.0) after every step of `pages` pages. If it raises, the
+                backup stops and the exception propagates.
+            pages: Pages copied per step when progress is given.
+        """
+        def report(status, remaining, total):
+            progress((total - remaining) / total if total else 1.0)
+
+        with self.reader() as conn:
+            target = sqlite3.connect(destination)
+            try:
+                if progress is None:
+                    conn.backup(target)
+                else:
+                    conn.backup(target, pages=pages, progress=report)
+            finally:
+                target.close()
+
+    # --- Lifecycle ---
+
+    def close(self):
+        """Closes every connection held by the manager.
+
+        Readers lent to other threads are closed when they are returned. The
+        manager can still be used afterwards; it then opens new connections.
+        """
+        with self._writer_lock:
+            self._discard_writer()
+        with self._pool_lock:
+            while True:
+                try:
+                    self._idle_readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._retired_readers |= self._lent_readers
+            self._reader_count = 0
+            self.closed = True
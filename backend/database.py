@@ -1,603 +1,1350 @@
+import re
 import sqlite3
 
+from .arabic import fold_arabic
+from .cache import QueryCache
+from .connection import ConnectionManager, DB_PATH
+from .records import (
+    student_row, teacher_row, income_row, expense_row, salary_row, teacher_salary_row
+)
+from .migrations import (
+    SEARCH_KINDS, SEARCH_ROWID_FACTOR, compute_rollups, index_pending_search_rows, read_rollups, rebuild_rollups
+)
+from .dates import to_iso
+from .money import Money, to_cents
+from .settings import SettingsStore
+from .write_queue import WriteQueue
+
 # --- Database Connection ---
 
-def get_connection():
-    """Establishes and returns a connection to the students.db SQLite database."""
-    return sqlite3.connect("students.db")
+def _create_manager(path, profile=None):
+    """Creates a ConnectionManager that indexes queued search rows before every commit."""
+    manager = ConnectionManager(path, profile=profile)
+    manager.before_commit(index_pending_search_rows)
+    return manager
 
-# --- Table Creation ---
+# Shared manager handing out long-lived connections to every function below
+_db = _create_manager(DB_PATH)
 
-def create_students_table():
-    """Creates the students table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS students (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            nid TEXT,
-            term TEXT,
-            gender TEXT,
-            phone1 TEXT,
-            phone2 TEXT,
-            fee1 TEXT,
-            fee2 TEXT,
-            fee3 TEXT,
-            fee4 TEXT,
-            fee1_date TEXT,
-            fee2_date TEXT,
-            fee3_date TEXT,
-            fee4_date TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+# Results of the read functions below, tagged with the tables they read.
+# Write functions bump their tables through @_cache.invalidates; writes from
+# other processes are caught by the data_version check. Functions that
+# report errors by returning a default value wrap a cached _load_* function,
+# so the default is never cached.
+_cache = QueryCache(
+    version_source=lambda: _db.data_version(),
+    after_transaction=lambda callback: _db.after_transaction(callback)
+)
 
-def create_general_expenses_table():
-    """Creates the general_expenses table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS general_expenses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            description TEXT,
-            amount REAL,
-            date TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+# Optional group commit for bursts of writes (see queue_write below)
+_write_queue = WriteQueue(lambda: _db.writer())
 
-def create_income_table():
-    """Creates the income table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS income (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            description TEXT,
-            amount REAL,
-            date TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+# The settings table, loaded once and kept in memory (see get_setting below)
+_settings = SettingsStore(
+    reader=lambda: _db.reader(),
+    writer=lambda: _db.writer(),
+    version_source=lambda: _db.data_version()
+)
 
-def create_activities_table():
-    """Creates the activities table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS activities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            description TEXT,
-            activity_date TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+def get_connection_manager():
+    """Returns the ConnectionManager used by the database functions."""
+    return _db
 
-def create_teachers_table():
-    """Creates the teachers table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS teachers (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            nid TEXT,
-            term TEXT,
-            gender TEXT,
-            phone1 TEXT,
-            phone2 TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+def set_database_path(path, profile=None):
+    """Points the database functions at another SQLite file (closing open connections).
 
-def create_teacher_salaries_table():
-    """Creates the teacher_salaries table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS teacher_salaries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            teacher_id INTEGER,
-            amount REAL,
-            date TEXT,
-            FOREIGN KEY (teacher_id) REFERENCES teachers(id)
-        )
-    """)
-    conn.commit()
-    conn.close()
+    Args:
+        path: Path of the SQLite database file.
+        profile: Optional PRAGMA profile; defaults to connection.DEFAULT_PROFILE.
+    """
+    global _db
+    _write_queue.flush()
+    _db.close()
+    _db = _create_manager(path, profile)
+    _cache.clear()
+    _settings.invalidate()
 
-def create_settings_table():
-    """Creates the settings table if it doesn't already exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS settings (
-            key TEXT PRIMARY KEY,
-            value TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+def get_connection_stats():
+    """Returns counters for connection opens, reuses and time spent waiting."""
+    return _db.stats.snapshot()
+
+def index_queued_search_rows():
+    """Indexes rows added or renamed by other programs since this one last wrote.
+
+    The application's own writes are indexed as they commit; rows written
+    with another SQLite tool wait in search_pending (see migration 9).
+
+    Returns:
+        The number of rows indexed.
+    """
+    with _db.reader() as conn:
+        if conn.execute("SELECT 1 FROM search_pending LIMIT 1").fetchone() is None:
+            return 0
+    with _db.writer() as conn:
+        return index_pending_search_rows(conn)
+
+def close_connections():
+    """Closes all pooled connections (call on application exit)."""
+    _db.close()
+
+def get_performance_profile():
+    """Returns the PRAGMA profile applied to new connections."""
+    return dict(_db.profile)
+
+def checkpoint_database():
+    """Flushes the write-ahead log into the main database file."""
+    _db.checkpoint()
+
+def backup_database_to(destination, progress=None):
+    """Writes a consistent copy of the database to the destination file.
+
+    Args:
+        destination: Path of the copy.
+        progress: Optional function called with the fraction copied so far
+            (0.0-1.0); raising from it aborts the backup.
+    """
+    _db.backup_to(destination, progress)
+
+def get_cache_stats():
+    """Returns counters for query cache hits, misses, evictions and invalidations."""
+    snapshot = _cache.stats.snapshot()
+    snapshot["entries"] = len(_cache)
+    return snapshot
+
+def clear_cache():
+    """Drops every cached query result."""
+    _cache.clear()
+
+def get_table_versions(*tables):
+    """Returns a token that changes whenever one of the tables is written.
+
+    Lets the UI tell whether data it shows may be out of date, e.g. a page
+    kept alive while hidden. Writes by other processes count for every table.
+    """
+    return _cache.versions(*tables)
+
+# --- Write Queue ---
+
+def queue_write(func, *args, **kwargs):
+    """Queues one of the write functions below to run in the next group commit.
+
+    Writes queued within a short window (write_queue.MAX_DELAY) are committed
+    together in one transaction, instead of one transaction and fsync each.
+
+    Args:
+        func: A write function of this module, e.g. add_student.
+        *args, **kwargs: Its arguments.
+
+    Returns:
+        A concurrent.futures.Future holding func's return value (or the
+        exception it raised), resolved once the write is committed.
+    """
+    return _write_queue.submit(func, *args, **kwargs)
+
+def flush_writes(timeout=None):
+    """Commits every queued write and waits for it. Returns False on timeout."""
+    return _write_queue.flush(timeout)
+
+def close_write_queue(timeout=None):
+    """Commits every queued write and stops the queue's thread (call on exit)."""
+    _write_queue.close(timeout)
+
+def get_write_queue_stats():
+    """Returns the number of group commits and of writes committed through the queue."""
+    return {"groups": _write_queue.groups, "writes": _write_queue.writes}
+
+# --- Fee Payments ---
+
+_INSERT_FEE_PAYMENT = "INSERT INTO fee_payments (student_id, installment, amount_cents, paid_on) VALUES (?, ?, ?, ?)"
+
+def _fee_payment_rows(student_id, fees, fee_dates):
+    """Builds fee_payments parameter tuples for installments 1..len(fees).
+
+    Empty amounts mean "not paid" and produce no row.
+
+    Raises:
+        ValueError: If a non-empty amount is not a valid number, or a date is invalid.
+    """
+    payments = []
+    for installment, fee in enumerate(fees, start=1):
+        cents = to_cents(fee)
+        if cents is None:
+            continue
+        paid_on = fee_dates[installment - 1] if installment <= len(fee_dates) else None
+        payments.append((student_id, installment, cents, to_iso(paid_on)))
+    return payments
+
+def _write_fee_payments(conn, student_id, fees, fee_dates):
+    """Stores installments 1..len(fees) for a student, replacing any existing ones.
+
+    Raises:
+        ValueError: If a non-empty amount is not a valid number, or a date is invalid.
+    """
+    payments = _fee_payment_rows(student_id, fees, fee_dates)
+    conn.execute(
+        "DELETE FROM fee_payments WHERE student_id = ? AND installment BETWEEN 1 AND ?",
+        (student_id, len(fees))
+    )
+    conn.executemany(_INSERT_FEE_PAYMENT, payments)
+
+@_cache.invalidates("fee_payments")
+def add_fee_payment(student_id, installment, amount, paid_on=None):
+    """Records a single fee payment (any installment number) for a student.
+
+    Returns:
+        The id of the new fee_payments row.
+
+    Raises:
+        ValueError: If the amount is empty or not a valid number, or the date is invalid.
+    """
+    cents = to_cents(amount)
+    if cents is None:
+        raise ValueError("A fee payment needs an amount")
+    with _db.writer() as conn:
+        cursor = conn.execute(_INSERT_FEE_PAYMENT, (student_id, installment, cents, to_iso(paid_on)))
+        return cursor.lastrowid
+
+@_cache.cached("fee_payments")
+def get_student_fee_payments(student_id):
+    """Retrieves a student's fee payments as (id, installment, amount, paid_on) tuples (Money amounts)."""
+    with _db.reader() as conn:
+        rows = conn.execute("""
+            SELECT id, installment, amount_cents, paid_on
+            FROM fee_payments
+            WHERE student_id = ?
+            ORDER BY installment, id
+        """, (student_id,)).fetchall()
+    return [(row[0], row[1], Money(row[2]), row[3]) for row in rows]
 
 # --- Data Insertion ---
 
+@_cache.invalidates("students", "fee_payments")
 def add_student(name, nid, term, gender, phone1, phone2, fees, fee_dates):
-    """Adds a new student record to the students table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO students (
-            name, nid, term, gender, phone1, phone2,
-            fee1, fee2, fee3, fee4,
-            fee1_date, fee2_date, fee3_date, fee4_date
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        name, nid, term, gender, phone1, phone2,
-        fees[0], fees[1], fees[2], fees[3],
-        fee_dates[0], fee_dates[1], fee_dates[2], fee_dates[3]
-    ))
-    conn.commit()
-    conn.close()
+    """Adds a new student record and its fee payments.
+
+    Args:
+        fees: Amount of each installment, in order ("" when unpaid). More than
+            four installments are allowed.
+        fee_dates: Payment date of each installment, in the same order.
 
+    Returns:
+        The id of the new student.
+
+    Raises:
+        ValueError: If a fee amount is not a valid number (nothing is saved).
+    """
+    with _db.writer() as conn:
+        cursor = conn.execute("""
+            INSERT INTO students (name, nid, term, gender, phone1, phone2)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (name, nid, term, gender, phone1, phone2))
+        student_id = cursor.lastrowid
+        _write_fee_payments(conn, student_id, fees, fee_dates)
+    return student_id
+
+@_cache.invalidates("general_expenses")
 def add_general_expense(description, amount, date):
     """Adds a new general expense record to the general_expenses table."""
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # Attempt to convert amount to float before inserting
-        amount_float = float(amount) if amount is not None and str(amount).strip() != '' else 0.0
-        cursor.execute("""
-            INSERT INTO general_expenses (description, amount, date)
-            VALUES (?, ?, ?)
-        """, (description, amount_float, date))
-        conn.commit()
+        cents = _parse_amount(amount)
+        date = to_iso(date)
+        with _db.writer() as conn:
+            conn.execute("""
+                INSERT INTO general_expenses (description, amount_cents, date)
+                VALUES (?, ?, ?)
+            """, (description, cents, date))
     except (ValueError, TypeError) as e:
-        print(f"Error adding general expense: Invalid amount '{amount}'. Error: {e}")
-        conn.rollback()
+        print(f"Error adding general expense: Invalid amount '{amount}' or date '{date}'. Error: {e}")
     except sqlite3.Error as e:
+        # The writer context has already rolled the transaction back
         print(f"Database error adding general expense: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
 
+@_cache.invalidates("income")
 def add_income(description, amount, date):
     """Adds a new income record to the income table."""
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # Attempt to convert amount to float before inserting
-        amount_float = float(amount) if amount is not None and str(amount).strip() != '' else 0.0
-        cursor.execute("""
-            INSERT INTO income (description, amount, date)
-            VALUES (?, ?, ?)
-        """, (description, amount_float, date))
-        conn.commit()
+        cents = _parse_amount(amount)
+        date = to_iso(date)
+        with _db.writer() as conn:
+            conn.execute("""
+                INSERT INTO income (description, amount_cents, date)
+                VALUES (?, ?, ?)
+            """, (description, cents, date))
     except (ValueError, TypeError) as e:
-        print(f"Error adding income: Invalid amount '{amount}'. Error: {e}")
-        conn.rollback() # Rollback the transaction on error
+        print(f"Error adding income: Invalid amount '{amount}' or date '{date}'. Error: {e}")
     except sqlite3.Error as e:
+        # The writer context has already rolled the transaction back
         print(f"Database error adding income: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
 
+@_cache.invalidates("teachers")
 def add_teacher(name, nid, term, gender, phone1, phone2):
     """Adds a new teacher record to the teachers table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO teachers (name, nid, term, gender, phone1, phone2)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (name, nid, term, gender, phone1, phone2))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("""
+            INSERT INTO teachers (name, nid, term, gender, phone1, phone2)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (name, nid, term, gender, phone1, phone2))
 
+@_cache.invalidates("teacher_salaries")
 def add_teacher_salary(teacher_id, amount, date):
-    """Adds a new teacher salary record to the teacher_salaries table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO teacher_salaries (teacher_id, amount, date)
-        VALUES (?, ?, ?)
-    """, (teacher_id, amount, date))
-    conn.commit()
-    conn.close()
+    """Adds a new teacher salary record to the teacher_salaries table.
 
+    Raises:
+        ValueError: If the amount is not a valid number.
+    """
+    with _db.writer() as conn:
+        conn.execute("""
+            INSERT INTO teacher_salaries (teacher_id, amount_cents, date)
+            VALUES (?, ?, ?)
+        """, (teacher_id, _parse_amount(amount), to_iso(date)))
+
+@_cache.invalidates("activities")
 def add_activity(description, date):
     """Adds a new activity record to the activities table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO activities (description, activity_date)
-        VALUES (?, ?)
-    """, (description, date))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("""
+            INSERT INTO activities (description, activity_date)
+            VALUES (?, ?)
+        """, (description, to_iso(date)))
 
 def save_setting(key, value):
-    """Saves a key-value pair setting into the settings table."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    """Saves a key-value pair setting into the settings table (and the in-memory copy)."""
     try:
-        create_settings_table() # Ensure table exists
-        cursor.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
-        conn.commit()
+        _settings.set(key, value)
     except sqlite3.Error as e:
         print(f"Database error saving setting '{key}': {e}")
-        conn.rollback()
-    finally:
-        conn.close()
+
+# --- Bulk Insertion ---
+
+# Rows sent to executemany at a time by the *_bulk functions
+BULK_CHUNK_SIZE = 500
+
+def _as_args(row, fields):
+    """Returns a bulk input row (a tuple in argument order, or a dict) as a tuple."""
+    if isinstance(row, dict):
+        return tuple(row.get(field) for field in fields)
+    row = tuple(row)
+    if len(row) != len(fields):
+        raise ValueError(f"Expected {len(fields)} values ({', '.join(fields)}), got {len(row)}")
+    return row
+
+def _parse_amount(amount):
+    """Converts an amount (text, number or Money) to integer cents; empty means 0.
+
+    Raises:
+        ValueError: If the amount is not a valid number.
+    """
+    return to_cents(amount) or 0
+
+def _flush_chunk(conn, chunk, failed):
+    """Writes one chunk of prepared rows, isolating rows that the database rejects.
+
+    Each chunk item is (index, [(sql, params), ...]). The statements of the
+    whole chunk are grouped by SQL and sent through executemany inside a
+    savepoint. If that fails, the chunk is retried row by row so one bad row
+    does not cost the others.
+
+    Returns:
+        The number of rows written.
+    """
+    try:
+        with _db.writer():
+            grouped = {}
+            for _, statements in chunk:
+                for sql, params in statements:
+                    grouped.setdefault(sql, []).append(params)
+            for sql, params in grouped.items():
+                conn.executemany(sql, params)
+        return len(chunk)
+    except sqlite3.Error:
+        pass
+
+    written = 0
+    for index, statements in chunk:
+        try:
+            with _db.writer():
+                for sql, params in statements:
+                    conn.execute(sql, params)
+            written += 1
+        except sqlite3.Error as e:
+            failed.append((index, f"Database error: {e}"))
+    return written
+
+def _bulk_insert(rows, fields, prepare, chunk_size):
+    """Validates and inserts rows in chunks inside a single transaction.
+
+    Args:
+        rows: Iterable of input rows; it is consumed lazily.
+        fields: Argument names, used to read tuple or dict rows.
+        prepare: Function (conn, args) -> [(sql, params), ...]; raises
+            ValueError or TypeError for an invalid row.
+        chunk_size: Rows per executemany call.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    chunk_size = max(1, int(chunk_size))
+    inserted = 0
+    failed = []
+    with _db.writer() as conn:
+        chunk = []
+        for index, row in enumerate(rows):
+            try:
+                chunk.append((index, prepare(conn, _as_args(row, fields))))
+            except (ValueError, TypeError) as e:
+                failed.append((index, str(e)))
+                continue
+            if len(chunk) >= chunk_size:
+                inserted += _flush_chunk(conn, chunk, failed)
+                chunk = []
+        if chunk:
+            inserted += _flush_chunk(conn, chunk, failed)
+    failed.sort()
+    return {"inserted": inserted, "failed": failed}
+
+def _next_student_id(conn):
+    """Returns the next AUTOINCREMENT id for students (never reusing a deleted one)."""
+    return conn.execute("""
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'students'), 0),
+            COALESCE((SELECT MAX(id) FROM students), 0)
+        ) + 1
+    """).fetchone()[0]
+
+@_cache.invalidates("students", "fee_payments")
+def add_students_bulk(students, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many students (and their fee payments) in one transaction.
+
+    Args:
+        students: Iterable of (name, nid, term, gender, phone1, phone2, fees,
+            fee_dates) tuples, or dicts with those keys, as for add_student.
+        chunk_size: Rows per executemany call.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+        Invalid rows are skipped; the others are still saved.
+    """
+    next_id = None
+
+    def prepare(conn, args):
+        nonlocal next_id
+        name, nid, term, gender, phone1, phone2, fees, fee_dates = args
+        if next_id is None:
+            # Ids are assigned here so fee payments can be batched with their students
+            next_id = _next_student_id(conn)
+        payments = _fee_payment_rows(next_id, fees or [], fee_dates or [])
+        student_id = next_id
+        next_id += 1
+        statements = [(
+            "INSERT INTO students (id, name, nid, term, gender, phone1, phone2) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (student_id, name, nid, term, gender, phone1, phone2)
+        )]
+        statements.extend((_INSERT_FEE_PAYMENT, payment) for payment in payments)
+        return statements
+
+    fields = ("name", "nid", "term", "gender", "phone1", "phone2", "fees", "fee_dates")
+    return _bulk_insert(students, fields, prepare, chunk_size)
+
+@_cache.invalidates("teachers")
+def add_teachers_bulk(teachers, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many teachers in one transaction.
+
+    Args:
+        teachers: Iterable of (name, nid, term, gender, phone1, phone2) tuples or dicts.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    def prepare(conn, args):
+        return [("INSERT INTO teachers (name, nid, term, gender, phone1, phone2) VALUES (?, ?, ?, ?, ?, ?)", args)]
+
+    fields = ("name", "nid", "term", "gender", "phone1", "phone2")
+    return _bulk_insert(teachers, fields, prepare, chunk_size)
+
+def _ledger_bulk(table, rows, chunk_size):
+    """Shared implementation of add_income_bulk and add_expenses_bulk."""
+    sql = f"INSERT INTO {table} (description, amount_cents, date) VALUES (?, ?, ?)"
+
+    def prepare(conn, args):
+        description, amount, date = args
+        return [(sql, (description, _parse_amount(amount), to_iso(date)))]
+
+    return _bulk_insert(rows, ("description", "amount", "date"), prepare, chunk_size)
+
+@_cache.invalidates("income")
+def add_income_bulk(records, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many income records in one transaction.
+
+    Args:
+        records: Iterable of (description, amount, date) tuples or dicts.
+            Amounts are validated as in add_income.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    return _ledger_bulk("income", records, chunk_size)
+
+@_cache.invalidates("general_expenses")
+def add_expenses_bulk(records, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many general expense records in one transaction.
+
+    Args:
+        records: Iterable of (description, amount, date) tuples or dicts.
+            Amounts are validated as in add_general_expense.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    return _ledger_bulk("general_expenses", records, chunk_size)
+
+@_cache.invalidates("teacher_salaries")
+def add_teacher_salaries_bulk(salaries, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many teacher salary records in one transaction.
+
+    Args:
+        salaries: Iterable of (teacher_id, amount, date) tuples or dicts.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    def prepare(conn, args):
+        teacher_id, amount, date = args
+        return [(
+            "INSERT INTO teacher_salaries (teacher_id, amount_cents, date) VALUES (?, ?, ?)",
+            (teacher_id, _parse_amount(amount), to_iso(date))
+        )]
+
+    return _bulk_insert(salaries, ("teacher_id", "amount", "date"), prepare, chunk_size)
+
+@_cache.invalidates("activities")
+def add_activities_bulk(activities, chunk_size=BULK_CHUNK_SIZE):
+    """Adds many activities in one transaction.
+
+    Args:
+        activities: Iterable of (description, date) tuples or dicts.
+
+    Returns:
+        {"inserted": count, "failed": [(row index, error message), ...]}.
+    """
+    def prepare(conn, args):
+        description, date = args
+        return [("INSERT INTO activities (description, activity_date) VALUES (?, ?)", (description, to_iso(date)))]
+
+    return _bulk_insert(activities, ("description", "date"), prepare, chunk_size)
 
 # --- Data Retrieval ---
 
-def get_all_students():
-    """Retrieves all student records from the students table."""
-    conn = get_connection()
+# Default number of rows per page, and per batch of the iter_* generators
+PAGE_SIZE = 500
+
+_STUDENT_SELECT = """
+    SELECT s.id, s.name, s.nid, s.term, s.gender, s.phone1, s.phone2,
+           SUM(CASE WHEN p.installment = 1 THEN p.amount_cents END),
+           SUM(CASE WHEN p.installment = 2 THEN p.amount_cents END),
+           SUM(CASE WHEN p.installment = 3 THEN p.amount_cents END),
+           SUM(CASE WHEN p.installment = 4 THEN p.amount_cents END),
+           MAX(CASE WHEN p.installment = 1 THEN p.paid_on END),
+           MAX(CASE WHEN p.installment = 2 THEN p.paid_on END),
+           MAX(CASE WHEN p.installment = 3 THEN p.paid_on END),
+           MAX(CASE WHEN p.installment = 4 THEN p.paid_on END)
+    FROM students s
+    LEFT JOIN fee_payments p ON p.student_id = s.id
+"""
+
+def _fetch_records(conn, row_factory, sql, params=()):
+    """Runs a query and returns its rows as built by a backend.records row factory."""
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM students")
-    students = cursor.fetchall()
-    conn.close()
-    return [{
-        "id": s[0],
-        "name": s[1],
-        "nid": s[2],
-        "term": s[3],
-        "gender": s[4],
-        "phone1": s[5],
-        "phone2": s[6],
-        "fee1": s[7],
-        "fee2": s[8],
-        "fee3": s[9],
-        "fee4": s[10],
-        "fee1_date": s[11],
-        "fee2_date": s[12],
-        "fee3_date": s[13],
-        "fee4_date": s[14]
-    } for s in students]
+    cursor.row_factory = row_factory
+    return cursor.execute(sql, params).fetchall()
+
+def _dated_page(conn, select, date_column, cursor, limit, descending, row_factory=None):
+    """Fetches one keyset page of rows ordered by (date, id).
+
+    NULL dates sort lowest, as in SQLite. Dated and undated rows are read
+    with separate queries, because an "OR date IS NULL" condition would stop
+    SQLite from seeking in the date index.
+
+    Args:
+        select: "SELECT ... FROM table" with id as the first column.
+        cursor: (date, id) of the last row of the previous page, or None.
+        descending: Newest first when True.
+        row_factory: Optional backend.records row factory for the rows.
+    """
+    op = "<" if descending else ">"
+    order = "DESC" if descending else "ASC"
+    order_by = f" ORDER BY {date_column} {order}, id {order} LIMIT ?"
+    in_undated = cursor is not None and cursor[0] is None
+
+    if cursor is None or in_undated:
+        # Descending, the undated rows come last: past them, nothing dated is left
+        dated = None if descending and in_undated else (f"{date_column} IS NOT NULL", ())
+    else:
+        dated = (f"({date_column}, id) {op} (?, ?)", tuple(cursor))
+
+    if in_undated:
+        undated = (f"{date_column} IS NULL AND id {op} ?", (cursor[1],))
+    elif cursor is None or descending:
+        undated = (f"{date_column} IS NULL", ())
+    else:
+        # Ascending, the undated rows come first and were already returned
+        undated = None
+
+    rows = []
+    for region in ([dated, undated] if descending else [undated, dated]):
+        if region is None or len(rows) >= limit:
+            continue
+        where, params = region
+        cursor = conn.cursor()
+        cursor.row_factory = row_factory
+        rows.extend(cursor.execute(f"{select} WHERE {where}{order_by}", (*params, limit - len(rows))).fetchall())
+    return rows
+
+def _iter_pages(fetch_page, cursor_of, batch_size):
+    """Yields rows from successive pages until a short page is returned.
+
+    Each page is read with its own short-lived connection checkout, so a slow
+    consumer does not hold a database connection.
+    """
+    cursor = None
+    while True:
+        page = fetch_page(cursor, batch_size)
+        yield from page
+        if len(page) < batch_size:
+            return
+        cursor = cursor_of(page[-1])
+
+def get_students_page(after_id=0, limit=PAGE_SIZE, term=None):
+    """Retrieves up to `limit` students with an id greater than after_id, in id order.
+
+    Pass the id of the last student of one page as after_id to get the next.
+
+    Args:
+        term: Only return students of this academic term (all if None).
+
+    Returns:
+        A list of Student records, as returned by get_all_students.
+    """
+    where, params = "s.id > ?", [after_id or 0]
+    if term is not None:
+        where += " AND s.term = ?"
+        params.append(term)
+    params.append(limit)
+    with _db.reader() as conn:
+        return _fetch_records(
+            conn, student_row, f"{_STUDENT_SELECT} WHERE {where} GROUP BY s.id ORDER BY s.id LIMIT ?", params
+        )
+
+def iter_students(term=None, batch_size=PAGE_SIZE):
+    """Yields Student records in id order, reading batch_size rows at a time."""
+    return _iter_pages(
+        lambda cursor, limit: get_students_page(cursor or 0, limit, term),
+        lambda student: student.id,
+        batch_size
+    )
+
+def get_teachers_page(after_id=0, limit=PAGE_SIZE, term=None):
+    """Retrieves up to `limit` teachers with an id greater than after_id, in id order.
+
+    Args:
+        term: Only return teachers of this academic term (all if None).
+
+    Returns:
+        A list of Teacher records, as returned by get_all_teachers.
+    """
+    where, params = "id > ?", [after_id or 0]
+    if term is not None:
+        where += " AND term = ?"
+        params.append(term)
+    params.append(limit)
+    with _db.reader() as conn:
+        return _fetch_records(
+            conn, teacher_row,
+            f"SELECT id, name, nid, term, gender, phone1, phone2 FROM teachers WHERE {where} ORDER BY id LIMIT ?",
+            params
+        )
+
+def iter_teachers(term=None, batch_size=PAGE_SIZE):
+    """Yields Teacher records in id order, reading batch_size rows at a time."""
+    return _iter_pages(
+        lambda cursor, limit: get_teachers_page(cursor or 0, limit, term),
+        lambda teacher: teacher.id,
+        batch_size
+    )
+
+def get_income_page(before=None, limit=PAGE_SIZE):
+    """Retrieves up to `limit` income records, newest first.
+
+    Args:
+        before: (date, id) of the last record of the previous page, or None
+            for the first page.
+
+    Returns:
+        A list of IncomeRow (id, description, amount, date) records, like get_all_income.
+    """
+    with _db.reader() as conn:
+        return _dated_page(conn, "SELECT id, description, amount_cents, date FROM income",
+                           "date", before, limit, descending=True, row_factory=income_row)
+
+def iter_income(batch_size=PAGE_SIZE):
+    """Yields income records newest first, reading batch_size rows at a time."""
+    return _iter_pages(get_income_page, lambda row: (row.date, row.id), batch_size)
+
+def get_general_expenses_page(before=None, limit=PAGE_SIZE):
+    """Retrieves up to `limit` general expense records, newest first.
+
+    Args:
+        before: (date, id) of the last record of the previous page, or None
+            for the first page.
+
+    Returns:
+        A list of ExpenseRow (id, description, amount, date) records, like get_all_general_expenses.
+    """
+    with _db.reader() as conn:
+        return _dated_page(conn, "SELECT id, description, amount_cents, date FROM general_expenses",
+                           "date", before, limit, descending=True, row_factory=expense_row)
+
+def iter_general_expenses(batch_size=PAGE_SIZE):
+    """Yields general expense records newest first, reading batch_size rows at a time."""
+    return _iter_pages(get_general_expenses_page, lambda row: (row.date, row.id), batch_size)
+
+def get_activities_page(after=None, limit=PAGE_SIZE):
+    """Retrieves up to `limit` activities in date order (oldest first).
+
+    Args:
+        after: (activity_date, id) of the last activity of the previous page,
+            or None for the first page.
+
+    Returns:
+        A list of (id, description, activity_date) tuples, like get_all_activities.
+    """
+    with _db.reader() as conn:
+        return _dated_page(conn, "SELECT id, description, activity_date FROM activities",
+                           "activity_date", after, limit, descending=False)
+
+def iter_activities(batch_size=PAGE_SIZE):
+    """Yields activities in date order, reading batch_size rows at a time."""
+    return _iter_pages(get_activities_page, lambda row: (row[2], row[0]), batch_size)
+
+@_cache.cached("students", "fee_payments")
+def get_all_students():
+    """Retrieves all students as Student records, with installments 1-4 from the fee ledger."""
+    return list(iter_students())
+
+@_cache.cached("students", "fee_payments")
+def get_student_by_id(student_id):
+    """Retrieves one student record by id (a primary key seek).
+
+    Returns:
+        The Student record (as returned by get_all_students), or None
+        if there is no such student.
+    """
+    with _db.reader() as conn:
+        rows = _fetch_records(conn, student_row, f"{_STUDENT_SELECT} WHERE s.id = ? GROUP BY s.id", (student_id,))
+    return rows[0] if rows else None
+
+@_cache.cached("general_expenses")
+def _load_general_expenses():
+    return list(iter_general_expenses())
 
 def get_all_general_expenses():
     """Retrieves all general expense records from the general_expenses table."""
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        create_general_expenses_table()  # Ensure table exists
-        cursor.execute("SELECT id, description, amount, date FROM general_expenses ORDER BY date DESC")
-        data = cursor.fetchall()
+        data = _load_general_expenses()
     except sqlite3.Error as e:
         print(f"Database error in get_all_general_expenses: {e}")
         data = []
-    finally:
-        conn.close()
     return data
 
+@_cache.cached("income")
+def _load_income():
+    return list(iter_income())
+
 def get_all_income():
     """Retrieves all income records from the income table."""
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        create_income_table()  # Ensure table exists
-        cursor.execute("SELECT id, description, amount, date FROM income ORDER BY date DESC")
-        data = []
-        for row in cursor.fetchall():
-            try:
-                # Attempt to convert amount to float, handle errors
-                amount = float(row[2]) if row[2] is not None and str(row[2]).strip() != '' else 0.0
-                data.append((row[0], row[1], amount, row[3]))
-            except (ValueError, TypeError, IndexError) as e:
-                print(f"Error converting income amount for row {row}: {e}")
-                data.append((row[0], row[1], 0.0, row[3]))
+        data = _load_income()
     except sqlite3.Error as e:
         print(f"Database error in get_all_income: {e}")
         data = []
-    finally:
-        conn.close()
     return data
 
+@_cache.cached("teachers")
 def get_all_teachers():
-    """Retrieves all teacher records from the teachers table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM teachers")
-    teachers = cursor.fetchall()
-    conn.close()
-    return [{
-        "id": t[0],
-        "name": t[1],
-        "nid": t[2],
-        "term": t[3],
-        "gender": t[4],
-        "phone1": t[5],
-        "phone2": t[6]
-    } for t in teachers]
+    """Retrieves all teachers as Teacher records."""
+    return list(iter_teachers())
+
+# --- Search ---
+
+# Characters that separate words in the search index (unicode61 tokenizer)
+_WORD_SEPARATORS = re.compile(r"[\W_]+")
+
+def _escape_like(text):
+    """Escapes LIKE wildcards so the text matches literally (ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def search_words(text):
+    """Returns the words of text as the search index sees them (folded with fold_arabic)."""
+    return [word for word in _WORD_SEPARATORS.split(fold_arabic(text)) if word]
+
+def matches_search_words(text, words):
+    """Checks text against query words the way the name filter of search_people does.
+
+    Lets a caller narrow results it already holds without a query.
+
+    Args:
+        text: The text to check, e.g. a name.
+        words: Query words from search_words.
+
+    Returns:
+        True if every query word is the start of a word of text.
+    """
+    text_words = search_words(text)
+    return all(any(word.startswith(query_word) for word in text_words) for query_word in words)
+
+def _fts_prefix_query(text):
+    """Builds an FTS5 query matching rows that have a word starting with each query word.
+
+    Returns None when the text contains no words.
+    """
+    words = search_words(text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+@_cache.cached("students", "teachers", "income", "general_expenses", "activities")
+def search_text(query, kinds=None, limit=PAGE_SIZE):
+    """Full-text prefix search over names and descriptions.
+
+    The query and the indexed text are both folded with fold_arabic, so
+    diacritics and alef/hamza, taa marbuta and alef maqsura variants do not
+    matter. Every query word must match the start of a word in the text.
+
+    Args:
+        query: Words to search for, e.g. "احمد مح".
+        kinds: Iterable of sources to search ("students", "teachers",
+            "income", "general_expenses", "activities"); all if None.
+        limit: Maximum number of hits.
+
+    Returns:
+        A list of (kind, id) tuples in index order (by id, then kind).
+        Ranking the hits (ORDER BY rank) would score every match before
+        the limit applies, tens of milliseconds for a short prefix on a
+        large roster.
 
+    Raises:
+        ValueError: If an unknown kind is given.
+    """
+    match = _fts_prefix_query(query)
+    if match is None:
+        return []
+    kinds = list(kinds or SEARCH_KINDS)
+    unknown = [kind for kind in kinds if kind not in SEARCH_KINDS]
+    if unknown:
+        raise ValueError(f"Unknown search kind(s): {unknown}")
+    kind_names = {number: name for name, number in SEARCH_KINDS.items()}
+    numbers = [SEARCH_KINDS[kind] for kind in kinds]
+    placeholders = ", ".join("?" for _ in numbers)
+    with _db.reader() as conn:
+        rows = conn.execute(f"""
+            SELECT rowid FROM search_index
+            WHERE search_index MATCH ? AND rowid % {SEARCH_ROWID_FACTOR} IN ({placeholders})
+            ORDER BY rowid
+            LIMIT ?
+        """, (match, *numbers, limit)).fetchall()
+    return [(kind_names[rowid % SEARCH_ROWID_FACTOR], rowid // SEARCH_ROWID_FACTOR) for (rowid,) in rows]
+
+@_cache.cached("students", "teachers", "fee_payments")
+def search_people(kind, name_query="", term=None, limit=PAGE_SIZE, offset=0):
+    """Searches students or teachers by name and academic term in SQL.
+
+    Args:
+        kind: "students" or "teachers".
+        name_query: Words the name must contain; each one matches the start
+            of a word, ignoring Arabic spelling variants (see search_text).
+            Empty matches all. This replaced the former substring match:
+            "احمد" finds "أحمد علي" and "محمد احمدي", but "حمد" no longer
+            finds "أحمد" (it does not start a word). Only a query without
+            searchable words (punctuation) is still matched as a substring.
+        term: Academic term to match exactly, or None for all terms.
+        limit: Maximum number of rows to return.
+        offset: Number of matching rows to skip (for paging), in id order.
+
+    Returns:
+        (rows, total): the requested page of Student or Teacher records
+        (as returned by get_all_students / get_all_teachers) and the number
+        of matching rows in total.
+
+    Raises:
+        ValueError: If kind is not "students" or "teachers".
+    """
+    if kind not in ("students", "teachers"):
+        raise ValueError(f"Unknown search kind: '{kind}'")
+
+    def where(alias=""):
+        conditions, params = [], []
+        query = (name_query or "").strip()
+        match = _fts_prefix_query(query)
+        if match is not None:
+            conditions.append(f"""{alias}id IN (
+                SELECT rowid / {SEARCH_ROWID_FACTOR} FROM search_index
+                WHERE search_index MATCH ? AND rowid % {SEARCH_ROWID_FACTOR} = {SEARCH_KINDS[kind]}
+            )""")
+            params.append(match)
+        elif query:
+            # No searchable words (only punctuation): fall back to a substring match
+            conditions.append(f"{alias}name LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(query)}%")
+        if term is not None:
+            # Seeks in the (term, id) index
+            conditions.append(f"{alias}term = ?")
+            params.append(term)
+        return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+    match = _fts_prefix_query((name_query or "").strip())
+    with _db.read_transaction() as conn:
+        if match is not None and term is None:
+            # Name filter only: count and page the index entries themselves
+            # (rowid order is id order) instead of collecting every matching id
+            hits = (f"FROM search_index WHERE search_index MATCH ? "
+                    f"AND rowid % {SEARCH_ROWID_FACTOR} = {SEARCH_KINDS[kind]}")
+            total = conn.execute(f"SELECT COUNT(*) {hits}", (match,)).fetchone()[0]
+            page_ids = f"id IN (SELECT rowid / {SEARCH_ROWID_FACTOR} {hits} ORDER BY rowid LIMIT ? OFFSET ?)"
+            count_where, student_where = f" WHERE {page_ids}", f" WHERE s.{page_ids}"
+            params, offset = [match, limit, offset], 0
+        else:
+            count_where, params = where()
+            total = conn.execute(f"SELECT COUNT(*) FROM {kind}{count_where}", params).fetchone()[0]
+            student_where, _ = where("s.")
+        if kind == "students":
+            rows = _fetch_records(
+                conn, student_row,
+                f"{_STUDENT_SELECT}{student_where} GROUP BY s.id ORDER BY s.id LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            )
+            return rows, total
+        rows = _fetch_records(
+            conn, teacher_row,
+            f"SELECT id, name, nid, term, gender, phone1, phone2 FROM teachers{count_where} ORDER BY id LIMIT ? OFFSET ?",
+            (*params, limit, offset)
+        )
+        return rows, total
+
+@_cache.cached("teacher_salaries")
 def get_teacher_salaries(teacher_id):
-    """Retrieves salary records for a specific teacher."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, amount, date FROM teacher_salaries WHERE teacher_id = ? ORDER BY date DESC", (teacher_id,))
-    data = cursor.fetchall()
-    conn.close()
-    return data
+    """Retrieves salary records for a specific teacher, as SalaryRow (id, amount, date) records."""
+    with _db.reader() as conn:
+        return _fetch_records(
+            conn, salary_row,
+            "SELECT id, amount_cents, date FROM teacher_salaries WHERE teacher_id = ? ORDER BY date DESC",
+            (teacher_id,)
+        )
 
+@_cache.cached("activities")
 def get_all_activities():
     """Retrieves all activity records from the activities table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, description, activity_date FROM activities ORDER BY activity_date ASC")
-    data = cursor.fetchall()
-    conn.close()
-    return data
+    return list(iter_activities())
 
-def get_students_by_term():
-    """Gets the count of students and total fees per academic term."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT term FROM students")
-    terms = [term[0] for term in cursor.fetchall() if term[0] is not None and str(term[0]).strip() != ''] # Filter out None or empty terms
-    result = {}
-    for term in terms:
-        # Student count for this term
-        cursor.execute("SELECT COUNT(*) FROM students WHERE term = ?", (term,))
-        student_count = cursor.fetchone()[0] or 0
-        # Total fees for this term
-        cursor.execute("SELECT fee1, fee2, fee3, fee4 FROM students WHERE term = ?", (term,))
-        fees_data = cursor.fetchall()
-        total_fees = 0
-        for fees in fees_data:
-            for fee in fees:
-                try:
-                    if fee is not None and str(fee).strip() != '':
-                        total_fees += float(fee)
-                except (ValueError, TypeError):
-                    # Handle cases where fee value is not a valid number
-                    print(f"Error converting fee value '{fee}' to float for term {term}")
-                    pass # Skip invalid fee values
-        result[term] = {
-            "student_count": student_count,
-            "total_fees": total_fees
-        }
-    conn.close()
-    return result
+# --- Date Range Queries ---
 
-def get_teachers_statistics():
-    """Gets overall teacher statistics (count and total salaries)."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    # Teacher count
-    cursor.execute("SELECT COUNT(*) FROM teachers")
-    teacher_count = cursor.fetchone()[0] or 0
-    # Total salaries
-    cursor.execute("SELECT SUM(amount) FROM teacher_salaries")
-    total_salaries = cursor.fetchone()[0] or 0
-    conn.close()
+def _date_bounds(start, end):
+    """Converts inclusive start/end dates (any accepted format) to ISO strings.
+
+    Raises:
+        ValueError: If either date is missing or invalid.
+    """
+    start_iso, end_iso = to_iso(start), to_iso(end)
+    if start_iso is None or end_iso is None:
+        raise ValueError("Both a start and an end date are required")
+    return start_iso, end_iso
+
+@_cache.cached("income")
+def get_income_between(start, end):
+    """Retrieves income records dated from start to end (inclusive), newest first.
+
+    Returns:
+        A list of IncomeRow (id, description, amount, date) records, like get_all_income.
+    """
+    start_iso, end_iso = _date_bounds(start, end)
+    with _db.reader() as conn:
+        return _fetch_records(conn, income_row, """
+            SELECT id, description, amount_cents, date FROM income
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date DESC
+        """, (start_iso, end_iso))
+
+@_cache.cached("general_expenses")
+def get_expenses_between(start, end):
+    """Retrieves general expense records dated from start to end (inclusive), newest first.
+
+    Returns:
+        A list of ExpenseRow (id, description, amount, date) records, like get_all_general_expenses.
+    """
+    start_iso, end_iso = _date_bounds(start, end)
+    with _db.reader() as conn:
+        return _fetch_records(conn, expense_row, """
+            SELECT id, description, amount_cents, date FROM general_expenses
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date DESC
+        """, (start_iso, end_iso))
+
+@_cache.cached("teacher_salaries")
+def get_salaries_between(start, end, teacher_id=None):
+    """Retrieves salary records dated from start to end (inclusive), newest first.
+
+    Args:
+        teacher_id: Only return this teacher's salaries (all teachers if None).
+
+    Returns:
+        A list of TeacherSalaryRow (id, teacher_id, amount, date) records.
+    """
+    start_iso, end_iso = _date_bounds(start, end)
+    with _db.reader() as conn:
+        if teacher_id is None:
+            return _fetch_records(conn, teacher_salary_row, """
+                SELECT id, teacher_id, amount_cents, date FROM teacher_salaries
+                WHERE date BETWEEN ? AND ?
+                ORDER BY date DESC
+            """, (start_iso, end_iso))
+        return _fetch_records(conn, teacher_salary_row, """
+            SELECT id, teacher_id, amount_cents, date FROM teacher_salaries
+            WHERE teacher_id = ? AND date BETWEEN ? AND ?
+            ORDER BY date DESC
+        """, (teacher_id, start_iso, end_iso))
+
+@_cache.cached("fee_payments")
+def get_total_student_fees():
+    """Calculates the total amount of all recorded student fee payments, as Money."""
+    with _db.reader() as conn:
+        return Money(_query_totals(conn)[0])
+
+@_cache.cached("teacher_salaries")
+def get_total_teacher_salaries():
+    """Calculates the total amount of all teacher salaries, as Money."""
+    with _db.reader() as conn:
+        return Money(_query_totals(conn)[3])
+
+@_cache.cached("students", "teachers")
+def get_people_counts():
+    """Returns the number of registered students and teachers."""
+    with _db.reader() as conn:
+        students_count = conn.execute("SELECT COUNT(*) FROM students").fetchone()[0] or 0
+        teachers_count = conn.execute("SELECT COUNT(*) FROM teachers").fetchone()[0] or 0
     return {
-        "teacher_count": teacher_count,
-        "total_salaries": total_salaries
+        "students": students_count,
+        "teachers": teachers_count
     }
 
-def get_total_teacher_salaries():
-    """Calculates the total amount of all teacher salaries."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT SUM(amount) FROM teacher_salaries")
-    total = cursor.fetchone()[0]
-    conn.close()
-    return total or 0
+def get_settings_store():
+    """Returns the SettingsStore behind get_setting/save_setting (typed getters, observers)."""
+    return _settings
 
 def get_setting(key):
-    """Retrieves the value for a given setting key from the settings table."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    """Retrieves the value for a given setting key (from memory after the first read)."""
     try:
-        create_settings_table() # Ensure table exists
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        result = cursor.fetchone()
-        return result[0] if result else None
+        return _settings.get(key)
     except sqlite3.Error as e:
         print(f"Database error getting setting '{key}': {e}")
         return None
-    finally:
-        conn.close()
 
 # --- Statistical Summaries ---
 
-def get_summary():
-    """Calculates a financial summary including total income, expenses, and remaining balance."""
-    # Calculate income from student fees
-    students = get_all_students()
-    student_fees = 0
-    for s in students:
-        # s is a dictionary from get_all_students
-        for i in range(1, 5): # Iterate through fees 1 to 4
-            fee_key = f"fee{i}"
-            try:
-                fee_value = s.get(fee_key) # Use .get() for safety
-                if fee_value is not None and str(fee_value).strip() != '':
-                     student_fees += float(fee_value)
-            except (ValueError, TypeError):
-                # Handle cases where fee value is not a valid number
-                pass # Skip invalid fee values
-
-    # Calculate income from the income table
-    try:
-        income_data = get_all_income()
-        # Ensure income_entries is calculated from the correct amount column (index 2)
-        income_entries = sum(float(inc[2]) for inc in income_data if inc and len(inc) > 2 and inc[2] is not None and str(inc[2]).strip()) if income_data else 0
-    except Exception as e:
-        print(f"Error calculating income from Income table: {e}")
-        income_entries = 0
+# The totals below are read from the rollup tables that migration 6 keeps
+# current with triggers, so each summary is a single-row (or per-term) read
+# however many payments, income entries and salaries are stored.
 
-    # Total income
-    total_income = student_fees + income_entries
+_TOTALS_QUERY = """
+    SELECT fee_cents, income_cents, expense_cents, salary_cents
+    FROM financial_totals
+    WHERE id = 1
+"""
 
-    # Calculate general expenses
-    try:
-        # Ensure table exists
-        create_general_expenses_table()
-        expenses_data = get_all_general_expenses()
-        expenses = sum(float(exp[2]) for exp in expenses_data) if expenses_data else 0
-    except Exception as e:
-        print(f"Error calculating general expenses: {e}")
-        expenses = 0
-
-    # Calculate teacher salaries
-    try:
-        teacher_salaries = get_total_teacher_salaries() or 0
-    except Exception as e:
-        print(f"Error calculating teacher salaries: {e}")
-        teacher_salaries = 0
+_TERMS_QUERY = """
+    SELECT term, student_count, fee_cents
+    FROM term_totals
+    WHERE TRIM(term) != '' AND student_count > 0
+"""
+
+_MONTHS_QUERY = """
+    SELECT month, fee_cents, income_cents, expense_cents, salary_cents
+    FROM monthly_totals
+    WHERE month >= ? AND month <= ? AND month != ''
+    ORDER BY month
+"""
+
+def _query_totals(conn):
+    """Returns the totals row in cents (fees, income, expenses, salaries)."""
+    return conn.execute(_TOTALS_QUERY).fetchone() or (0, 0, 0, 0)
+
+def _summary_from_totals(totals):
+    """Builds the get_summary() dictionary (Money amounts) from a totals row.
+
+    The totals are added and subtracted in cents, so the remaining balance
+    is exact.
+    """
+    fee_cents, income_cents, expense_cents, salary_cents = totals
+    income_total = fee_cents + income_cents
+    expense_total = expense_cents + salary_cents
+    return {
+        "income": Money(income_total),
+        "expenses": Money(expense_total),
+        "remaining": Money(income_total - expense_total),
+        "teacher_salaries": Money(salary_cents)
+    }
 
-    # Total expenses
-    total_expenses = expenses + teacher_salaries
+def _query_teachers(conn, totals):
+    """Builds the get_teachers_statistics() dictionary from a totals row."""
+    return {
+        "teacher_count": conn.execute("SELECT COUNT(*) FROM teachers").fetchone()[0],
+        "total_salaries": Money(totals[3])
+    }
 
+def _query_students_by_term(conn):
+    """Returns {term: {"student_count", "total_fees"}} from the per-term rollup."""
     return {
-        "income": total_income,
-        "expenses": total_expenses,
-        "remaining": total_income - total_expenses,
-        "teacher_salaries": teacher_salaries
+        term: {
+            "student_count": student_count,
+            "total_fees": Money(total_cents)
+        }
+        for term, student_count, total_cents in conn.execute(_TERMS_QUERY).fetchall()
     }
 
+@_cache.cached("students", "fee_payments")
+def get_students_by_term():
+    """Gets the count of students and total fees per academic term."""
+    with _db.reader() as conn:
+        return _query_students_by_term(conn)
+
+@_cache.cached("teachers", "teacher_salaries")
+def get_teachers_statistics():
+    """Gets overall teacher statistics (count and total salaries)."""
+    with _db.read_transaction() as conn:
+        return _query_teachers(conn, _query_totals(conn))
+
+@_cache.cached("fee_payments", "income", "general_expenses", "teacher_salaries")
+def _load_summary():
+    with _db.reader() as conn:
+        return _summary_from_totals(_query_totals(conn))
+
+def get_summary():
+    """Calculates a financial summary including total income, expenses, and remaining balance."""
+    try:
+        return _load_summary()
+    except sqlite3.Error as e:
+        print(f"Database error calculating summary: {e}")
+        return _summary_from_totals((0, 0, 0, 0))
+
+@_cache.cached("fee_payments", "income", "general_expenses", "teacher_salaries")
+def get_monthly_totals(start=None, end=None):
+    """Gets fee, income, expense and salary totals per month.
+
+    Args:
+        start: First month to include, as "YYYY-MM" (None for no lower bound).
+        end: Last month to include, as "YYYY-MM" (None for no upper bound).
+
+    Returns:
+        A list of (month, fees, income, expenses, salaries) tuples in month
+        order, with Money amounts. Rows without a date are not included.
+    """
+    with _db.reader() as conn:
+        rows = conn.execute(_MONTHS_QUERY, (start or "", end or "9999-99")).fetchall()
+    return [(month, *(Money(cents) for cents in figures)) for month, *figures in rows]
+
+@_cache.cached("students", "teachers", "fee_payments", "income", "general_expenses", "teacher_salaries")
 def get_detailed_statistics():
-    """Gets detailed statistics including student stats by term, teacher stats, and overall financial summary."""
-    # Student stats by term
-    students_stats = get_students_by_term()
-    # Teacher stats
-    teachers_stats = get_teachers_statistics()
-    # Overall summary
-    summary = get_summary()
+    """Gets detailed statistics including student stats by term, teacher stats, and overall financial summary.
+
+    Both queries run in one read transaction, so the figures are consistent
+    with each other even while other threads are writing.
+    """
+    with _db.read_transaction() as conn:
+        students_stats = _query_students_by_term(conn)
+        totals = _query_totals(conn)
+        teachers = _query_teachers(conn, totals)
     return {
         "students_by_term": students_stats,
-        "teachers": teachers_stats,
-        "summary": summary
+        "teachers": teachers,
+        "summary": _summary_from_totals(totals)
     }
 
+# --- Rollup Maintenance ---
+
+@_cache.invalidates("fee_payments", "income", "general_expenses", "teacher_salaries")
+def rebuild_totals():
+    """Recomputes the financial_totals, term_totals and monthly_totals tables.
+
+    Repair command for when the rollups disagree with the source tables
+    (see check_totals), e.g. after rows were edited outside the application
+    with the triggers dropped.
+    """
+    with _db.writer() as conn:
+        rebuild_rollups(conn)
+
+def check_totals():
+    """Compares the stored rollups with a full recompute from the source tables.
+
+    Returns:
+        A list of (table, key, stored, computed) tuples, one per row that
+        differs; empty when the rollups are consistent. Amounts are in cents.
+    """
+    with _db.read_transaction() as conn:
+        stored = read_rollups(conn)
+        computed = compute_rollups(conn)
+    mismatches = []
+    for table, expected in computed.items():
+        actual = stored[table]
+        for key in sorted(set(actual) | set(expected)):
+            if actual.get(key) != expected.get(key):
+                mismatches.append((table, key, actual.get(key), expected.get(key)))
+    return mismatches
+
 # --- Data Update ---
 
+@_cache.invalidates("students", "fee_payments")
+def update_student_by_id(student_id, name, nid, term, gender, phone1, phone2, fees, fee_dates):
+    """Updates a student record and its fee installments by student ID.
+
+    Installments 1..len(fees) in the fee ledger are replaced by the given
+    values; later installments recorded with add_fee_payment are kept.
+
+    Raises:
+        ValueError: If a fee amount is not a valid number (nothing is saved).
+    """
+    with _db.writer() as conn:
+        cursor = conn.execute("""
+            UPDATE students
+            SET name=?, nid=?, term=?, gender=?, phone1=?, phone2=?
+            WHERE id=?
+        """, (name, nid, term, gender, phone1, phone2, student_id))
+        if cursor.rowcount:
+            _write_fee_payments(conn, student_id, fees, fee_dates)
+
+@_cache.invalidates("students", "fee_payments")
 def update_student(original_name, name, nid, term, gender, phone1, phone2, fees, fee_dates):
-    """Updates an existing student record based on the original name."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE students
-        SET name=?, nid=?, term=?, gender=?, phone1=?, phone2=?, fee1=?, fee2=?, fee3=?, fee4=?, fee1_date=?, fee2_date=?, fee3_date=?, fee4_date=?
-        WHERE name=?
-    """, (name, nid, term, gender, phone1, phone2, fees[0], fees[1], fees[2], fees[3], fee_dates[0], fee_dates[1], fee_dates[2], fee_dates[3], original_name))
-    conn.commit()
-    conn.close()
+    """Updates an existing student record based on the original name.
+
+    Every student with that name is updated; use update_student_by_id to
+    update a single student.
+
+    Installments 1..len(fees) in the fee ledger are replaced by the given
+    values; later installments recorded with add_fee_payment are kept.
+
+    Raises:
+        ValueError: If a fee amount is not a valid number (nothing is saved).
+    """
+    with _db.writer() as conn:
+        student_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM students WHERE name=?", (original_name,)
+        ).fetchall()]
+        conn.execute("""
+            UPDATE students
+            SET name=?, nid=?, term=?, gender=?, phone1=?, phone2=?
+            WHERE name=?
+        """, (name, nid, term, gender, phone1, phone2, original_name))
+        for student_id in student_ids:
+            _write_fee_payments(conn, student_id, fees, fee_dates)
 
+@_cache.invalidates("general_expenses")
 def update_expense(expense_id, new_desc, new_amount, new_date):
-    """Updates an existing general expense record."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE general_expenses
-        SET description=?, amount=?, date=?
-        WHERE id=?
-    """, (new_desc, new_amount, new_date, expense_id))
-    conn.commit()
-    conn.close()
+    """Updates an existing general expense record.
+
+    Raises:
+        ValueError: If the amount is not a valid number.
+    """
+    with _db.writer() as conn:
+        conn.execute("""
+            UPDATE general_expenses
+            SET description=?, amount_cents=?, date=?
+            WHERE id=?
+        """, (new_desc, _parse_amount(new_amount), to_iso(new_date), expense_id))
 
+@_cache.invalidates("income")
 def update_income(income_id, new_desc, new_amount, new_date):
-    """Updates an existing income record."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE income
-        SET description=?, amount=?, date=?
-        WHERE id=?
-    """, (new_desc, new_amount, new_date, income_id))
-    conn.commit()
-    conn.close()
-
-def update_teacher_salary(salary_id: int, new_amount: float, new_date: str):
-    """Updates a teacher's salary record."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE teacher_salaries
-        SET amount = ?, date = ?
-        WHERE id = ?
-    """, (new_amount, new_date, salary_id))
-    conn.commit()
-    conn.close()
+    """Updates an existing income record.
 
+    Raises:
+        ValueError: If the amount is not a valid number.
+    """
+    with _db.writer() as conn:
+        conn.execute("""
+            UPDATE income
+            SET description=?, amount_cents=?, date=?
+            WHERE id=?
+        """, (new_desc, _parse_amount(new_amount), to_iso(new_date), income_id))
+
+@_cache.invalidates("teacher_salaries")
+def update_teacher_salary(salary_id: int, new_amount, new_date: str):
+    """Updates a teacher's salary record.
+
+    Raises:
+        ValueError: If the amount is not a valid number.
+    """
+    with _db.writer() as conn:
+        conn.execute("""
+            UPDATE teacher_salaries
+            SET amount_cents = ?, date = ?
+            WHERE id = ?
+        """, (_parse_amount(new_amount), to_iso(new_date), salary_id))
+
+@_cache.invalidates("activities")
 def update_activity(activity_id, new_desc, new_date):
     """Updates an existing activity record."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE activities
-        SET description=?, activity_date=?
-        WHERE id=?
-    """, (new_desc, new_date, activity_id))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("""
+            UPDATE activities
+            SET description=?, activity_date=?
+            WHERE id=?
+        """, (new_desc, to_iso(new_date), activity_id))
 
+@_cache.invalidates("teachers")
 def update_teacher_by_id(teacher_id, name, nid, term, gender, phone1, phone2):
     """Updates teacher details by teacher ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE teachers
-        SET name=?, nid=?, term=?, gender=?, phone1=?, phone2=?
-        WHERE id=?
-    """, (name, nid, term, gender, phone1, phone2, teacher_id))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("""
+            UPDATE teachers
+            SET name=?, nid=?, term=?, gender=?, phone1=?, phone2=?
+            WHERE id=?
+        """, (name, nid, term, gender, phone1, phone2, teacher_id))
 
 # --- Data Deletion ---
 
+@_cache.invalidates("students", "fee_payments")
 def delete_student_by_name(name: str):
-    """Deletes a student record based on the name."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM students WHERE name = ?", (name,))
-    conn.commit()
-    conn.close()
+    """Deletes every student record with the given name (see delete_student_by_id)."""
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM students WHERE name = ?", (name,))
 
+@_cache.invalidates("students", "fee_payments")
+def delete_student_by_id(student_id):
+    """Deletes a student record (and its fee payments) by its ID."""
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM students WHERE id = ?", (student_id,))
+
+@_cache.invalidates("general_expenses")
 def delete_expense(expense_id):
     """Deletes a general expense record by its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM general_expenses WHERE id = ?", (expense_id,))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM general_expenses WHERE id = ?", (expense_id,))
 
+@_cache.invalidates("income")
 def delete_income(income_id):
     """Deletes an income record by its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM income WHERE id = ?", (income_id,))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM income WHERE id = ?", (income_id,))
 
+@_cache.invalidates("activities")
 def delete_activity(activity_id):
     """Deletes an activity record by its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM activities WHERE id = ?", (activity_id,))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM activities WHERE id = ?", (activity_id,))
 
+@_cache.invalidates("teachers")
 def delete_teacher_by_name(name: str):
     """Deletes a teacher record based on the name."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM teachers WHERE name = ?", (name,))
-    conn.commit()
-    conn.close()
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM teachers WHERE name = ?", (name,))
 
+@_cache.invalidates("teachers")
 def delete_teacher_by_id(teacher_id):
     """Deletes a teacher record by its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM teachers WHERE id = ?", (teacher_id,))
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    with _db.writer() as conn:
+        conn.execute("DELETE FROM teachers WHERE id = ?", (teacher_id,))
@@ -0,0 +1,81 @@
+"""
+Date parsing and formatting shared by every function that stores a date.
+
+Dates are stored as ISO-8601 text ("YYYY-MM-DD"), which sorts correctly as a
+string, so ORDER BY and range filters on the date columns can use their
+indexes. The UI shows and accepts "DD-MM-YYYY"; older rows also contain
+"DD/MM/YYYY" and "DDMMYYYY", which parse_date understands as well.
+"""
+import re
+from datetime import date, datetime
+from typing import Optional
+
+# Storage format
+ISO_FORMAT = "%Y-%m-%d"
+# Format shown in (and typed into) the UI
+DISPLAY_FORMAT = "%d-%m-%Y"
+
+_ISO_DATE = re.compile(r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:[ T].*)?$")
+_DAY_FIRST_DATE = re.compile(r"^(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})$")
+_DIGITS_DATE = re.compile(r"^(\d{2})(\d{2})(\d{4})$")
+
+def parse_date(value) -> Optional[date]:
+    """Parses a date in any of the formats used by the application.
+
+    Args:
+        value: A date/datetime, or a string such as "2024-05-01",
+            "2024-05-01 10:30", "01-05-2024", "1/5/2024" or "01052024".
+
+    Returns:
+        The date, or None when the value is empty (including "//" from
+        blank day/month/year fields).
+
+    Raises:
+        ValueError: If the value is not empty and is not a valid date.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    text = str(value).strip()
+    if not text.strip("/-. "):
+        return None
+
+    match = _ISO_DATE.match(text)
+    if match:
+        year, month, day = match.groups()
+    else:
+        match = _DAY_FIRST_DATE.match(text) or _DIGITS_DATE.match(text)
+        if not match:
+            raise ValueError(f"Invalid date: '{value}'")
+        day, month, year = match.groups()
+    # date() raises ValueError for impossible dates such as 31-02-2024
+    return date(int(year), int(month), int(day))
+
+def to_iso(value) -> Optional[str]:
+    """Returns the value as an ISO "YYYY-MM-DD" string for storage (None if empty).
+
+    Raises:
+        ValueError: If the value is not empty and is not a valid date.
+    """
+    parsed = parse_date(value)
+    return parsed.strftime(ISO_FORMAT) if parsed else None
+
+def to_display(value) -> str:
+    """Formats a stored date as "DD-MM-YYYY" for the UI.
+
+    Values that cannot be parsed are returned unchanged, so nothing is hidden
+    from the user; empty values become "".
+    """
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        return str(value)
+    return parsed.strftime(DISPLAY_FORMAT) if parsed else ""
+
+def today_iso() -> str:
+    """Returns today's date in storage format."""
+    return date.today().strftime(ISO_FORMAT)
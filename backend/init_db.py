@@ -1,25 +1,34 @@
+# Import the migration runner and the shared connection manager
+import threading
+import weakref
 
-# Import necessary table creation functions from the database module
-from .database import (
-    create_students_table,
-    create_general_expenses_table,
-    create_teachers_table,
-    create_teacher_salaries_table,
-    create_income_table,
-    create_activities_table,
-    create_settings_table
-)
+from .database import get_connection_manager, index_queued_search_rows
+from .migrations import migrate
+
+# Connection managers whose schema has been brought up to date in this process.
+# The query functions no longer create their tables on every call, so the
+# schema is checked once, at startup, and again only for a new database path.
+_bootstrapped = weakref.WeakSet()
+_bootstrap_lock = threading.Lock()
 
 def init_database():
-    """Initializes all required database tables for the application."""
-    # Create all necessary tables
-    create_students_table()
-    create_general_expenses_table()
-    create_teachers_table()
-    create_teacher_salaries_table()
-    create_income_table()
-    create_activities_table()
-    create_settings_table()
+    """Initializes the database schema for the application.
+
+    Applies any pending versioned migrations (tables, indexes, ...) in one
+    writer transaction, then indexes rows other programs added to the
+    searched tables. When the stored schema version is already current and
+    nothing is queued, this performs two small reads and no writes. Later
+    calls for the same database return right away.
 
-    # Optional: Print a success message (can be removed in production)
-    # print("Database initialized successfully")
\ No newline at end of file
+    Returns:
+        The list of migration versions applied during this call.
+    """
+    manager = get_connection_manager()
+    with _bootstrap_lock:
+        if manager in _bootstrapped:
+            return []
+        applied = migrate(manager)
+        # Rows written by other SQLite tools while the application was closed
+        index_queued_search_rows()
+        _bootstrapped.add(manager)
+    return applied
@@ -0,0 +1,720 @@
+"""
+Versioned schema migrations for the students.db database.
+
+Each migration has a version number, a short description and a function that
+receives the writer connection. Pending migrations are applied in order inside
+a single transaction, and every applied version is recorded in the
+schema_version table. When the recorded version is already current, startup
+runs no DDL at all.
+
+To change the schema, append a new migration to MIGRATIONS; never edit one
+that has already shipped.
+"""
+import sqlite3
+from datetime import datetime
+
+from .arabic import fold_arabic
+from .dates import to_iso
+from .money import to_cents
+
+# --- Migration Steps ---
+
+def _run_statements(*statements):
+    """Builds a migration step that executes the given SQL statements in order."""
+    def step(conn):
+        for statement in statements:
+            conn.execute(statement)
+    return step
+
+# Legacy amounts that are not numbers cannot be stored as integer cents.
+# Migrations that convert amounts keep such values here, verbatim, instead of
+# dropping them, so they can still be looked up and entered again by hand.
+_create_unparsed_amounts_table = _run_statements("""
+    CREATE TABLE IF NOT EXISTS unparsed_amounts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source_table TEXT NOT NULL,
+        source_id INTEGER NOT NULL,
+        source_column TEXT NOT NULL,
+        raw_value TEXT,
+        value_date TEXT,
+        migration INTEGER NOT NULL
+    )
+""")
+
+def _keep_unparsed_amount(conn, migration, table, row_id, column, value, value_date=None):
+    """Saves an amount that could not be converted in unparsed_amounts and reports it."""
+    _create_unparsed_amounts_table(conn)
+    conn.execute(
+        """INSERT INTO unparsed_amounts
+           (source_table, source_id, source_column, raw_value, value_date, migration)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        (table, row_id, column, None if value is None else str(value), value_date, migration)
+    )
+    print(f"Invalid amount '{value}' in {table} row {row_id} ({column}) kept in unparsed_amounts")
+
+# Version 1: the original tables (IF NOT EXISTS, so existing databases adopt it)
+_create_base_tables = _run_statements(
+    """
+    CREATE TABLE IF NOT EXISTS students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        nid TEXT,
+        term TEXT,
+        gender TEXT,
+        phone1 TEXT,
+        phone2 TEXT,
+        fee1 TEXT,
+        fee2 TEXT,
+        fee3 TEXT,
+        fee4 TEXT,
+        fee1_date TEXT,
+        fee2_date TEXT,
+        fee3_date TEXT,
+        fee4_date TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS general_expenses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT,
+        amount REAL,
+        date TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS teachers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        nid TEXT,
+        term TEXT,
+        gender TEXT,
+        phone1 TEXT,
+        phone2 TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS teacher_salaries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        teacher_id INTEGER,
+        amount REAL,
+        date TEXT,
+        FOREIGN KEY (teacher_id) REFERENCES teachers(id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS income (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT,
+        amount REAL,
+        date TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS activities (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT,
+        activity_date TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """
+)
+
+# Version 2: secondary indexes for the lookups and ORDER BY clauses in database.py
+_create_hot_path_indexes = _run_statements(
+    "CREATE INDEX IF NOT EXISTS idx_students_name ON students(name)",
+    "CREATE INDEX IF NOT EXISTS idx_students_term ON students(term)",
+    "CREATE INDEX IF NOT EXISTS idx_teacher_salaries_teacher_date ON teacher_salaries(teacher_id, date)",
+    "CREATE INDEX IF NOT EXISTS idx_income_date ON income(date)",
+    "CREATE INDEX IF NOT EXISTS idx_general_expenses_date ON general_expenses(date)",
+    "CREATE INDEX IF NOT EXISTS idx_activities_date ON activities(activity_date)"
+)
+
+# Version 3: fee payments move from students.fee1..fee4 into their own ledger
+_create_fee_payments_table = _run_statements(
+    """
+    CREATE TABLE IF NOT EXISTS fee_payments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER NOT NULL,
+        installment INTEGER NOT NULL,
+        amount_cents INTEGER NOT NULL,
+        paid_on TEXT,
+        FOREIGN KEY (student_id) REFERENCES students(id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_fee_payments_student ON fee_payments(student_id, installment)",
+    "CREATE INDEX IF NOT EXISTS idx_fee_payments_paid_on ON fee_payments(paid_on)",
+    # Payments go with their student, whichever function deletes it
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_students_delete_fee_payments
+    AFTER DELETE ON students
+    BEGIN
+        DELETE FROM fee_payments WHERE student_id = OLD.id;
+    END
+    """
+)
+
+def _copy_legacy_fees(conn):
+    """Copies fee1..fee4 into fee_payments and clears the old columns.
+
+    Empty amounts are skipped. Amounts that are not numbers get no payment
+    (the old summaries ignored them too); their text and date are kept in
+    unparsed_amounts before the columns are cleared.
+    """
+    rows = conn.execute("""
+        SELECT id, fee1, fee2, fee3, fee4, fee1_date, fee2_date, fee3_date, fee4_date
+        FROM students
+    """).fetchall()
+    payments = []
+    for row in rows:
+        student_id = row[0]
+        for installment in range(1, 5):
+            fee, paid_on = row[installment], row[installment + 4]
+            paid_on = str(paid_on).strip() if paid_on is not None else ""
+            paid_on = paid_on if paid_on.strip("/") else None
+            try:
+                cents = to_cents(fee)
+            except ValueError:
+                _keep_unparsed_amount(conn, 3, "students", student_id, f"fee{installment}", fee, paid_on)
+                continue
+            if cents is None:
+                continue
+            payments.append((student_id, installment, cents, paid_on))
+    conn.executemany(
+        "INSERT INTO fee_payments (student_id, installment, amount_cents, paid_on) VALUES (?, ?, ?, ?)",
+        payments
+    )
+    conn.execute("""
+        UPDATE students
+        SET fee1=NULL, fee2=NULL, fee3=NULL, fee4=NULL,
+            fee1_date=NULL, fee2_date=NULL, fee3_date=NULL, fee4_date=NULL
+    """)
+
+def _create_fee_ledger(conn):
+    _create_fee_payments_table(conn)
+    _copy_legacy_fees(conn)
+
+# Version 4: every stored date becomes ISO-8601 text ("YYYY-MM-DD")
+_DATE_COLUMNS = [
+    ("income", "date"),
+    ("general_expenses", "date"),
+    ("teacher_salaries", "date"),
+    ("activities", "activity_date"),
+    ("fee_payments", "paid_on"),
+]
+
+def _normalize_dates(conn):
+    """Rewrites the date columns in ISO format.
+
+    Values that cannot be parsed are reported and left as they are.
+    """
+    for table, column in _DATE_COLUMNS:
+        rows = conn.execute(f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL").fetchall()
+        updates = []
+        for row_id, value in rows:
+            try:
+                iso = to_iso(value)
+            except ValueError:
+                print(f"Leaving unrecognized date '{value}' in {table} row {row_id}")
+                continue
+            if iso != value:
+                updates.append((iso, row_id))
+        conn.executemany(f"UPDATE {table} SET {column} = ? WHERE id = ?", updates)
+    # Salaries are also queried by date across all teachers
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_teacher_salaries_date ON teacher_salaries(date)")
+
+# Version 5: full-text search index over names and descriptions.
+# Each indexed row is stored under rowid = source id * 8 + kind, so one FTS5
+# table covers every source and a hit maps straight back to its row.
+SEARCH_KINDS = {
+    "students": 1,
+    "teachers": 2,
+    "income": 3,
+    "general_expenses": 4,
+    "activities": 5,
+}
+SEARCH_ROWID_FACTOR = 8
+
+_SEARCH_SOURCES = [
+    ("students", "name"),
+    ("teachers", "name"),
+    ("income", "description"),
+    ("general_expenses", "description"),
+    ("activities", "description"),
+]
+
+def _create_search_triggers(conn, table, column):
+    """Creates the triggers keeping search_index in sync with one source table."""
+    key = f"* {SEARCH_ROWID_FACTOR} + {SEARCH_KINDS[table]}"
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_insert
+        AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO search_index (rowid, body) VALUES (NEW.id {key}, arabic_fold(NEW.{column}));
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_update
+        AFTER UPDATE OF {column} ON {table}
+        BEGIN
+            UPDATE search_index SET body = arabic_fold(NEW.{column}) WHERE rowid = OLD.id {key};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_delete
+        AFTER DELETE ON {table}
+        BEGIN
+            DELETE FROM search_index WHERE rowid = OLD.id {key};
+        END
+    """)
+
+def _create_search_index(conn):
+    """Creates the search_index FTS5 table, its sync triggers, and fills it.
+
+    The indexed text is folded with arabic_fold (see backend/arabic.py), so
+    until migration 9 the function had to be registered on every connection
+    that writes.
+    """
+    conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(body)")
+    for table, column in _SEARCH_SOURCES:
+        _create_search_triggers(conn, table, column)
+    _fill_search_index(conn)
+
+def _fill_search_index(conn):
+    """Indexes every row of the search sources in search_index."""
+    for table, column in _SEARCH_SOURCES:
+        conn.execute(f"""
+            INSERT INTO search_index (rowid, body)
+            SELECT id * {SEARCH_ROWID_FACTOR} + {SEARCH_KINDS[table]}, arabic_fold({column}) FROM {table}
+        """)
+
+# Version 6: running totals kept current by triggers, so the summaries read a
+# few rollup rows instead of scanning every money table. Amounts are kept in
+# integer cents so repeated additions and subtractions cannot drift.
+_ROLLUP_COLUMNS = ["fee_cents", "income_cents", "expense_cents", "salary_cents"]
+
+# (table, amount in cents, date column, rollup column, columns watched by the
+# update trigger); {row} is NEW, OLD or the table itself
+_REAL_AMOUNT = "CAST(ROUND(COALESCE({row}.amount, 0) * 100) AS INTEGER)"
+_ROLLUP_SOURCES_V6 = [
+    ("fee_payments", "{row}.amount_cents", "paid_on", "fee_cents", "student_id, amount_cents, paid_on"),
+    ("income", _REAL_AMOUNT, "date", "income_cents", "amount, date"),
+    ("general_expenses", _REAL_AMOUNT, "date", "expense_cents", "amount, date"),
+    ("teacher_salaries", _REAL_AMOUNT, "date", "salary_cents", "amount, date"),
+]
+
+# From version 7 every money table stores integer cents (see below)
+_ROLLUP_SOURCES = [
+    ("fee_payments", "{row}.amount_cents", "paid_on", "fee_cents", "student_id, amount_cents, paid_on"),
+    ("income", "{row}.amount_cents", "date", "income_cents", "amount_cents, date"),
+    ("general_expenses", "{row}.amount_cents", "date", "expense_cents", "amount_cents, date"),
+    ("teacher_salaries", "{row}.amount_cents", "date", "salary_cents", "amount_cents, date"),
+]
+
+# Rows are grouped by "YYYY-MM"; rows without a date go under ""
+_MONTH_KEY = "COALESCE(substr({row}.{column}, 1, 7), '')"
+
+# Fees already recorded for one student, moved between terms with them
+_STUDENT_FEES = "(SELECT COALESCE(SUM(amount_cents), 0) FROM fee_payments WHERE student_id = OLD.id)"
+
+_create_rollup_tables = _run_statements(
+    """
+    CREATE TABLE IF NOT EXISTS financial_totals (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        fee_cents INTEGER NOT NULL DEFAULT 0,
+        income_cents INTEGER NOT NULL DEFAULT 0,
+        expense_cents INTEGER NOT NULL DEFAULT 0,
+        salary_cents INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS term_totals (
+        term TEXT PRIMARY KEY,
+        student_count INTEGER NOT NULL DEFAULT 0,
+        fee_cents INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS monthly_totals (
+        month TEXT PRIMARY KEY,
+        fee_cents INTEGER NOT NULL DEFAULT 0,
+        income_cents INTEGER NOT NULL DEFAULT 0,
+        expense_cents INTEGER NOT NULL DEFAULT 0,
+        salary_cents INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # A student's count and fees move with them when their term changes
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_students_totals_insert
+    AFTER INSERT ON students
+    BEGIN
+        INSERT INTO term_totals (term, student_count) VALUES (COALESCE(NEW.term, ''), 1)
+        ON CONFLICT (term) DO UPDATE SET student_count = student_count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_students_totals_term
+    AFTER UPDATE OF term ON students
+    WHEN COALESCE(OLD.term, '') != COALESCE(NEW.term, '')
+    BEGIN
+        UPDATE term_totals
+        SET student_count = student_count - 1, fee_cents = fee_cents - {_STUDENT_FEES}
+        WHERE term = COALESCE(OLD.term, '');
+        INSERT INTO term_totals (term, student_count, fee_cents) VALUES (COALESCE(NEW.term, ''), 1, {_STUDENT_FEES})
+        ON CONFLICT (term) DO UPDATE SET
+            student_count = student_count + 1, fee_cents = fee_cents + excluded.fee_cents;
+    END
+    """,
+    # BEFORE, while the payments still exist: trg_students_delete_fee_payments
+    # removes them afterwards, when their student can no longer be found, so
+    # the fee_payments triggers then leave term_totals alone
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_students_totals_delete
+    BEFORE DELETE ON students
+    BEGIN
+        UPDATE term_totals
+        SET student_count = student_count - 1, fee_cents = fee_cents - {_STUDENT_FEES}
+        WHERE term = COALESCE(OLD.term, '');
+    END
+    """
+)
+
+def _rollup_statements(table, amount, date_column, column, row, sign):
+    """Returns the trigger statements that add (+) or remove (-) one row's amount."""
+    amount = amount.format(row=row)
+    statements = [
+        f"UPDATE financial_totals SET {column} = {column} {sign} {amount} WHERE id = 1;",
+        f"""INSERT INTO monthly_totals (month, {column})
+            VALUES ({_MONTH_KEY.format(row=row, column=date_column)}, {sign}{amount})
+            ON CONFLICT (month) DO UPDATE SET {column} = {column} + excluded.{column};""",
+    ]
+    if table == "fee_payments":
+        statements.append(f"""UPDATE term_totals SET fee_cents = fee_cents {sign} {amount}
+            WHERE term = (SELECT COALESCE(term, '') FROM students WHERE id = {row}.student_id);""")
+    return "\n".join(statements)
+
+def _create_rollup_triggers(conn, sources):
+    """Creates the insert/update/delete triggers on the money tables."""
+    for table, amount, date_column, column, watched in sources:
+        add = _rollup_statements(table, amount, date_column, column, "NEW", "+")
+        remove = _rollup_statements(table, amount, date_column, column, "OLD", "-")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{table}_totals_insert AFTER INSERT ON {table} BEGIN {add} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{table}_totals_delete AFTER DELETE ON {table} BEGIN {remove} END")
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_totals_update
+            AFTER UPDATE OF {watched} ON {table}
+            BEGIN {remove} {add} END
+        """)
+
+# Full recompute of the same figures from the source tables
+def _compute_totals_query(sources):
+    return "SELECT " + ", ".join(
+        f"(SELECT COALESCE(SUM({amount.format(row=table)}), 0) FROM {table})"
+        for table, amount, _, _, _ in sources
+    )
+
+_COMPUTE_TERMS = """
+    SELECT COALESCE(s.term, ''), COUNT(*), COALESCE(SUM(f.total), 0)
+    FROM students s
+    LEFT JOIN (
+        SELECT student_id, SUM(amount_cents) AS total
+        FROM fee_payments
+        GROUP BY student_id
+    ) f ON f.student_id = s.id
+    GROUP BY COALESCE(s.term, '')
+"""
+
+def _compute_months_query(sources):
+    return (
+        "SELECT month, " + ", ".join(f"SUM({column})" for column in _ROLLUP_COLUMNS)
+        + " FROM (" + " UNION ALL ".join(
+            f"SELECT {_MONTH_KEY.format(row=table, column=date_column)} AS month, "
+            + ", ".join(
+                f"{amount.format(row=table) if other == column else 0} AS {other}"
+                for other in _ROLLUP_COLUMNS
+            )
+            + f" FROM {table}"
+            for table, amount, date_column, column, _ in sources
+        ) + ") GROUP BY month"
+    )
+
+def _rollup_maps(totals, terms, months) -> dict:
+    """Arranges rollup rows as {rollup: {key: figures}}, leaving out all-zero rows."""
+    return {
+        "financial_totals": {"": tuple(totals)} if totals and any(totals) else {},
+        "term_totals": {row[0]: tuple(row[1:]) for row in terms if any(row[1:])},
+        "monthly_totals": {row[0]: tuple(row[1:]) for row in months if any(row[1:])},
+    }
+
+def compute_rollups(conn) -> dict:
+    """Recomputes every rollup from the source tables (a full scan of each)."""
+    return _rollup_maps(
+        conn.execute(_compute_totals_query(_ROLLUP_SOURCES)).fetchone(),
+        conn.execute(_COMPUTE_TERMS).fetchall(),
+        conn.execute(_compute_months_query(_ROLLUP_SOURCES)).fetchall()
+    )
+
+def read_rollups(conn) -> dict:
+    """Reads the stored rollup tables, in the same shape as compute_rollups()."""
+    columns = ", ".join(_ROLLUP_COLUMNS)
+    return _rollup_maps(
+        conn.execute(f"SELECT {columns} FROM financial_totals WHERE id = 1").fetchone(),
+        conn.execute("SELECT term, student_count, fee_cents FROM term_totals").fetchall(),
+        conn.execute(f"SELECT month, {columns} FROM monthly_totals").fetchall()
+    )
+
+def _rebuild_rollups(conn, sources):
+    columns = ", ".join(_ROLLUP_COLUMNS)
+    conn.execute("DELETE FROM financial_totals")
+    conn.execute("DELETE FROM term_totals")
+    conn.execute("DELETE FROM monthly_totals")
+    conn.execute(f"INSERT INTO financial_totals (id, {columns}) SELECT 1, * FROM ({_compute_totals_query(sources)})")
+    conn.execute(f"INSERT INTO term_totals (term, student_count, fee_cents) {_COMPUTE_TERMS}")
+    conn.execute(f"INSERT INTO monthly_totals (month, {columns}) {_compute_months_query(sources)}")
+
+def rebuild_rollups(conn):
+    """Replaces the contents of the rollup tables with a full recompute."""
+    _rebuild_rollups(conn, _ROLLUP_SOURCES)
+
+def _create_rollups(conn):
+    _create_rollup_tables(conn)
+    _create_rollup_triggers(conn, _ROLLUP_SOURCES_V6)
+    _rebuild_rollups(conn, _ROLLUP_SOURCES_V6)
+
+# Version 7: income, expense and salary amounts are stored as integer piastres
+# (amount_cents) instead of REAL, like fee_payments. SQLite cannot change a
+# column's type, so each table is rebuilt: copied into a new table, dropped
+# (which drops its indexes and triggers) and replaced; then the indexes and
+# the search and rollup triggers are created again.
+_CENTS_TABLES = [
+    ("income", """
+        CREATE TABLE income_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            description TEXT,
+            amount_cents INTEGER NOT NULL DEFAULT 0,
+            date TEXT
+        )
+    """, "id, description, date"),
+    ("general_expenses", """
+        CREATE TABLE general_expenses_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            description TEXT,
+            amount_cents INTEGER NOT NULL DEFAULT 0,
+            date TEXT
+        )
+    """, "id, description, date"),
+    ("teacher_salaries", """
+        CREATE TABLE teacher_salaries_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER,
+            amount_cents INTEGER NOT NULL DEFAULT 0,
+            date TEXT,
+            FOREIGN KEY (teacher_id) REFERENCES teachers(id)
+        )
+    """, "id, teacher_id, date"),
+]
+
+_create_cents_table_indexes = _run_statements(
+    "CREATE INDEX IF NOT EXISTS idx_income_date ON income(date)",
+    "CREATE INDEX IF NOT EXISTS idx_general_expenses_date ON general_expenses(date)",
+    "CREATE INDEX IF NOT EXISTS idx_teacher_salaries_teacher_date ON teacher_salaries(teacher_id, date)",
+    "CREATE INDEX IF NOT EXISTS idx_teacher_salaries_date ON teacher_salaries(date)"
+)
+
+def _legacy_amount_cents(conn, table, row_id, amount, value_date):
+    """Converts a stored REAL amount to cents.
+
+    Goes through the shortest decimal text of the float, so 0.1 + 0.2 stored
+    as 0.30000000000000004 becomes 30. Empty and invalid amounts are stored
+    as 0, the value the summaries already counted them as; the text of an
+    invalid amount is kept in unparsed_amounts.
+    """
+    try:
+        return to_cents(amount) or 0
+    except ValueError:
+        _keep_unparsed_amount(conn, 7, table, row_id, "amount", amount, value_date)
+        return 0
+
+def _rebuild_with_cents(conn, table, create, columns):
+    """Rebuilds one money table with an amount_cents column, keeping ids and its AUTOINCREMENT counter."""
+    rows = conn.execute(f"SELECT {columns}, amount FROM {table}").fetchall()
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()
+
+    conn.execute(create)
+    placeholders = ", ".join("?" for _ in columns.split(",")) + ", ?"
+    # Every rebuilt table has its date last before the amount
+    conn.executemany(
+        f"INSERT INTO {table}_new ({columns}, amount_cents) VALUES ({placeholders})",
+        [(*row[:-1], _legacy_amount_cents(conn, table, row[0], row[-1], row[-2])) for row in rows]
+    )
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+    # Ids of rows deleted before the rebuild must still not be reused
+    if sequence is not None:
+        conn.execute(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?", (sequence[0], table)
+        )
+        if conn.execute("SELECT changes()").fetchone()[0] == 0:
+            conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, sequence[0]))
+
+def _store_amounts_in_cents(conn):
+    for table, create, columns in _CENTS_TABLES:
+        _rebuild_with_cents(conn, table, create, columns)
+    _create_cents_table_indexes(conn)
+    for table, column in _SEARCH_SOURCES:
+        if table in ("income", "general_expenses"):
+            _create_search_triggers(conn, table, column)
+    _create_rollup_triggers(conn, _ROLLUP_SOURCES)
+    rebuild_rollups(conn)
+
+# Version 8: prefix indexes on search_index. Every search term is a prefix
+# ("محم"*); without a prefix index FTS5 merges the entries of every indexed
+# word starting with it, which for a short prefix is a large part of the
+# index. The lengths are in characters; longer prefixes match few enough
+# words to be merged quickly.
+_SEARCH_PREFIX_LENGTHS = "1 2 3 4"
+
+def _add_search_prefix_index(conn):
+    """Recreates search_index with prefix indexes and fills it again.
+
+    The sync triggers stay: they refer to search_index by name.
+    """
+    conn.execute("DROP TABLE IF EXISTS search_index")
+    conn.execute(f"CREATE VIRTUAL TABLE search_index USING fts5(body, prefix='{_SEARCH_PREFIX_LENGTHS}')")
+    _fill_search_index(conn)
+
+# Version 9: search_index no longer depends on the arabic_fold SQL function,
+# which only this application registers. With it in the triggers, any insert
+# or rename made with another SQLite tool failed with "no such function".
+# The insert and update triggers now only queue the row in search_pending;
+# index_pending_search_rows folds the queued rows' text in Python and indexes
+# them before every commit of the application's writer (see database.py).
+# Rows queued by another tool are indexed at the application's next write,
+# or when it starts. The delete triggers need no folding and are kept.
+
+def _create_search_queue_triggers(conn, table, column):
+    """Creates the triggers queueing a source table's new and renamed rows."""
+    key = f"* {SEARCH_ROWID_FACTOR} + {SEARCH_KINDS[table]}"
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_insert
+        AFTER INSERT ON {table}
+        BEGIN
+            INSERT OR IGNORE INTO search_pending (rowid) VALUES (NEW.id {key});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_update
+        AFTER UPDATE OF {column} ON {table}
+        BEGIN
+            INSERT OR IGNORE INTO search_pending (rowid) VALUES (NEW.id {key});
+        END
+    """)
+
+def _queue_search_updates(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS search_pending (rowid INTEGER PRIMARY KEY)")
+    for table, column in _SEARCH_SOURCES:
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_{table}_search_insert")
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_{table}_search_update")
+        _create_search_queue_triggers(conn, table, column)
+
+def index_pending_search_rows(conn) -> int:
+    """Indexes the rows queued in search_pending, folding their text in Python.
+
+    Args:
+        conn: The writer connection, inside a write transaction.
+
+    Returns:
+        The number of queued rows (0 when the queue is empty or does not
+        exist yet, before migration 9).
+    """
+    try:
+        if conn.execute("SELECT 1 FROM search_pending LIMIT 1").fetchone() is None:
+            return 0
+    except sqlite3.OperationalError:
+        # search_pending does not exist yet
+        return 0
+    for table, column in _SEARCH_SOURCES:
+        rows = conn.execute(f"""
+            SELECT p.rowid, t.{column} FROM search_pending p
+            JOIN {table} t ON t.id = p.rowid / {SEARCH_ROWID_FACTOR}
+            WHERE p.rowid % {SEARCH_ROWID_FACTOR} = {SEARCH_KINDS[table]}
+        """).fetchall()
+        conn.executemany(
+            "INSERT OR REPLACE INTO search_index (rowid, body) VALUES (?, ?)",
+            ((rowid, fold_arabic(text)) for rowid, text in rows)
+        )
+    # Rows deleted since they were queued have already left the index
+    return conn.execute("DELETE FROM search_pending").rowcount
+
+# Ordered list of (version, description, step)
+MIGRATIONS = [
+    (1, "Create base tables", _create_base_tables),
+    (2, "Add indexes for hot query paths", _create_hot_path_indexes),
+    (3, "Move student fees into the fee_payments ledger", _create_fee_ledger),
+    (4, "Store dates as ISO-8601 text", _normalize_dates),
+    (5, "Add the full-text search index", _create_search_index),
+    (6, "Add trigger-maintained financial rollups", _create_rollups),
+    (7, "Store income, expense and salary amounts as integer piastres", _store_amounts_in_cents),
+    (8, "Add prefix indexes to the full-text search index", _add_search_prefix_index),
+    (9, "Index search text without the arabic_fold SQL function", _queue_search_updates),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# --- Version Tracking ---
+
+def get_schema_version(conn) -> int:
+    """Returns the highest applied migration version (0 for a new database)."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        # schema_version does not exist yet
+        return 0
+    return row[0] or 0
+
+def _record_version(conn, version: int, description: str):
+    """Stores an applied migration in the schema_version table."""
+    conn.execute(
+        "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+        (version, description, datetime.now().isoformat(timespec="seconds"))
+    )
+
+# --- Runner ---
+
+def migrate(manager) -> list:
+    """Brings the database schema up to LATEST_VERSION.
+
+    Args:
+        manager: The ConnectionManager whose writer runs the migrations.
+
+    Returns:
+        The list of versions applied by this call (empty when already current).
+    """
+    # Fast path: a plain read, no DDL, when nothing is pending
+    with manager.reader() as conn:
+        if get_schema_version(conn) >= LATEST_VERSION:
+            return []
+
+    applied = []
+    with manager.writer() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TEXT
+            )
+        """)
+        # Re-check under the writer lock in case another thread migrated first
+        current = get_schema_version(conn)
+        for version, description, step in MIGRATIONS:
+            if version <= current:
+                continue
+            step(conn)
+            _record_version(conn, version, description)
+            applied.append(version)
+    return applied
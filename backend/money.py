@@ -0,0 +1,123 @@
+"""
+Helpers for converting money amounts to and from integer piastres (cents).
+
+Amounts typed by users arrive as strings ("150", "99.5"); parsing goes
+through Decimal so no binary floating point rounding is introduced.
+"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import total_ordering
+
+def to_cents(value):
+    """Converts an amount to integer cents.
+
+    Args:
+        value: A string, int, float or Decimal amount. Empty values are allowed.
+
+    Returns:
+        The amount in cents, or None when the value is empty.
+
+    Raises:
+        ValueError: If the value is not a valid number.
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if text == "":
+        return None
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: '{value}'")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: '{value}'")
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+def format_cents(cents) -> str:
+    """Formats cents as a plain amount string ("150", "99.5"); "" for None."""
+    if cents is None:
+        return ""
+    sign = "-" if cents < 0 else ""
+    whole, fraction = divmod(abs(int(cents)), 100)
+    if fraction == 0:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{fraction:02d}".rstrip("0")
+
+
+@total_ordering
+class Money:
+    """An exact amount of money, held as integer piastres (cents).
+
+    Amounts read from the database and parsed from user input use this type,
+    so adding them up never picks up binary floating point drift. str()
+    gives the plain amount string shown in labels and entries ("150", "99.5").
+    """
+
+    __slots__ = ("_cents",)
+
+    def __init__(self, cents: int = 0):
+        self._cents = int(cents)
+
+    @classmethod
+    def parse(cls, value) -> "Money":
+        """Parses an amount typed by the user (or any value to_cents accepts).
+
+        Raises:
+            ValueError: If the value is empty or not a valid number.
+        """
+        cents = to_cents(value)
+        if cents is None:
+            raise ValueError("An amount is required")
+        return cls(cents)
+
+    @property
+    def cents(self) -> int:
+        return self._cents
+
+    def __str__(self):
+        return format_cents(self._cents)
+
+    def __repr__(self):
+        return f"Money('{self}')"
+
+    def __format__(self, spec):
+        # "" gives str(); other specs ("{:.2f}", "{:,.2f}") format the exact decimal amount
+        if not spec:
+            return str(self)
+        return format(Decimal(self._cents).scaleb(-2), spec)
+
+    def __float__(self):
+        return self._cents / 100
+
+    def __bool__(self):
+        return self._cents != 0
+
+    def __hash__(self):
+        return hash(self._cents)
+
+    def __eq__(self, other):
+        if isinstance(other, Money):
+            return self._cents == other._cents
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Money):
+            return self._cents < other._cents
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self._cents + other._cents)
+        if other == 0:
+            # Lets sum() start from its default 0
+            return self
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self._cents - other._cents)
+        return NotImplemented
+
+    def __neg__(self):
+        return Money(-self._cents)
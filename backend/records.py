@@ -0,0 +1,192 @@
+"""
+Record types returned by the query functions in backend.database.
+
+Rows used to be built as one dictionary per row, which for large rosters
+costs more memory than the data itself. The records below are named tuples
+or slotted classes (no per-instance __dict__), built straight from the
+query cursor by the row factories at the bottom of this module.
+
+Student and Teacher keep dictionary-style access for the pages that were
+written against dictionaries: student.get("name"), student["fee1"].
+
+The ledger rows (income, expenses, salaries) have Money amounts and are
+read like tuples: (id, description, amount, date) = record, record[2]. They
+are slotted classes rather than named tuples: an instance of a tuple
+subclass is allocated with one spare item slot, so a four-field named tuple
+takes 80 bytes and a plain tuple 72, where these take 64.
+"""
+from collections import namedtuple
+from operator import attrgetter
+
+from .money import Money, format_cents
+
+
+class _Record:
+    """Dictionary-style access by field name, for the record types below."""
+
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        """Returns the named field, or default when there is no such field."""
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        # Field names act like dictionary keys; integers and slices index the tuple
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def keys(self):
+        """Returns the field names."""
+        return self._fields
+
+
+class Student(_Record, namedtuple("Student", [
+        "id", "name", "nid", "term", "gender", "phone1", "phone2",
+        "fee1", "fee2", "fee3", "fee4",
+        "fee1_date", "fee2_date", "fee3_date", "fee4_date"])):
+    """A student with installments 1-4 from the fee ledger.
+
+    Fees are amount strings ("" when unpaid), dates ISO strings ("" when unset).
+    """
+
+    __slots__ = ()
+
+
+class Teacher(_Record, namedtuple("Teacher", ["id", "name", "nid", "term", "gender", "phone1", "phone2"])):
+    """A teacher."""
+
+    __slots__ = ()
+
+
+class _LedgerRecord:
+    """Read-only, tuple-style access for the slotted ledger records below.
+
+    Records unpack, index, compare and hash like the tuple of their fields,
+    and equal tuples compare equal to them.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__slots__
+        cls._values = attrgetter(*cls.__slots__)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    __delattr__ = __setattr__
+
+    def __iter__(self):
+        return iter(self._values(self))
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return self._values(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, _LedgerRecord):
+            return type(self) is type(other) and self._values(self) == other._values(other)
+        if isinstance(other, tuple):
+            return self._values(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._values(self))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self))
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return type(self), self._values(self)
+
+
+# Sets a field of a read-only record (in the __init__ methods below)
+_set = object.__setattr__
+
+
+class IncomeRow(_LedgerRecord):
+    """An income record: (id, description, amount, date)."""
+
+    __slots__ = ("id", "description", "amount", "date")
+
+    def __init__(self, id, description, amount, date):
+        _set(self, "id", id)
+        _set(self, "description", description)
+        _set(self, "amount", amount)
+        _set(self, "date", date)
+
+
+class ExpenseRow(_LedgerRecord):
+    """A general expense record: (id, description, amount, date)."""
+
+    __slots__ = ("id", "description", "amount", "date")
+
+    def __init__(self, id, description, amount, date):
+        _set(self, "id", id)
+        _set(self, "description", description)
+        _set(self, "amount", amount)
+        _set(self, "date", date)
+
+
+class SalaryRow(_LedgerRecord):
+    """One of a teacher's salaries (get_teacher_salaries): (id, amount, date)."""
+
+    __slots__ = ("id", "amount", "date")
+
+    def __init__(self, id, amount, date):
+        _set(self, "id", id)
+        _set(self, "amount", amount)
+        _set(self, "date", date)
+
+
+class TeacherSalaryRow(_LedgerRecord):
+    """A salary of any teacher (get_salaries_between): (id, teacher_id, amount, date)."""
+
+    __slots__ = ("id", "teacher_id", "amount", "date")
+
+    def __init__(self, id, teacher_id, amount, date):
+        _set(self, "id", id)
+        _set(self, "teacher_id", teacher_id)
+        _set(self, "amount", amount)
+        _set(self, "date", date)
+
+
+# --- Row Factories ---
+# Set as cursor.row_factory; each receives (cursor, row) for every fetched row.
+
+def student_row(cursor, row):
+    """Builds a Student from a database._STUDENT_SELECT row (fees in cents)."""
+    return Student(
+        row[0], row[1], row[2], row[3], row[4], row[5], row[6],
+        format_cents(row[7]), format_cents(row[8]), format_cents(row[9]), format_cents(row[10]),
+        row[11] or "", row[12] or "", row[13] or "", row[14] or ""
+    )
+
+def teacher_row(cursor, row):
+    """Builds a Teacher from an (id, name, nid, term, gender, phone1, phone2) row."""
+    return Teacher._make(row)
+
+def income_row(cursor, row):
+    """Builds an IncomeRow from an (id, description, amount_cents, date) row."""
+    return IncomeRow(row[0], row[1], Money(row[2]), row[3])
+
+def expense_row(cursor, row):
+    """Builds an ExpenseRow from an (id, description, amount_cents, date) row."""
+    return ExpenseRow(row[0], row[1], Money(row[2]), row[3])
+
+def salary_row(cursor, row):
+    """Builds a SalaryRow from an (id, amount_cents, date) row."""
+    return SalaryRow(row[0], Money(row[1]), row[2])
+
+def teacher_salary_row(cursor, row):
+    """Builds a TeacherSalaryRow from an (id, teacher_id, amount_cents, date) row."""
+    return TeacherSalaryRow(row[0], row[1], Money(row[2]), row[3])
@@ -0,0 +1,184 @@
+"""
+In-memory settings for the application.
+
+The settings table is small and read far more often than it is written
+(the backup path is read on every visit to the settings page and by the
+hourly backup check). SettingsStore loads the whole table once and answers
+reads from memory:
+
+- set() writes through: the row is saved first, then the in-memory copy
+  is updated and observers are notified
+- writes made by another process are detected through PRAGMA data_version;
+  the table is then reloaded and observers are told about changed keys
+
+Values are stored as text. The typed getters convert on read and fall back
+to the default when the stored text is not a valid value of that type.
+"""
+import threading
+
+
+class SettingsStore:
+    """The settings table, kept in memory and written through to the database.
+
+    Observers are called as observer(key, value) on the thread that called
+    set(), delete() or the read that noticed an outside change; value is
+    None when the setting was removed. An observer that updates the UI must
+    hand the work to the Tk thread (frontend.background.call_in_ui).
+
+    Attributes:
+        reader: Callable returning a reader context manager.
+        writer: Callable returning a writer context manager (one transaction).
+        version_source: Callable returning the database's data_version (or
+            None when it cannot be read right now); a change means another
+            process wrote to the database.
+    """
+
+    def __init__(self, reader, writer, version_source=None):
+        self.reader = reader
+        self.writer = writer
+        self.version_source = version_source
+
+        self._lock = threading.Lock()
+        self._values = None  # key -> text, None until loaded
+        self._data_version = None
+        self._observers = []
+
+    # --- Loading ---
+
+    def _read_all(self) -> dict:
+        """Reads every row of the settings table."""
+        with self.reader() as conn:
+            return dict(conn.execute("SELECT key, value FROM settings").fetchall())
+
+    def _ensure_loaded(self):
+        """Loads the table on first use and reloads it after an outside write."""
+        data_version = self.version_source() if self.version_source is not None else None
+        with self._lock:
+            outdated = data_version is not None and data_version != self._data_version
+            if self._values is not None and not outdated:
+                return
+            old = self._values
+
+        values = self._read_all()
+        with self._lock:
+            self._values = values
+            if data_version is not None:
+                self._data_version = data_version
+        if old is not None:
+            for key in old.keys() | values.keys():
+                if old.get(key) != values.get(key):
+                    self._notify(key, values.get(key))
+
+    def invalidate(self):
+        """Forgets the loaded values; the next read loads them again (e.g. a new database file)."""
+        with self._lock:
+            self._values = None
+            self._data_version = None
+
+    # --- Reading ---
+
+    def get(self, key: str, default=None):
+        """Returns the text stored for key, or default if there is none."""
+        self._ensure_loaded()
+        with self._lock:
+            return self._values.get(key, default)
+
+    def get_int(self, key: str, default: int = None):
+        """Returns the setting as an int, or default if missing or invalid."""
+        return self._convert(key, int, default)
+
+    def get_float(self, key: str, default: float = None):
+        """Returns the setting as a float, or default if missing or invalid."""
+        return self._convert(key, float, default)
+
+    def get_bool(self, key: str, default: bool = None):
+        """Returns the setting as a bool ("1"/"true"/"yes" or "0"/"false"/"no"), or default."""
+        def to_bool(text):
+            text = text.strip().lower()
+            if text in ("1", "true", "yes"):
+                return True
+            if text in ("0", "false", "no"):
+                return False
+            raise ValueError(f"not a boolean: {text!r}")
+        return self._convert(key, to_bool, default)
+
+    def _convert(self, key, convert, default):
+        """Returns convert(stored text), or default if missing or not convertible."""
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return convert(str(value))
+        except ValueError:
+            print(f"Ignoring invalid value '{value}' for setting '{key}'")
+            return default
+
+    def all(self) -> dict:
+        """Returns a copy of every setting."""
+        self._ensure_loaded()
+        with self._lock:
+            return dict(self._values)
+
+    # --- Writing ---
+
+    def set(self, key: str, value):
+        """Saves a setting (bools as "1"/"0", anything else as text).
+
+        Raises:
+            sqlite3.Error: If the row could not be saved; memory is unchanged.
+        """
+        if isinstance(value, bool):
+            text = "1" if value else "0"
+        else:
+            text = str(value)
+        self._ensure_loaded()
+        with self.writer() as conn:
+            conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, text))
+        self._apply(key, text)
+
+    def delete(self, key: str):
+        """Removes a setting.
+
+        Raises:
+            sqlite3.Error: If the row could not be deleted; memory is unchanged.
+        """
+        self._ensure_loaded()
+        with self.writer() as conn:
+            conn.execute("DELETE FROM settings WHERE key = ?", (key,))
+        self._apply(key, None)
+
+    def _apply(self, key, text):
+        """Updates the in-memory copy after a write and notifies observers on a change."""
+        with self._lock:
+            if self._values is None:
+                # Invalidated meanwhile; the next read loads the saved value
+                return
+            old = self._values.get(key)
+            if text is None:
+                self._values.pop(key, None)
+            else:
+                self._values[key] = text
+        if old != text:
+            self._notify(key, text)
+
+    # --- Observers ---
+
+    def add_observer(self, observer):
+        """Registers observer(key, value), called whenever a setting changes."""
+        with self._lock:
+            self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Unregisters an observer added with add_observer (no-op if unknown)."""
+        with self._lock:
+            if observer in self._observers:
+                self._observers.remove(observer)
+
+    def _notify(self, key, value):
+        with self._lock:
+            observers = list(self._observers)
+        for observer in observers:
+            try:
+                observer(key, value)
+            except Exception as e:
+                print(f"Error in settings observer for '{key}': {e}")
@@ -0,0 +1,61 @@
+"""
+Background worker for database calls.
+
+The UI runs on the Tk main thread, so a slow query (a large database, or the
+file being locked during a backup) would freeze the whole window. Calls
+submitted here run on a single worker thread instead and return a
+concurrent.futures.Future.
+
+One thread is enough: the queries share the connection pool anyway, and
+running calls one after another in submission order means a refresh never
+overtakes the write that triggered it, and the last refresh requested is the
+last one delivered.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class DatabaseWorker:
+    """Runs functions on a background thread and returns futures.
+
+    The thread is started on the first submit and, after shutdown(), again
+    on the next one.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Schedules func(*args, **kwargs) on the worker thread.
+
+        Returns:
+            A Future holding the result, or the exception func raised.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="database")
+            return self._executor.submit(func, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """Stops the worker thread, dropping calls that have not started yet.
+
+        Args:
+            wait: Whether to wait for the call currently running to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Shared worker used by the UI
+_worker = DatabaseWorker()
+
+def submit(func, *args, **kwargs) -> Future:
+    """Runs func(*args, **kwargs) on the shared database worker thread."""
+    return _worker.submit(func, *args, **kwargs)
+
+def shutdown_worker(wait: bool = True):
+    """Stops the shared worker (call on application exit, before closing connections)."""
+    _worker.shutdown(wait=wait)
@@ -0,0 +1,151 @@
+"""
+Group commit for high-frequency writes.
+
+Every write function commits its own transaction, and with it pays for one
+fsync. When many small writes arrive back to back (registrations and fees
+during enrollment week), the queue below runs them on a dedicated thread and
+commits them together: a group is closed after max_delay seconds or
+max_batch writes, whichever comes first, and committed as one transaction.
+
+Each queued write runs inside its own savepoint of the group transaction
+(nested ConnectionManager.writer() calls), so a failing write is rolled back
+alone and the rest of the group still commits. Callers get a Future that is
+resolved only once the group is committed.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+# Defaults: a group waits at most 50 ms and holds at most 100 writes
+MAX_DELAY = 0.05
+MAX_BATCH = 100
+
+# Queue item that closes the current group right away (used by flush and close)
+_FLUSH = object()
+
+
+class WriteQueue:
+    """Runs queued write functions on one thread and commits them in groups.
+
+    Attributes:
+        writer: Callable returning a writer context manager (one transaction).
+        max_batch: Maximum number of writes per group.
+        max_delay: Seconds a group stays open after its first write.
+        groups: Number of groups committed so far.
+        writes: Number of writes committed so far.
+    """
+
+    def __init__(self, writer, max_batch: int = MAX_BATCH, max_delay: float = MAX_DELAY):
+        self.writer = writer
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.groups = 0
+        self.writes = 0
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # --- Queueing ---
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Queues func(*args, **kwargs) for the next group commit.
+
+        Returns:
+            A Future holding func's return value (or the exception it raised),
+            resolved after the group has been committed.
+        """
+        future = Future()
+        with self._lock:
+            self._start()
+            self._queue.put((future, func, args, kwargs))
+        return future
+
+    def flush(self, timeout: float = None) -> bool:
+        """Commits everything queued so far and waits for it.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        with self._lock:
+            if self._thread is None:
+                return True
+            done = threading.Event()
+            self._queue.put((_FLUSH, done, False))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = None):
+        """Commits everything queued so far and stops the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put((_FLUSH, None, True))
+        thread.join(timeout)
+
+    def _start(self):
+        """Starts the writer thread if it is not running (called with the lock held)."""
+        if self._thread is None:
+            # A daemon thread so a missed close() cannot keep the process alive;
+            # the application flushes the queue on exit
+            self._thread = threading.Thread(target=self._run, name="write-queue", daemon=True)
+            self._thread.start()
+
+    # --- Writer Thread ---
+
+    def _run(self):
+        """Collects groups of writes and commits them until closed."""
+        while True:
+            item = self._queue.get()
+            group = []
+            deadline = time.monotonic() + self.max_delay
+            while item[0] is not _FLUSH:
+                group.append(item)
+                if len(group) >= self.max_batch:
+                    item = None
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+                    break
+
+            if group:
+                self._commit(group)
+            if item is not None:
+                _, done, stop = item
+                if done is not None:
+                    done.set()
+                if stop:
+                    return
+
+    def _commit(self, group):
+        """Runs a group of writes in one transaction and resolves their futures."""
+        outcomes = []
+        try:
+            with self.writer():
+                for future, func, args, kwargs in group:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        outcomes.append((future, True, func(*args, **kwargs)))
+                    except Exception as e:
+                        # The write's own savepoint has been rolled back
+                        outcomes.append((future, False, e))
+        except Exception as e:
+            # The commit itself failed: nothing in the group was saved
+            print(f"Database error committing queued writes: {e}")
+            for future, _, _, _ in group:
+                if future.running():
+                    future.set_exception(e)
+            return
+
+        self.groups += 1
+        self.writes += len(outcomes)
+        for future, ok, value in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
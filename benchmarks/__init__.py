@@ -0,0 +1,6 @@
+"""
+Benchmarks for the database layer and UI.
+
+Each module is a standalone script, run from the project root, e.g.:
+    python -m benchmarks.bench_sqlite_profile
+"""
@@ -0,0 +1,129 @@
+"""
+Benchmark: statistics aggregation.
+
+Compares the old way of building get_detailed_statistics() (load every
+student, income and expense row and sum in Python, two queries per term) with
+a full SQL recompute (SUM/COUNT ... GROUP BY, what check_totals runs) and with
+the current reads of the trigger-maintained rollup tables, on a database with
+50k students. Also times the inserts, which now pay for the triggers.
+
+Run from the project root:
+    python -m benchmarks.bench_aggregation
+"""
+import os
+import random
+import tempfile
+import time
+
+from backend import database
+from backend.init_db import init_database
+from backend.money import Money
+
+STUDENTS = 50000
+LEDGER_ROWS = 5000
+TERMS = ["البراعم", "التمهيدي", "KG1", "KG2"]
+REPEATS = 5
+
+
+def populate():
+    """Fills the database with students, fee payments, income, expenses and salaries."""
+    rng = random.Random(42)
+    with database.get_connection_manager().writer() as conn:
+        conn.executemany(
+            "INSERT INTO students (name, nid, term, gender, phone1, phone2) VALUES (?, ?, ?, ?, ?, ?)",
+            ((f"student {i}", str(i), TERMS[i % len(TERMS)], "ذكر", "0100", "") for i in range(STUDENTS))
+        )
+        conn.executemany(
+            "INSERT INTO fee_payments (student_id, installment, amount_cents, paid_on) VALUES (?, ?, ?, ?)",
+            ((student_id, installment, rng.randint(100, 2000) * 100, "2024-01-01")
+             for student_id in range(1, STUDENTS + 1) for installment in range(1, 5))
+        )
+        for table in ("income", "general_expenses"):
+            conn.executemany(
+                f"INSERT INTO {table} (description, amount_cents, date) VALUES (?, ?, ?)",
+                ((f"{table} {i}", rng.randint(10, 5000) * 100, "2024-01-01") for i in range(LEDGER_ROWS))
+            )
+        conn.execute("INSERT INTO teachers (name) VALUES ('teacher')")
+        conn.executemany(
+            "INSERT INTO teacher_salaries (teacher_id, amount_cents, date) VALUES (1, ?, '2024-01-01')",
+            ((rng.randint(1000, 5000) * 100,) for _ in range(LEDGER_ROWS))
+        )
+
+
+def legacy_detailed_statistics():
+    """The previous Python-side implementation, kept here as the baseline."""
+    manager = database.get_connection_manager()
+    students_by_term = {}
+    with manager.reader() as conn:
+        terms = [row[0] for row in conn.execute("SELECT DISTINCT term FROM students").fetchall() if row[0]]
+        for term in terms:
+            count = conn.execute("SELECT COUNT(*) FROM students WHERE term = ?", (term,)).fetchone()[0]
+            fees = conn.execute("""
+                SELECT SUM(p.amount_cents) FROM fee_payments p
+                JOIN students s ON s.id = p.student_id WHERE s.term = ?
+                GROUP BY p.student_id
+            """, (term,)).fetchall()
+            students_by_term[term] = {"student_count": count, "total_fees": Money(sum(f[0] for f in fees))}
+        teachers = {
+            "teacher_count": conn.execute("SELECT COUNT(*) FROM teachers").fetchone()[0],
+            "total_salaries": Money(conn.execute("SELECT SUM(amount_cents) FROM teacher_salaries").fetchone()[0] or 0)
+        }
+
+    student_fees = 0
+    for s in database.get_all_students():
+        for i in range(1, 5):
+            fee = s.get(f"fee{i}")
+            if fee:
+                student_fees += float(fee)
+    income = student_fees + sum(float(row[2]) for row in database.get_all_income())
+    expenses = sum(float(row[2]) for row in database.get_all_general_expenses())
+    salaries = float(database.get_total_teacher_salaries())
+    summary = {
+        "income": income,
+        "expenses": expenses + salaries,
+        "remaining": income - expenses - salaries,
+        "teacher_salaries": salaries
+    }
+    return {"students_by_term": students_by_term, "teachers": teachers, "summary": summary}
+
+
+def best_of(func):
+    """Returns the fastest of REPEATS runs, in milliseconds, and the last result."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"))
+        try:
+            init_database()
+            started = time.perf_counter()
+            populate()
+            populate_s = time.perf_counter() - started
+            legacy_ms, legacy = best_of(legacy_detailed_statistics)
+            recompute_ms, mismatches = best_of(database.check_totals)
+            sql_ms, current = best_of(database.get_detailed_statistics)
+            summary_ms, _ = best_of(database.get_summary)
+        finally:
+            database.close_connections()
+
+    same = (legacy["students_by_term"] == current["students_by_term"]
+            and abs(legacy["summary"]["remaining"] - float(current["summary"]["remaining"])) < 0.01
+            and not mismatches)
+    print(f"{STUDENTS} students, {STUDENTS * 4} fee payments, {LEDGER_ROWS} income/expense/salary rows")
+    print(f"{'populate (with triggers)':<32} {populate_s * 1000:>10.1f} ms")
+    print(f"{'legacy get_detailed_statistics':<32} {legacy_ms:>10.3f} ms")
+    print(f"{'full recompute (check_totals)':<32} {recompute_ms:>10.3f} ms")
+    print(f"{'rollup get_detailed_statistics':<32} {sql_ms:>10.3f} ms")
+    print(f"{'rollup get_summary':<32} {summary_ms:>10.3f} ms")
+    print(f"{'speedup':<32} {legacy_ms / sql_ms:>10.1f}x")
+    print(f"results match: {same}")
+
+
+if __name__ == "__main__":
+    main()
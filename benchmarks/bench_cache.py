@@ -0,0 +1,74 @@
+"""
+Benchmark: query cache.
+
+Replays the reads the UI makes when the user moves between the fees page
+(expenses, income, summary) and the dashboard (summary, people counts,
+activities), with the query cache cleared before every read ("uncached")
+and with the cache in place, on a database with 20k income and expense
+rows. Every tenth navigation records a new income entry, which invalidates
+the income-derived results.
+
+Run from the project root:
+    python -m benchmarks.bench_cache
+"""
+import os
+import random
+import tempfile
+import time
+
+from backend import database
+from backend.init_db import init_database
+
+LEDGER_ROWS = 20000
+NAVIGATIONS = 100
+
+FEES_PAGE = [database.get_all_general_expenses, database.get_all_income, database.get_summary]
+DASHBOARD = [database.get_summary, database.get_people_counts, database.get_all_activities]
+
+
+def populate():
+    """Adds LEDGER_ROWS income and expense rows and a few activities."""
+    rng = random.Random(5)
+    database.add_income_bulk(("income", rng.randint(10, 5000), "2024-01-01") for _ in range(LEDGER_ROWS))
+    database.add_expenses_bulk(("expense", rng.randint(10, 5000), "2024-01-01") for _ in range(LEDGER_ROWS))
+    database.add_activities_bulk(("activity", "2024-01-01") for _ in range(50))
+
+
+def navigate(uncached):
+    """Runs NAVIGATIONS page switches and returns the elapsed time in milliseconds."""
+    started = time.perf_counter()
+    for i in range(NAVIGATIONS):
+        if i % 10 == 9:
+            database.add_income("new entry", 100, "2024-02-01")
+        for read in FEES_PAGE if i % 2 == 0 else DASHBOARD:
+            if uncached:
+                database.clear_cache()
+            read()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"))
+        try:
+            init_database()
+            populate()
+            uncached_ms = navigate(uncached=True)
+            database.clear_cache()
+            before = database.get_cache_stats()
+            cached_ms = navigate(uncached=False)
+            after = database.get_cache_stats()
+        finally:
+            database.close_connections()
+
+    print(f"{NAVIGATIONS} page switches over {LEDGER_ROWS} income and expense rows")
+    print(f"{'uncached':<10} {uncached_ms:>10.1f} ms")
+    print(f"{'cached':<10} {cached_ms:>10.1f} ms")
+    print(f"{'speedup':<10} {uncached_ms / cached_ms:>10.1f}x")
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    print(f"cached run: {hits} hits, {misses} misses, hit rate {hits / (hits + misses):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: search as you type.
+
+Types names one key at a time into the search of a 20k student roster and
+times, for each key, what the search page does before new results can be
+shown: narrowing the rows already shown (when the new name filter extends
+the previous one), and the database query for the page of results that
+follows the typing pause (SEARCH_DEBOUNCE_MS). The narrowed rows are what
+a key shows at once, so narrowing has to stay well below 50 ms; the query
+completes the page after the pause.
+
+Run from the project root:
+    python -m benchmarks.bench_live_search
+"""
+import os
+import random
+import tempfile
+import time
+
+from backend import database
+from backend.init_db import init_database
+from frontend.person_management.constants import SEARCH_DEBOUNCE_MS, SEARCH_PAGE_SIZE
+from benchmarks.bench_search import FIRST_NAMES, TERMS
+
+STUDENTS = 20000
+TYPED = ["محمد علي", "فاطمة حسن", "عبد الرحمن"]
+
+
+def populate():
+    """Adds STUDENTS students with random three-part Arabic names and a fee payment."""
+    rng = random.Random(7)
+    result = database.add_students_bulk(
+        (" ".join(rng.choice(FIRST_NAMES) for _ in range(3)), str(i), rng.choice(TERMS), "", "", "",
+         ["100"], ["2024-01-01"])
+        for i in range(STUDENTS)
+    )
+    assert not result["failed"]
+
+
+def query_ms(name_filter):
+    """Returns (milliseconds, rows, total) for one uncached results query."""
+    database.clear_cache()
+    started = time.perf_counter()
+    rows, total = database.search_people("students", name_filter, None, SEARCH_PAGE_SIZE, 0)
+    return (time.perf_counter() - started) * 1000, rows, total
+
+
+def narrow_ms(rows, name_filter):
+    """Returns (milliseconds, rows) for narrowing shown rows to a longer name filter."""
+    started = time.perf_counter()
+    words = database.search_words(name_filter)
+    narrowed = [row for row in rows if database.matches_search_words(row.name, words)]
+    return (time.perf_counter() - started) * 1000, narrowed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"))
+        try:
+            init_database()
+            populate()
+            print(f"{'typed':<14} {'shown rows':>10} {'narrow ms':>10} {'query ms':>9} {'matches':>8}")
+            worst_narrow = worst_query = 0.0
+            for name in TYPED:
+                _, shown, _ = query_ms("")
+                for length in range(1, len(name) + 1):
+                    typed = name[:length]
+                    narrow_time, narrowed = narrow_ms(shown, typed)
+                    query_time, shown, total = query_ms(typed)
+                    # The narrowed rows are the first rows of the query's results
+                    assert [row.id for row in narrowed] == [row.id for row in shown[:len(narrowed)]]
+                    worst_narrow = max(worst_narrow, narrow_time)
+                    worst_query = max(worst_query, query_time)
+                    print(f"{typed:<14} {len(narrowed):>10} {narrow_time:>10.2f} {query_time:>9.2f} {total:>8}")
+            print(f"worst: narrowing {worst_narrow:.2f} ms, query {worst_query:.2f} ms")
+            print(f"worst pause to complete page: {SEARCH_DEBOUNCE_MS + worst_query:.2f} ms "
+                  f"(debounce {SEARCH_DEBOUNCE_MS} ms + query)")
+        finally:
+            database.close_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: memory of query results.
+
+Loads ROWS students, teachers and income records and measures, with
+tracemalloc, the memory held by the result lists: the record types from
+backend.records against the per-row dictionaries the query functions used
+to build (students and teachers) and plain tuples (income). The row values
+(strings, numbers) are counted in both cases.
+
+Run from the project root:
+    python -m benchmarks.bench_records
+"""
+import gc
+import os
+import random
+import tempfile
+import tracemalloc
+
+from backend import database
+from backend.init_db import init_database
+
+ROWS = 100000
+
+
+def populate():
+    """Adds ROWS students (four installments each), teachers and income records."""
+    rng = random.Random(17)
+    dates = ["2024-09-01", "2024-10-01", "2024-11-01", "2024-12-01"]
+    database.add_students_bulk(
+        (f"student {i}", f"{29000000000000 + i}", rng.choice(["KG1", "KG2"]), "ذكر", "0100000000", "",
+         [str(rng.randint(100, 900)) for _ in dates], dates)
+        for i in range(ROWS)
+    )
+    database.add_teachers_bulk(
+        (f"teacher {i}", f"{28000000000000 + i}", "KG1", "أنثى", "0110000000", "") for i in range(ROWS)
+    )
+    database.add_income_bulk((f"income {i}", rng.randint(10, 5000), "2024-01-01") for i in range(ROWS))
+
+
+def measure(load):
+    """Returns the bytes still allocated by load()'s result."""
+    database.clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = load()
+    # Only count what the caller holds, not the query cache's own reference
+    database.clear_cache()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del rows
+    return size
+
+
+def as_dicts(records):
+    """The per-row dictionaries built before the record types."""
+    return [dict(zip(record._fields, record)) for record in records]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"))
+        try:
+            init_database()
+            populate()
+            cases = [
+                ("students", "dict", lambda: as_dicts(database.get_all_students()), database.get_all_students),
+                ("teachers", "dict", lambda: as_dicts(database.get_all_teachers()), database.get_all_teachers),
+                ("income", "tuple", lambda: [tuple(row) for row in database.get_all_income()], database.get_all_income),
+            ]
+            results = [(name, baseline, measure(before), measure(after)) for name, baseline, before, after in cases]
+        finally:
+            database.close_connections()
+
+    print(f"Memory held per {ROWS} rows (tracemalloc)")
+    print(f"{'rows':<10} {'before':>8} {'before MB':>10} {'records MB':>11} {'saved MB':>9} {'bytes/row':>10}")
+    for name, baseline, before, after in results:
+        saved = before - after
+        print(f"{name:<10} {baseline:>8} {before / 1e6:>10.1f} {after / 1e6:>11.1f} {saved / 1e6:>9.1f} {saved / ROWS:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: name search.
+
+Compares a LIKE '%query%' scan of the students table (what search_people did
+before the full-text index) with the FTS5 prefix search used by
+search_people and search_text, on a database with 100k students. The query
+cache is cleared before every call, so each one reads the database.
+
+Run from the project root:
+    python -m benchmarks.bench_search
+"""
+import os
+import random
+import tempfile
+import time
+
+from backend import database
+from backend.init_db import init_database
+
+STUDENTS = 100000
+REPEATS = 20
+QUERIES = ["احمد", "محم", "فاطمه", "عبد الر", "يوسف خ"]
+
+FIRST_NAMES = ["أحمد", "محمد", "محمود", "فاطمة", "مريم", "يوسف", "عبد الرحمن", "خالد", "سارة", "نور",
+               "عمر", "ليلى", "حسن", "زينب", "علي", "هدى", "مصطفى", "ياسمين", "إبراهيم", "رقية"]
+TERMS = ["التمهيدي", "الاول المستوى", "الثاني المستوى", "الصغار فصل"]
+
+
+def populate():
+    """Adds STUDENTS students with random three-part Arabic names."""
+    rng = random.Random(7)
+    result = database.add_students_bulk(
+        (" ".join(rng.choice(FIRST_NAMES) for _ in range(3)), str(i), rng.choice(TERMS), "", "", "", [], [])
+        for i in range(STUDENTS)
+    )
+    assert not result["failed"]
+
+
+def like_search(query):
+    """The previous approach: a substring scan of every name (count plus first page)."""
+    with database.get_connection_manager().reader() as conn:
+        total = conn.execute("SELECT COUNT(*) FROM students WHERE name LIKE ?", (f"%{query}%",)).fetchone()[0]
+        rows = conn.execute(
+            "SELECT id, name FROM students WHERE name LIKE ? ORDER BY id LIMIT 50", (f"%{query}%",)
+        ).fetchall()
+    return rows, total
+
+
+def average_ms(func, query):
+    """Returns the mean time of REPEATS uncached calls, in milliseconds."""
+    elapsed = 0.0
+    for _ in range(REPEATS):
+        database.clear_cache()
+        started = time.perf_counter()
+        func(query)
+        elapsed += time.perf_counter() - started
+    return elapsed / REPEATS * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"))
+        try:
+            init_database()
+            started = time.perf_counter()
+            populate()
+            print(f"{STUDENTS} students indexed in {time.perf_counter() - started:.1f} s")
+            print(f"{'query':<12} {'LIKE scan':>10} {'search_text':>12} {'search_people':>14} {'matches':>8}")
+            for query in QUERIES:
+                like_ms = average_ms(like_search, query)
+                fts_ms = average_ms(lambda q: database.search_text(q, kinds=["students"], limit=50), query)
+                people_ms = average_ms(lambda q: database.search_people("students", q, limit=50), query)
+                total = database.search_people("students", query, limit=1)[1]
+                print(f"{query:<12} {like_ms:>8.2f}ms {fts_ms:>10.2f}ms {people_ms:>12.2f}ms {total:>8}")
+        finally:
+            database.close_connections()
+
+
+if __name__ == "__main__":
+    main()
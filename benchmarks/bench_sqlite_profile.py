@@ -0,0 +1,92 @@
+"""
+Benchmark: SQLite performance profile.
+
+Compares SQLite's defaults (rollback journal, synchronous=FULL) with the
+connection profile applied by backend.connection (WAL, synchronous=NORMAL,
+cache_size, mmap_size, temp_store, busy_timeout) for:
+
+- single-row inserts, each committed on its own (like add_income)
+- a mixed workload: one writer inserting while reader threads query
+
+Run from the project root:
+    python -m benchmarks.bench_sqlite_profile
+"""
+import os
+import tempfile
+import threading
+import time
+
+from backend import database
+from backend.connection import DEFAULT_PROFILE, LEGACY_PROFILE
+from backend.init_db import init_database
+
+INSERTS = 500
+MIXED_SECONDS = 3.0
+READER_THREADS = 3
+
+
+def bench_single_inserts():
+    """Returns committed inserts per second."""
+    started = time.perf_counter()
+    for i in range(INSERTS):
+        database.add_income(f"income {i}", i % 500 + 1, "2024-01-01")
+    return INSERTS / (time.perf_counter() - started)
+
+
+def bench_mixed():
+    """Returns (writes per second, reads per second) for a mixed workload."""
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    lock = threading.Lock()
+
+    def reader():
+        reads = 0
+        while not stop.is_set():
+            database.get_all_income()
+            database.get_total_teacher_salaries()
+            reads += 1
+        with lock:
+            counts["reads"] += reads
+
+    def writer():
+        writes = 0
+        while not stop.is_set():
+            database.add_general_expense(f"expense {writes}", 10, "2024-01-01")
+            writes += 1
+        with lock:
+            counts["writes"] += writes
+
+    threads = [threading.Thread(target=reader) for _ in range(READER_THREADS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(MIXED_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return counts["writes"] / MIXED_SECONDS, counts["reads"] / MIXED_SECONDS
+
+
+def run_profile(label, profile):
+    """Runs both benchmarks on a fresh database with the given profile."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"), profile=profile)
+        try:
+            init_database()
+            inserts = bench_single_inserts()
+            writes, reads = bench_mixed()
+        finally:
+            database.close_connections()
+    print(f"{label:<10} {inserts:>14.0f} {writes:>14.0f} {reads:>14.0f}")
+    return inserts, writes, reads
+
+
+def main():
+    print(f"{'profile':<10} {'inserts/s':>14} {'mixed writes/s':>14} {'mixed reads/s':>14}")
+    before = run_profile("legacy", LEGACY_PROFILE)
+    after = run_profile("tuned", DEFAULT_PROFILE)
+    print(f"{'speedup':<10} " + " ".join(f"{a / b if b else 0:>13.1f}x" for a, b in zip(after, before)))
+
+
+if __name__ == "__main__":
+    main()
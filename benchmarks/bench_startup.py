@@ -0,0 +1,118 @@
+"""
+Benchmark: schema bootstrap at startup.
+
+Compares the old startup on an existing database (init_database opening a
+connection per table for seven CREATE TABLE IF NOT EXISTS statements, then
+get_setting, get_all_income and get_all_general_expenses each re-running
+their table's DDL in a write transaction) with the current one: a single
+schema version read, then the same queries without DDL. Also times an
+uncached get_setting, which used to pay for the DDL on every call.
+
+Run from the project root:
+    python -m benchmarks.bench_startup
+"""
+import os
+import sqlite3
+import tempfile
+import time
+
+from backend import database
+from backend.init_db import init_database
+
+REPEATS = 20
+SETTING_CALLS = 1000
+
+# The seven tables created by the old init_database, one connection each
+LEGACY_TABLES = [
+    "students (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, nid TEXT, term TEXT, gender TEXT,"
+    " phone1 TEXT, phone2 TEXT, fee1 TEXT, fee2 TEXT, fee3 TEXT, fee4 TEXT,"
+    " fee1_date TEXT, fee2_date TEXT, fee3_date TEXT, fee4_date TEXT)",
+    "general_expenses (id INTEGER PRIMARY KEY AUTOINCREMENT, description TEXT, amount REAL, date TEXT)",
+    "teachers (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, nid TEXT, term TEXT, gender TEXT,"
+    " phone1 TEXT, phone2 TEXT)",
+    "teacher_salaries (id INTEGER PRIMARY KEY AUTOINCREMENT, teacher_id INTEGER, amount REAL, date TEXT)",
+    "income (id INTEGER PRIMARY KEY AUTOINCREMENT, description TEXT, amount REAL, date TEXT)",
+    "activities (id INTEGER PRIMARY KEY AUTOINCREMENT, description TEXT, activity_date TEXT)",
+    "settings (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+
+def ensure_table(table):
+    """The per-call DDL the read functions used to run (through the writer)."""
+    definition = next(d for d in LEGACY_TABLES if d.startswith(table + " "))
+    with database.get_connection_manager().writer() as conn:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {definition}")
+
+
+def first_reads(ensure=None):
+    """The reads of the first screens, optionally preceded by their old DDL."""
+    for table, read in (("settings", lambda: database.get_setting("local_backup_path")),
+                        ("income", database.get_all_income),
+                        ("general_expenses", database.get_all_general_expenses)):
+        if ensure:
+            ensure(table)
+        read()
+
+
+def legacy_startup(path):
+    """The previous startup: seven connections with DDL, then DDL before each first read."""
+    database.set_database_path(path)
+    for definition in LEGACY_TABLES:
+        conn = sqlite3.connect(path)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {definition}")
+        conn.commit()
+        conn.close()
+    first_reads(ensure_table)
+
+
+def current_startup(path):
+    """The current startup: one schema version check, then the reads."""
+    database.set_database_path(path)
+    init_database()
+    first_reads()
+
+
+def best_of(func, *args):
+    """Returns the fastest of REPEATS runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def setting_calls(ensure):
+    """Returns microseconds per uncached get_setting call."""
+    started = time.perf_counter()
+    for _ in range(SETTING_CALLS):
+        database.clear_cache()
+        if ensure:
+            ensure_table("settings")
+        database.get_setting("local_backup_path")
+    return (time.perf_counter() - started) / SETTING_CALLS * 1e6
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        try:
+            database.set_database_path(path)
+            init_database()
+            database.add_income_bulk((f"income {i}", 100, "2024-01-01") for i in range(1000))
+            database.save_setting("local_backup_path", tmp)
+
+            legacy_ms = best_of(legacy_startup, path)
+            current_ms = best_of(current_startup, path)
+            legacy_us = setting_calls(ensure=True)
+            current_us = setting_calls(ensure=False)
+        finally:
+            database.close_connections()
+
+    print(f"{'':<28} {'before':>10} {'after':>10} {'speedup':>8}")
+    print(f"{'startup (ms)':<28} {legacy_ms:>10.2f} {current_ms:>10.2f} {legacy_ms / current_ms:>7.1f}x")
+    print(f"{'uncached get_setting (us)':<28} {legacy_us:>10.1f} {current_us:>10.1f} {legacy_us / current_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: shaping Arabic text for display.
+
+Times the texts of a list render (ROWS rows of a term and a two-part label,
+as on the statistics and activities lists) shaped the way the pages used to
+(arabic_reshaper.reshape and bidi's get_display on every call) against
+shape_texts, which shapes each distinct text once per process. The cached
+case is timed on a second render, as when a page is opened again.
+
+Needs arabic-reshaper and python-bidi. Run from the project root:
+    python -m benchmarks.bench_text_shaping
+"""
+import time
+
+import arabic_reshaper
+from bidi.algorithm import get_display
+
+from frontend.person_management.constants import ACADEMIC_LEVELS
+from frontend.text_shaping import clear_shape_cache, get_shape_cache_info, shape_texts
+
+ROWS = [100, 1000, 10000]
+# Distinct descriptions among the rows (activities repeat: trips, parties, ...)
+DISTINCT = 50
+
+
+def make_texts(count):
+    """Returns the texts of a list render of count rows."""
+    texts = []
+    for i in range(count):
+        texts.append(ACADEMIC_LEVELS[i % len(ACADEMIC_LEVELS)])
+        texts.append(f"الوصف: رحلة رقم {i % DISTINCT}")
+    return texts
+
+
+def legacy_shape(texts):
+    """The previous per-call shaping of each page's arabic()."""
+    return [get_display(arabic_reshaper.reshape(text)) for text in texts]
+
+
+def timed_ms(func, texts):
+    started = time.perf_counter()
+    func(texts)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    print(f"{'rows':>6} {'before ms':>10} {'first ms':>9} {'again ms':>9} {'speedup':>8}")
+    for count in ROWS:
+        texts = make_texts(count)
+        clear_shape_cache()
+        legacy_ms = timed_ms(legacy_shape, texts)
+        first_ms = timed_ms(shape_texts, texts)
+        again_ms = timed_ms(shape_texts, texts)
+        assert shape_texts(texts) == legacy_shape(texts)
+        print(f"{count:>6} {legacy_ms:>10.2f} {first_ms:>9.2f} {again_ms:>9.3f} {legacy_ms / again_ms:>7.0f}x")
+    print(get_shape_cache_info())
+
+
+if __name__ == "__main__":
+    main()
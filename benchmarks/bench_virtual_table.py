@@ -0,0 +1,108 @@
+"""
+Benchmark: rendering search results.
+
+Times showing ROWS student results the way the search page used to (a frame,
+three labels, an actions frame and three buttons per row in a scrollable
+frame, all destroyed before the next results) against the VirtualTable it
+uses now, which only creates widgets for the rows in view. Each case renders
+the results twice (a search, then a second search replacing it) and counts
+the Tk widgets alive afterwards.
+
+Needs a display. Run from the project root:
+    python -m benchmarks.bench_virtual_table
+"""
+import time
+
+import customtkinter as ctk
+
+from frontend.person_management.constants import (
+    ACTION_BUTTON_STYLE, DELETE_BUTTON_STYLE, TABLE_HEADER_STYLE, TABLE_ROW_STYLE
+)
+from frontend.widgets import VirtualTable, Column, Action
+
+ROWS = [100, 1000, 10000]
+
+
+def make_students(count):
+    """Search results as the table receives them (records with dict-style access)."""
+    return [{"id": i, "name": f"student {i} name", "term": "KG1"} for i in range(count)]
+
+
+def count_widgets(widget):
+    """Counts widget and all its descendants."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def legacy_render(container, students):
+    """The per-row widgets of the previous SearchPage.display_student_results."""
+    for widget in container.winfo_children():
+        widget.destroy()
+    for i, student in enumerate(students, start=1):
+        row_frame = ctk.CTkFrame(container)
+        container.grid_rowconfigure(i, weight=1)
+        row_frame.grid(row=i, column=0, sticky="ew", pady=2)
+        for column, weight in enumerate((0, 1, 2, 0)):
+            row_frame.grid_columnconfigure(column, weight=weight)
+        ctk.CTkLabel(row_frame, text=str(i), **TABLE_ROW_STYLE).grid(row=0, column=3, padx=5, sticky="nsew")
+        ctk.CTkLabel(row_frame, text=student["name"], **TABLE_ROW_STYLE).grid(row=0, column=2, padx=5, sticky="nsew")
+        ctk.CTkLabel(row_frame, text=student["term"], **TABLE_ROW_STYLE).grid(row=0, column=1, padx=5, sticky="nsew")
+        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        actions_frame.grid(row=0, column=0, padx=5, sticky="w")
+        for text, style in (("عرض", ACTION_BUTTON_STYLE), ("تعديل", ACTION_BUTTON_STYLE), ("حذف", DELETE_BUTTON_STYLE)):
+            ctk.CTkButton(actions_frame, text=text, command=lambda s=student: None, **style).pack(side="left", padx=2)
+
+
+def bench_legacy(root, students):
+    """Returns (seconds for two renders, widgets alive) with per-row widgets."""
+    container = ctk.CTkScrollableFrame(root, height=385)
+    container.pack(fill="both", expand=True)
+    container.grid_columnconfigure(0, weight=1)
+    started = time.perf_counter()
+    for _ in range(2):
+        legacy_render(container, students)
+        root.update()
+    elapsed = time.perf_counter() - started
+    widgets = count_widgets(container)
+    container.destroy()
+    return elapsed, widgets
+
+
+def bench_virtual(root, students):
+    """Returns (seconds for two renders, widgets alive) with the VirtualTable."""
+    columns = [
+        Column("الفصل", 1, lambda index, s: s["term"]),
+        Column("الاسم", 2, lambda index, s: s["name"]),
+        Column("الرقم التسلسلي", 0, lambda index, s: str(index + 1)),
+    ]
+    actions = [Action("عرض", lambda s: None, ACTION_BUTTON_STYLE),
+               Action("تعديل", lambda s: None, ACTION_BUTTON_STYLE),
+               Action("حذف", lambda s: None, DELETE_BUTTON_STYLE)]
+    started = time.perf_counter()
+    table = VirtualTable(root, columns, actions, header_style=TABLE_HEADER_STYLE,
+                         row_style=TABLE_ROW_STYLE, height=385)
+    table.pack(fill="both", expand=True)
+    for _ in range(2):
+        table.set_rows(students)
+        root.update()
+    elapsed = time.perf_counter() - started
+    widgets = count_widgets(table)
+    table.destroy()
+    return elapsed, widgets
+
+
+def main():
+    root = ctk.CTk()
+    root.geometry("900x500")
+    root.update()
+    print(f"{'rows':>6} {'before s':>10} {'after s':>10} {'speedup':>8} {'widgets before':>15} {'after':>6}")
+    for count in ROWS:
+        students = make_students(count)
+        legacy_s, legacy_widgets = bench_legacy(root, students)
+        virtual_s, virtual_widgets = bench_virtual(root, students)
+        print(f"{count:>6} {legacy_s:>10.2f} {virtual_s:>10.3f} {legacy_s / virtual_s:>7.0f}x"
+              f" {legacy_widgets:>15} {virtual_widgets:>6}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: group-commit write queue.
+
+Registers REGISTRATIONS students one after another (each with three fee
+installments, like the registration form), first with add_student committing
+every registration on its own, then through database.queue_write, which
+commits them in groups. Runs with the default profile (WAL,
+synchronous=NORMAL) and with synchronous=FULL, where every commit is fsynced.
+
+Run from the project root:
+    python -m benchmarks.bench_write_queue
+"""
+import os
+import tempfile
+import time
+
+from backend import database
+from backend.connection import DEFAULT_PROFILE
+from backend.init_db import init_database
+
+REGISTRATIONS = 1000
+
+FULL_SYNC_PROFILE = dict(DEFAULT_PROFILE, synchronous="FULL")
+
+
+def registration(i):
+    """Arguments of add_student for the i-th registration."""
+    return (f"student {i}", f"{29000000000000 + i}", "KG1", "ذكر", "0100000000", "",
+            ["500", "250", "250"], ["2024-09-01", "2024-10-01", "2024-11-01"])
+
+
+def bench_direct():
+    """Returns registrations per second, each committed on its own."""
+    started = time.perf_counter()
+    for i in range(REGISTRATIONS):
+        database.add_student(*registration(i))
+    return REGISTRATIONS / (time.perf_counter() - started)
+
+
+def bench_queued():
+    """Returns registrations per second through the write queue (until all are committed)."""
+    started = time.perf_counter()
+    futures = [database.queue_write(database.add_student, *registration(i)) for i in range(REGISTRATIONS)]
+    for future in futures:
+        future.result()
+    return REGISTRATIONS / (time.perf_counter() - started)
+
+
+def run(label, profile, bench):
+    """Runs one benchmark on a fresh database and checks every row was saved."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database.set_database_path(os.path.join(tmp, "bench.db"), profile=profile)
+        try:
+            init_database()
+            rate = bench()
+            database.flush_writes()
+            saved = database.get_people_counts()["students"]
+            groups = database.get_write_queue_stats()["groups"]
+        finally:
+            database.close_write_queue()
+            database.close_connections()
+    assert saved == REGISTRATIONS, f"{saved} of {REGISTRATIONS} registrations saved"
+    return rate, groups
+
+
+def main():
+    print(f"{REGISTRATIONS} sequential registrations")
+    print(f"{'profile':<20} {'direct/s':>10} {'queued/s':>10} {'speedup':>8}")
+    for label, profile in (("synchronous=NORMAL", DEFAULT_PROFILE), ("synchronous=FULL", FULL_SYNC_PROFILE)):
+        direct, _ = run(label, profile, bench_direct)
+        before = database.get_write_queue_stats()["groups"]
+        queued, groups = run(label, profile, bench_queued)
+        print(f"{label:<20} {direct:>10.0f} {queued:>10.0f} {queued / direct:>7.1f}x"
+              f"   ({groups - before} group commits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Background work for the UI: runs calls off the Tk main thread and hands their
+progress and results back to it.
+
+Tk widgets may only be touched from the main thread. Work started here runs
+on other threads and never calls into the UI itself: its progress reports
+and its result are put on a single queue, which the main thread drains with
+after() and turns into callbacks. Callbacks for a widget that was destroyed
+in the meantime (the user already moved to another page) are dropped.
+
+- run_in_background() runs a database call on the backend database worker
+  (one thread, calls run in submission order).
+- run_task() runs a long task (a backup, an upload, ...) on its own thread.
+  The task receives a TaskContext to report progress, call back into the UI
+  and check its CancellationToken.
+- when_done() delivers the result of a future started elsewhere, e.g. a
+  write queued with backend.database.queue_write.
+- call_in_ui() runs a callback on the main thread, e.g. a settings observer
+  that is called on whatever thread noticed the change.
+
+All but call_in_ui must be called from the main thread.
+"""
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import Future
+
+from customtkinter import CTkLabel
+
+from backend.worker import submit
+
+# How often the main thread checks for finished calls while any are pending
+# (it bounds the delay before results show, e.g. while searching as you type)
+POLL_INTERVAL_MS = 15
+
+# Placeholder shown while a page's data is loading ("Loading...")
+LOADING_TEXT = "جاري التحميل..."
+
+# (widget, callback, args, finished): callback(*args) runs on the main thread;
+# finished marks the last event of a call
+_events = queue.Queue()
+_pending = 0
+_polling = False
+
+# --- Cancellation ---
+
+class TaskCancelled(Exception):
+    """Raised inside a task whose token has been cancelled."""
+
+
+class CancellationToken:
+    """Flag shared between the UI and a task, set when the task should stop.
+
+    Tasks check it at convenient points (between chunks, pages, ...); it does
+    not interrupt a call that is already blocking.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Asks the task to stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raises TaskCancelled if cancel() has been called."""
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+class TaskContext:
+    """Passed as the first argument to functions run by run_task().
+
+    Attributes:
+        token: The task's CancellationToken.
+    """
+
+    def __init__(self, widget, token: CancellationToken, on_progress=None):
+        self._widget = widget
+        self._on_progress = on_progress
+        self.token = token
+
+    def report_progress(self, fraction: float, message: str = None):
+        """Sends progress (0.0-1.0, optional message) to the task's on_progress callback."""
+        if self._on_progress:
+            _post(self._widget, self._on_progress, fraction, message)
+
+    def call_in_ui(self, func, *args):
+        """Runs func(*args) on the main thread (does not wait for it)."""
+        _post(self._widget, func, *args)
+
+    def check_cancelled(self):
+        """Raises TaskCancelled if the task has been cancelled."""
+        self.token.raise_if_cancelled()
+
+
+class Task:
+    """Handle of a task started by run_task().
+
+    Attributes:
+        future: Future of the task function's result.
+        token: The task's CancellationToken.
+    """
+
+    def __init__(self, future: Future, token: CancellationToken):
+        self.future = future
+        self.token = token
+
+    def cancel(self):
+        """Asks the task to stop; its on_cancel callback runs instead of on_success."""
+        self.token.cancel()
+        self.future.cancel()
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+# --- Starting Work ---
+
+def run_in_background(widget, func, *args, on_success=None, on_error=None) -> Future:
+    """Runs func(*args) on the database worker thread.
+
+    Args:
+        widget: The widget the result is for; callbacks are skipped if it
+            has been destroyed by the time the call finishes.
+        func: The function to run. It must not touch any Tk widget.
+        *args: Arguments for func.
+        on_success: Called on the main thread with func's return value.
+        on_error: Called on the main thread with the exception func raised.
+            When omitted, the error is printed.
+
+    Returns:
+        The Future of the call.
+    """
+    future = submit(func, *args)
+    _track(widget, future, None, on_success, on_error, None)
+    return future
+
+def run_task(widget, func, *args, on_success=None, on_error=None, on_progress=None,
+             on_cancel=None, token: CancellationToken = None) -> Task:
+    """Runs func(context, *args) on a new background thread.
+
+    Args:
+        widget: The widget the callbacks are for; they are skipped if it has
+            been destroyed.
+        func: The task. It receives a TaskContext first and must not touch
+            any Tk widget directly (use context.call_in_ui for that).
+        *args: Further arguments for func.
+        on_success: Called on the main thread with func's return value.
+        on_error: Called on the main thread with the exception func raised.
+            When omitted, the error is printed.
+        on_progress: Called on the main thread with (fraction, message) for
+            each context.report_progress().
+        on_cancel: Called on the main thread when the task was cancelled
+            (its token was set, or it raised TaskCancelled).
+        token: Token to use; a new one is created by default.
+
+    Returns:
+        A Task handle that can be used to cancel it.
+    """
+    token = token or CancellationToken()
+    context = TaskContext(widget, token, on_progress)
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(context, *args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    # A daemon thread, so a stuck network call cannot keep the application from exiting
+    _track(widget, future, token, on_success, on_error, on_cancel)
+    threading.Thread(target=run, name="ui-task", daemon=True).start()
+    return Task(future, token)
+
+def when_done(widget, future: Future, on_success=None, on_error=None) -> Future:
+    """Calls on_success or on_error on the main thread once future finishes.
+
+    Args:
+        widget: The widget the result is for; callbacks are skipped if it
+            has been destroyed.
+        future: A future completed on another thread.
+        on_success: Called with the future's result.
+        on_error: Called with the future's exception. When omitted, the
+            error is printed.
+
+    Returns:
+        The same future.
+    """
+    _track(widget, future, None, on_success, on_error, None)
+    return future
+
+def call_in_ui(widget, func, *args):
+    """Runs func(*args) on the main thread; may be called from any thread.
+
+    On the main thread func runs right away. From another thread it is
+    queued and runs at the main thread's next drain, which happens while
+    any background call is pending; a call made from inside a function run
+    by run_in_background or run_task therefore runs before that call's own
+    callbacks. func is skipped if widget has been destroyed.
+
+    Args:
+        widget: The widget func is for.
+        func: The function to run; it may touch Tk widgets.
+        *args: Arguments for func.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        _post(widget, func, *args)
+    elif _widget_exists(widget):
+        func(*args)
+
+def _track(widget, future, token, on_success, on_error, on_cancel):
+    """Queues the completion callbacks of a future for the main thread."""
+    global _pending
+    _pending += 1
+    future.add_done_callback(
+        lambda done: _post(widget, _complete, done, token, on_success, on_error, on_cancel, finished=True)
+    )
+    _start_polling(widget)
+
+def _complete(future, token, on_success, on_error, on_cancel):
+    """Runs the callback matching how a call ended (on the main thread)."""
+    if future.cancelled() or (token is not None and token.cancelled):
+        if on_cancel:
+            on_cancel()
+        return
+    error = future.exception()
+    if isinstance(error, TaskCancelled):
+        if on_cancel:
+            on_cancel()
+    elif error is not None:
+        if on_error:
+            on_error(error)
+        else:
+            print(f"Error in background call: {error}")
+    elif on_success:
+        on_success(future.result())
+
+# --- Main Thread Delivery ---
+
+def _post(widget, callback, *args, finished=False):
+    """Queues callback(*args) to run on the main thread (safe from any thread)."""
+    _events.put((widget, callback, args, finished))
+
+def _start_polling(widget):
+    """Schedules the queue drain on the root window, unless it is already scheduled."""
+    global _polling
+    if not _polling:
+        _polling = True
+        # after() on the root: the widget itself may be destroyed before it runs
+        root = widget._root()
+        root.after(POLL_INTERVAL_MS, _drain, root)
+
+def _drain(root):
+    """Runs every queued callback (on the main thread)."""
+    global _pending, _polling
+    while True:
+        try:
+            widget, callback, args, finished = _events.get_nowait()
+        except queue.Empty:
+            break
+        if finished:
+            _pending -= 1
+        if not _widget_exists(widget):
+            continue
+        try:
+            callback(*args)
+        except Exception as e:
+            # Keep draining: one failing page must not stall the others
+            print(f"Error handling background result: {e}")
+
+    if _pending:
+        root.after(POLL_INTERVAL_MS, _drain, root)
+    else:
+        _polling = False
+
+def _widget_exists(widget) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
+# --- Widgets ---
+
+def create_loading_label(parent, text: str = LOADING_TEXT) -> CTkLabel:
+    """Creates (but does not place) a placeholder label for data still loading."""
+    return CTkLabel(parent, text=text, font=("Arial", 14), text_color="#777")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from backend.dates import today_iso
 from .models import FeesModel
 from .utils import validate_amount, validate_date, show_error_message, show_confirmation_message
 
@@ -39,8 +39,8 @@ class FeesController:
             show_error_message("المبلغ يجب أن يكون رقمًا صحيحًا أو عشريًا")
             return False
 
-        # Get current date in YYYY-MM-DD format
-        date = datetime.now().strftime("%Y-%m-%d")
+        # Get current date in storage (YYYY-MM-DD) format
+        date = today_iso()
         # Add expense to the database
         self.model.add_expense(description, amount, date)
         return True
@@ -68,8 +68,8 @@ class FeesController:
             show_error_message("المبلغ يجب أن يكون رقمًا صحيحًا أو عشريًا")
             return False
 
-        # Get current date in YYYY-MM-DD format
-        date = datetime.now().strftime("%Y-%m-%d")
+        # Get current date in storage (YYYY-MM-DD) format
+        date = today_iso()
         # Add income to the database
         self.model.add_income(description, amount, date)
         return True
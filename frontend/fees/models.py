@@ -9,11 +9,12 @@ from backend.database import (
     delete_expense,
     update_expense
 )
+from backend.money import Money
 
 class FeesModel:
     """Represents the data access layer for fees-related operations."""
     @staticmethod
-    def add_expense(description: str, amount: float, date: str) -> None:
+    def add_expense(description: str, amount: Money, date: str) -> None:
         """Adds a new general expense record to the database.
 
         Args:
@@ -45,7 +46,7 @@ class FeesModel:
         delete_expense(expense_id)
 
     @staticmethod
-    def update_expense(expense_id: int, description: str, amount: float, date: str) -> None:
+    def update_expense(expense_id: int, description: str, amount: Money, date: str) -> None:
         """Updates an existing general expense record in the database.
 
         Args:
@@ -58,7 +59,7 @@ class FeesModel:
         update_expense(expense_id, description, amount, date)
 
     @staticmethod
-    def add_income(description: str, amount: float, date: str) -> None:
+    def add_income(description: str, amount: Money, date: str) -> None:
         """Adds a new income record to the database.
 
         Args:
@@ -90,7 +91,7 @@ class FeesModel:
         delete_income(income_id)
 
     @staticmethod
-    def update_income(income_id: int, description: str, amount: float, date: str) -> None:
+    def update_income(income_id: int, description: str, amount: Money, date: str) -> None:
         """Updates an existing income record in the database.
 
         Args:
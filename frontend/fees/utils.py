@@ -3,21 +3,22 @@ from datetime import datetime
 from tkinter import messagebox
 import customtkinter as ctk
 
-def validate_amount(amount_str: str) -> tuple[bool, float]:
-    """Validates if a string can be converted to a float and returns the result.
+from backend.money import Money
+
+def validate_amount(amount_str: str) -> tuple[bool, Money]:
+    """Validates if a string is a valid amount and returns it as Money.
 
     Args:
         amount_str: The string to validate.
 
     Returns:
         A tuple containing a boolean (True if valid, False otherwise) and the
-        converted float amount (or 0.0 if invalid).
+        parsed Money amount (or Money(0) if invalid).
     """
     try:
-        amount = float(amount_str)
-        return True, amount
+        return True, Money.parse(amount_str)
     except ValueError:
-        return False, 0
+        return False, Money(0)
 
 def validate_date(date_str: str) -> bool:
     """Validates if a string matches the date format DD-MM-YYYY.
@@ -55,7 +56,7 @@ def show_confirmation_message(message: str, parent=None) -> bool:
     """
     return messagebox.askyesno("Confirmation", message, parent=parent)
 
-def create_description_window(parent, title: str, description: str, amount: float, date: str, 
+def create_description_window(parent, title: str, description: str, amount, date: str, 
                             on_save=None, on_cancel=None):
     """Creates and displays a reusable Toplevel window for viewing/editing details.
 
@@ -7,6 +7,8 @@ from customtkinter import *
 from .controllers import FeesController
 from .utils import create_description_window
 from frontend.person_management.utils import DateEntry
+from frontend.background import run_in_background, create_loading_label
+from frontend.widgets import KeyedList
 
 class FeesPage:
     """Main fees management page class.
@@ -132,6 +134,15 @@ class FeesPage:
         self.expense_frame.grid_columnconfigure(1, weight=1)
         self.expense_frame.grid_columnconfigure(2, weight=2)
         self.expense_frame.grid_columnconfigure(3, weight=1)
+        self._create_table_header(self.expense_frame, ("#2D8CFF", "#4CAF50"))
+
+        # Expense rows, patched by record id when the records are reloaded
+        self.expense_rows = KeyedList(
+            create=lambda record: self._create_record_row(
+                self.expense_frame, record, self.confirm_delete_expense, self.show_full_description),
+            place=self._place_record_row
+        )
+        self.expense_placeholder = None
 
     def setup_income_section(self):
         """Set up the income input and display section.
@@ -191,6 +202,15 @@ class FeesPage:
         self.income_frame.grid_columnconfigure(1, weight=1)
         self.income_frame.grid_columnconfigure(2, weight=2)
         self.income_frame.grid_columnconfigure(3, weight=1)
+        self._create_table_header(self.income_frame, ("#4CAF50", "#2D8CFF"))
+
+        # Income rows, patched by record id when the records are reloaded
+        self.income_rows = KeyedList(
+            create=lambda record: self._create_record_row(
+                self.income_frame, record, self.confirm_delete_income, self.show_full_income_description),
+            place=self._place_record_row
+        )
+        self.income_placeholder = None
 
     def setup_summary_section(self):
         """Set up the financial summary section.
@@ -209,7 +229,7 @@ class FeesPage:
         """Handle adding a new expense record.
         
         Validates input and adds the expense to the database if valid.
-        Updates the display and summary after successful addition.
+        Reloads the table after a successful addition; showing it updates the summary.
         """
         description = self.description_entry.get("0.0", "end").strip()
         amount_str = self.amount_entry.get().strip()
@@ -218,13 +238,12 @@ class FeesPage:
             self.description_entry.delete("0.0", "end")
             self.amount_entry.delete(0, "end")
             self.load_expenses()
-            self.update_summary()
 
     def add_income(self):
         """Handle adding a new income record.
         
         Validates input and adds the income to the database if valid.
-        Updates the display and summary after successful addition.
+        Reloads the table after a successful addition; showing it updates the summary.
         """
         description = self.income_description_entry.get("0.0", "end").strip()
         amount_str = self.income_amount_entry.get().strip()
@@ -233,133 +252,137 @@ class FeesPage:
             self.income_description_entry.delete("0.0", "end")
             self.income_amount_entry.delete(0, "end")
             self.load_income()
-            self.update_summary()
+
+    def refresh(self):
+        """Reload both tables (and the summary), e.g. when the page is shown again after changes."""
+        self.load_expenses()
+        self.load_income()
 
     def load_expenses(self):
-        """Load and display all expense records in the table.
+        """Load the expense records and show them in the table.
         
-        Creates a table with headers and populates it with expense data.
-        Each row includes delete button, date, description, and amount.
+        The records are read in the background. Rows already shown stay until
+        the new records arrive; then only the rows of added, deleted or edited
+        records change.
         """
-        # Clear existing table contents
-        for widget in self.expense_frame.winfo_children():
-            widget.destroy()
+        if not len(self.expense_rows) and self.expense_placeholder is None:
+            # Nothing shown yet: a placeholder row shows until the records are loaded
+            self.expense_placeholder = create_loading_label(self.expense_frame)
+            self.expense_placeholder.grid(row=1, column=0, columnspan=4, pady=10)
+        run_in_background(self.expense_frame, self.controller.get_all_expenses, on_success=self._show_expenses)
 
-        # Create table headers
-        headers = ["الإجراءات", "التاريخ", "الوصف", "المبلغ"]
-        for i, h in enumerate(headers):
-            CTkLabel(self.expense_frame, 
-                    text=h, 
-                    font=("Arial", 15, "bold"),
-                    text_color=("#FFFFFF", "#232323"),
-                    corner_radius=8,
-                    fg_color=("#2D8CFF", "#4CAF50"),
-                    height=40,
-                    width=120,
-                    anchor="center", justify="center").grid(
-                        row=0, column=i, padx=4, pady=4, sticky="ew")
-
-        # Load and display expense records
-        expenses = self.controller.get_all_expenses()
-        for row_index, (expense_id, desc, amount, date) in enumerate(expenses, start=1):
-            # Delete button
-            delete_button = CTkButton(
-                self.expense_frame,
-                text="✖",
-                width=30,
-                height=30,
-                fg_color="red",
-                text_color="white",
-                command=lambda eid=expense_id: self.confirm_delete_expense(eid)
-            )
-            delete_button.grid(row=row_index, column=0, padx=4, pady=4, sticky="ew")
-
-            # Date column
-            CTkLabel(self.expense_frame, text=date, font=("Arial", 13), anchor="e", justify="right").grid(
-                row=row_index, column=1, sticky="ew", padx=4, pady=4)
-            
-            # Description column (clickable for full view)
-            desc_label = CTkLabel(
-                self.expense_frame,
-                text=desc[:50] + ("..." if len(desc) > 50 else ""),
-                font=("Arial", 13),
-                cursor="hand2",
-                anchor="e", justify="right"
-            )
-            desc_label.grid(row=row_index, column=2, sticky="ew", padx=4, pady=4)
-            desc_label.bind("<Button-1>", lambda e, d=desc, a=amount, dt=date, eid=expense_id: 
-                           self.show_full_description(d, a, dt, eid))
-
-            # Amount column
-            CTkLabel(self.expense_frame, text=amount, font=("Arial", 13), anchor="e", justify="right").grid(
-                row=row_index, column=3, sticky="ew", padx=4, pady=4)
+    def _show_expenses(self, expenses):
+        """Display loaded expense records below the table headers.
 
+        Args:
+            expenses: List of (id, description, amount, date) tuples.
+        """
+        if self.expense_placeholder is not None:
+            self.expense_placeholder.destroy()
+            self.expense_placeholder = None
+        self.expense_rows.update(expenses)
         self.update_summary()
 
     def load_income(self):
-        """Load and display all income records in the table.
+        """Load the income records and show them in the table.
         
-        Creates a table with headers and populates it with income data.
-        Each row includes delete button, date, description, and amount.
+        The records are read in the background. Rows already shown stay until
+        the new records arrive; then only the rows of added, deleted or edited
+        records change.
         """
-        # Clear existing table contents
-        for widget in self.income_frame.winfo_children():
-            widget.destroy()
+        if not len(self.income_rows) and self.income_placeholder is None:
+            # Nothing shown yet: a placeholder row shows until the records are loaded
+            self.income_placeholder = create_loading_label(self.income_frame)
+            self.income_placeholder.grid(row=1, column=0, columnspan=4, pady=10)
+        run_in_background(self.income_frame, self.controller.get_all_income, on_success=self._show_income)
+
+    def _show_income(self, income_records):
+        """Display loaded income records below the table headers.
 
-        # Create table headers
+        Args:
+            income_records: List of (id, description, amount, date) tuples.
+        """
+        if self.income_placeholder is not None:
+            self.income_placeholder.destroy()
+            self.income_placeholder = None
+        self.income_rows.update(income_records)
+        self.update_summary()
+
+    @staticmethod
+    def _create_table_header(table_frame, header_color):
+        """Create the header row of an expense or income table.
+
+        Args:
+            table_frame: The table's scrollable frame.
+            header_color: Header background as a (light, dark) color pair.
+        """
         headers = ["الإجراءات", "التاريخ", "الوصف", "المبلغ"]
         for i, h in enumerate(headers):
-            CTkLabel(self.income_frame, 
+            CTkLabel(table_frame, 
                     text=h, 
                     font=("Arial", 15, "bold"),
                     text_color=("#FFFFFF", "#232323"),
                     corner_radius=8,
-                    fg_color=("#4CAF50", "#2D8CFF"),
+                    fg_color=header_color,
                     height=40,
                     width=120,
                     anchor="center", justify="center").grid(
                         row=0, column=i, padx=4, pady=4, sticky="ew")
 
-        # Load and display income records
-        income_records = self.controller.get_all_income()
-        for row_index, (income_id, desc, amount, date) in enumerate(income_records, start=1):
-            # Delete button
-            delete_button = CTkButton(
-                self.income_frame,
-                text="✖",
-                width=30,
-                height=30,
-                fg_color="red",
-                text_color="white",
-                command=lambda iid=income_id: self.confirm_delete_income(iid)
-            )
-            delete_button.grid(row=row_index, column=0, padx=4, pady=4, sticky="ew")
-
-            # Date column
-            CTkLabel(self.income_frame, text=date, font=("Arial", 13), anchor="e", justify="right").grid(
-                row=row_index, column=1, sticky="ew", padx=4, pady=4)
-            
-            # Description column (clickable for full view)
-            desc_label = CTkLabel(
-                self.income_frame,
-                text=desc[:50] + ("..." if len(desc) > 50 else ""),
-                font=("Arial", 13),
-                cursor="hand2",
-                anchor="e", justify="right"
-            )
-            desc_label.grid(row=row_index, column=2, sticky="ew", padx=4, pady=4)
-            desc_label.bind("<Button-1>", lambda e, d=desc, a=amount, dt=date, iid=income_id: 
-                           self.show_full_income_description(d, a, dt, iid))
+    @staticmethod
+    def _create_record_row(table_frame, record, on_delete, on_open):
+        """Create the cells of one expense or income row (placed by _place_record_row).
 
-            # Amount column
-            CTkLabel(self.income_frame, text=amount, font=("Arial", 13), anchor="e", justify="right").grid(
-                row=row_index, column=3, sticky="ew", padx=4, pady=4)
+        Args:
+            table_frame: The table's scrollable frame.
+            record: An (id, description, amount, date) record.
+            on_delete: Called with the record id by the delete button.
+            on_open: Called with (description, amount, date, id) when the description is clicked.
 
-        self.update_summary()
+        Returns:
+            The row's widgets, in column order.
+        """
+        record_id, desc, amount, date = record
+        # Delete button
+        delete_button = CTkButton(
+            table_frame,
+            text="✖",
+            width=30,
+            height=30,
+            fg_color="red",
+            text_color="white",
+            command=lambda: on_delete(record_id)
+        )
+
+        # Date column
+        date_label = CTkLabel(table_frame, text=date, font=("Arial", 13), anchor="e", justify="right")
+
+        # Description column (clickable for full view)
+        desc_label = CTkLabel(
+            table_frame,
+            text=desc[:50] + ("..." if len(desc) > 50 else ""),
+            font=("Arial", 13),
+            cursor="hand2",
+            anchor="e", justify="right"
+        )
+        desc_label.bind("<Button-1>", lambda e: on_open(desc, amount, date, record_id))
+
+        # Amount column
+        amount_label = CTkLabel(table_frame, text=str(amount), font=("Arial", 13), anchor="e", justify="right")
+        return delete_button, date_label, desc_label, amount_label
+
+    @staticmethod
+    def _place_record_row(widgets, index):
+        """Grid a row's widgets at a position below the header row."""
+        for column, widget in enumerate(widgets):
+            widget.grid(row=index + 1, column=column, sticky="ew", padx=4, pady=4)
 
     def update_summary(self):
-        """Update the financial summary display with current totals."""
-        summary = self.controller.get_summary()
+        """Update the financial summary display with current totals (loaded in the background)."""
+        run_in_background(self.summary_label, self.controller.get_summary, on_success=self._show_summary)
+
+    def _show_summary(self, summary):
+        """Display the loaded financial summary."""
         self.summary_label.configure(
             text=f"الإيرادات: {summary['income']} | المصروفات: {summary['expenses']} | المتبقي: {summary['remaining']}"
         )
@@ -4,7 +4,6 @@ This module handles the main application window, navigation, and dashboard funct
 """
 
 # Standard library imports
-import sqlite3
 from datetime import datetime
 from tkinter import messagebox
 
@@ -13,8 +12,6 @@ from customtkinter import (
     CTkFrame, CTkLabel, CTkButton, CTkScrollableFrame,
     CTkProgressBar, CTkEntry
 )
-import arabic_reshaper
-from bidi.algorithm import get_display
 
 # Local application imports
 from .register_student_page import RegisterStudentPage
@@ -23,12 +20,25 @@ from .register_teacher_page import RegisterTeacherPage
 from .statistics_page import StatisticsPage
 from .person_management.search_page import SearchPage
 from .person_management.utils import DateEntry
+from .background import run_in_background, create_loading_label, LOADING_TEXT
+from .text_shaping import shape_text
+from .widgets import KeyedList
+from .page_manager import PageManager
 from backend.database import (
     get_all_activities, add_activity,
-    update_activity, delete_activity, get_summary
+    update_activity, delete_activity, get_summary,
+    get_people_counts
 )
+from backend.dates import to_display
+from backend.money import Money
 from .settings import SettingsPage
 
+# Pages kept alive in the content area (the least recently shown beyond it are destroyed)
+MAX_CACHED_PAGES = 4
+
+# Tables whose data the dashboard and the statistics page show
+STATISTICS_TABLES = ("students", "teachers", "fee_payments", "income", "general_expenses", "teacher_salaries")
+
 class NextPage:
     """
     Main application window class that handles navigation and dashboard functionality.
@@ -46,66 +56,76 @@ class NextPage:
         self.current_page = None
         self.setup_ui()
 
-    def arabic(self, text: str) -> str:
-        """
-        Convert and display Arabic text properly.
-        
-        Args:
-            text (str): The Arabic text to be displayed
-            
-        Returns:
-            str: Properly formatted Arabic text
-        """
-        reshaped = arabic_reshaper.reshape(text)
-        return get_display(reshaped)
+    # Format Arabic text for proper display (shared, memoized shaping)
+    arabic = staticmethod(shape_text)
 
     # Navigation Methods
+    # Pages are kept alive by self.pages and only refreshed (or rebuilt) when
+    # the tables they show were written since they were last shown.
+    # Registration forms start empty on every visit.
     def open_register_student_page(self):
         """Open the student registration page."""
-        self.clear_content_frame()
-        self.current_page = RegisterStudentPage(self.content_frame, on_back=self.show_dashboard)
+        self.current_page = self.pages.show(
+            "register_student",
+            lambda parent: RegisterStudentPage(parent, on_back=self.show_dashboard),
+            keep=False
+        )
         self.highlight_active_nav_button("register_student")
 
     def open_search_student_page(self):
         """Open the student search page."""
-        self.clear_content_frame()
-        self.current_page = SearchPage(self.content_frame, on_back=self.show_dashboard)
+        self.current_page = self.pages.show(
+            "search",
+            lambda parent: SearchPage(parent, on_back=self.show_dashboard),
+            tables=("students", "teachers", "fee_payments"),
+            refresh=lambda page: page.refresh_results(keep_position=True)
+        )
         self.highlight_active_nav_button("search")
 
     def open_fees_page(self):
         """Open the fees management page."""
-        self.clear_content_frame()
-        self.current_page = FeesPage(
-            self.content_frame,
-            on_back=self.show_dashboard,
-            on_data_changed=self.show_dashboard,
-            arabic_handler=self.arabic
+        self.current_page = self.pages.show(
+            "fees",
+            lambda parent: FeesPage(
+                parent,
+                on_back=self.show_dashboard,
+                on_data_changed=self.show_dashboard,
+                arabic_handler=self.arabic
+            ),
+            tables=("income", "general_expenses"),
+            refresh=lambda page: page.refresh()
         )
         self.highlight_active_nav_button("fees")
 
     def open_register_teacher_page(self):
         """Open the teacher registration page."""
-        self.clear_content_frame()
-        self.current_page = RegisterTeacherPage(self.content_frame, on_back=self.show_dashboard)
+        self.current_page = self.pages.show(
+            "register_teacher",
+            lambda parent: RegisterTeacherPage(parent, on_back=self.show_dashboard),
+            keep=False
+        )
         self.highlight_active_nav_button("register_teacher")
         
     def open_statistics_page(self):
         """Open the statistics and reports page."""
-        self.clear_content_frame()
-        self.current_page = StatisticsPage(self.content_frame, on_back=self.show_dashboard)
+        # Rebuilt when stale: every section depends on the data
+        self.current_page = self.pages.show(
+            "statistics",
+            lambda parent: StatisticsPage(parent, on_back=self.show_dashboard),
+            tables=STATISTICS_TABLES
+        )
         self.highlight_active_nav_button("statistics")
 
     def open_settings_page(self):
         """Open the settings page."""
-        self.clear_content_frame()
-        self.current_page = SettingsPage(self.content_frame, self.main, on_back=self.show_dashboard)
+        # The backup path entry follows the settings store by itself
+        self.current_page = self.pages.show(
+            "settings",
+            lambda parent: SettingsPage(parent, self.main, on_back=self.show_dashboard)
+        )
         self.highlight_active_nav_button("settings")
 
     # UI Helper Methods
-    def clear_content_frame(self):
-        """Clear all widgets from the content frame."""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
     
     def highlight_active_nav_button(self, active_button_id):
         """
@@ -128,8 +148,12 @@ class NextPage:
     # Dashboard Methods
     def show_dashboard(self):
         """Display the main dashboard."""
-        self.clear_content_frame()
-        self.create_dashboard()
+        # Rebuilt when stale: the statistics cards and chart depend on the data
+        self.current_page = self.pages.show(
+            "dashboard",
+            self.create_dashboard,
+            tables=STATISTICS_TABLES + ("activities",)
+        )
         self.highlight_active_nav_button("dashboard")
 
     def get_statistics(self):
@@ -142,41 +166,39 @@ class NextPage:
         try:
             summary_data = get_summary()
             
-            conn = sqlite3.connect('students.db')
-            cursor = conn.cursor()
-            
-            # Get student count
-            cursor.execute("SELECT COUNT(*) FROM students")
-            students_count = cursor.fetchone()[0] or 0
-            
-            # Get teacher count
-            cursor.execute("SELECT COUNT(*) FROM teachers")
-            teachers_count = cursor.fetchone()[0] or 0
-            
-            conn.close()
+            # Get student and teacher counts
+            counts = get_people_counts()
             
             return {
-                "students": students_count,
-                "teachers": teachers_count,
-                "income": summary_data.get('income', 0.0),
-                "expenses": summary_data.get('expenses', 0.0)
+                "students": counts["students"],
+                "teachers": counts["teachers"],
+                "income": summary_data.get('income', Money()),
+                "expenses": summary_data.get('expenses', Money())
             }
         except Exception as e:
             print(f"Error getting statistics: {e}")
             return {
                 "students": 0,
                 "teachers": 0,
-                "income": 0,
-                "expenses": 0
+                "income": Money(),
+                "expenses": Money()
             }
 
-    def create_dashboard(self):
-        """Create and display the main dashboard with statistics and activities."""
+    def create_dashboard(self, parent):
+        """
+        Create the main dashboard with statistics and activities.
+
+        Args:
+            parent: The frame to create the dashboard in
+
+        Returns:
+            The dashboard frame
+        """
         # Create main dashboard frame
-        dashboard_frame = CTkFrame(self.content_frame, fg_color="transparent")
+        dashboard_frame = CTkFrame(parent, fg_color="transparent")
         dashboard_frame.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
-        self.content_frame.grid_rowconfigure(0, weight=1)
-        self.content_frame.grid_columnconfigure(0, weight=1)
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
         
         # Configure grid layout
         for i in range(3):
@@ -187,17 +209,28 @@ class NextPage:
         # Create header
         self._create_dashboard_header(dashboard_frame)
         
-        # Get and display statistics
-        stats = self.get_statistics()
+        # Statistics are loaded in the background; a placeholder holds their rows meanwhile
+        loading_label = create_loading_label(dashboard_frame, self.arabic(LOADING_TEXT))
+        loading_label.grid(row=1, column=0, columnspan=3, rowspan=3, pady=40)
+        run_in_background(
+            dashboard_frame,
+            self.get_statistics,
+            on_success=lambda stats: self._show_statistics(dashboard_frame, loading_label, stats)
+        )
+        
+        # Create info and activities section
+        self._create_info_activities_section(dashboard_frame)
+        return dashboard_frame
+
+    def _show_statistics(self, parent, loading_label, stats):
+        """Replace the loading placeholder with the statistics cards and chart."""
+        loading_label.destroy()
         
         # Create statistics cards
-        self._create_statistics_cards(dashboard_frame, stats)
+        self._create_statistics_cards(parent, stats)
         
         # Create financial chart
-        self._create_financial_chart(dashboard_frame, stats)
-        
-        # Create info and activities section
-        self._create_info_activities_section(dashboard_frame)
+        self._create_financial_chart(parent, stats)
 
     def _create_dashboard_header(self, parent):
         """Create the dashboard header with title."""
@@ -260,7 +293,7 @@ class NextPage:
         
         # Net profit card
         net_profit = stats["income"] - stats["expenses"]
-        profit_color = "#4CAF50" if net_profit >= 0 else "#F44336"
+        profit_color = "#4CAF50" if net_profit >= Money() else "#F44336"
         self.create_stat_card(
             parent, 2, 2,
             self.arabic("صافي الربح"),
@@ -297,7 +330,8 @@ class NextPage:
 
     def _create_financial_bars(self, parent, stats):
         """Create financial comparison bars."""
-        max_value = max(stats["income"], stats["expenses"]) if max(stats["income"], stats["expenses"]) > 0 else 1
+        # Bar lengths are relative to the larger of income and expenses, in cents
+        max_value = max(stats["income"], stats["expenses"]).cents or 1
         net_profit = stats["income"] - stats["expenses"]
         
         # Income bar
@@ -319,7 +353,7 @@ class NextPage:
         )
         
         # Net profit bar
-        profit_color = "#4CAF50" if net_profit >= 0 else "#F44336"
+        profit_color = "#4CAF50" if net_profit >= Money() else "#F44336"
         self._create_financial_bar(
             parent, 2,
             self.arabic("صافي الربح:"),
@@ -337,7 +371,7 @@ class NextPage:
         # Progress bar
         progress = CTkProgressBar(parent, width=500, height=30, corner_radius=5)
         progress.grid(row=row, column=1, padx=10, pady=8)
-        progress.set(abs(value) / max_value if max_value > 0 else 0)
+        progress.set(abs(value.cents) / max_value if max_value > 0 else 0)
         progress.configure(progress_color=color)
         
         # Value label
@@ -434,6 +468,19 @@ class NextPage:
         )
         self.activities_display_frame.pack(fill="both", expand=True, padx=10, pady=10)
         self.activities_display_frame.grid_columnconfigure(0, weight=1)
+
+        # Message shown instead of the list (loading, no activities)
+        self.activities_message = CTkLabel(
+            self.activities_display_frame,
+            text="",
+            font=("Arial", 14),
+            text_color="#555"
+        )
+        # Activity items, patched by activity id when the list is reloaded
+        self.activity_items = KeyedList(
+            create=lambda activity: self._create_activity_display_item(*activity),
+            place=lambda activity_frame, index: activity_frame.grid(row=index, column=0, sticky="ew", pady=4)
+        )
         
         self.load_activities()
 
@@ -689,32 +736,37 @@ class NextPage:
         
         self.content_frame = CTkScrollableFrame(content_container, fg_color="#f5f5f5")
         self.content_frame.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
+        self.pages = PageManager(self.content_frame, max_pages=MAX_CACHED_PAGES)
 
     # Activity Management Methods
     def load_activities(self):
-        """Load and display all activities."""
-        # Clear existing activities
-        for widget in self.activities_display_frame.winfo_children():
-            widget.destroy()
+        """Load and display all activities.
 
-        activities = get_all_activities()
+        Activities already shown stay until the new list arrives; then only
+        the items of added, edited or deleted activities change.
+        """
+        if not len(self.activity_items):
+            # Nothing shown yet: a placeholder shows until the activities are loaded
+            self._show_activities_message(LOADING_TEXT)
 
-        if not activities:
-            CTkLabel(
-                self.activities_display_frame,
-                text=self.arabic("لا يوجد أنشطة قادمة حاليًا."),
-                font=("Arial", 14),
-                text_color="#555"
-            ).pack(pady=10)
-            return
+        run_in_background(self.activities_display_frame, get_all_activities, on_success=self._show_activities)
+
+    def _show_activities(self, activities):
+        """Display the loaded activities (or a message when there are none)."""
+        if activities:
+            self.activities_message.grid_remove()
+        else:
+            self._show_activities_message("لا يوجد أنشطة قادمة حاليًا.")
+        self.activity_items.update(activities)
 
-        for activity_id, description, date in activities:
-            self._create_activity_display_item(activity_id, description, date)
+    def _show_activities_message(self, text):
+        """Show a message in the activities list (e.g. loading, no activities)."""
+        self.activities_message.configure(text=self.arabic(text))
+        self.activities_message.grid(row=0, column=0, pady=10)
 
     def _create_activity_display_item(self, activity_id, description, date):
-        """Create a display item for a single activity."""
+        """Create a display item for a single activity (placed by the KeyedList)."""
         activity_frame = CTkFrame(self.activities_display_frame, fg_color="#BBDEFB", corner_radius=8)
-        activity_frame.pack(fill="x", pady=4)
         activity_frame.grid_columnconfigure(0, weight=1)
         activity_frame.grid_columnconfigure(1, weight=0)
 
@@ -732,7 +784,7 @@ class NextPage:
         
         CTkLabel(
             desc_date_frame,
-            text=self.arabic(f"التاريخ: {date}"),
+            text=self.arabic(f"التاريخ: {to_display(date)}"),
             font=("Arial", 12),
             anchor="e",
             text_color="#555"
@@ -765,6 +817,7 @@ class NextPage:
             command=lambda: self.open_edit_activity_window(activity_id, description, date)
         )
         edit_button.pack(side="right", padx=5)
+        return activity_frame
 
     def add_new_activity(self):
         """Add a new activity to the database."""
@@ -7,11 +7,10 @@ from tkinter import messagebox
 
 # Third-party imports
 from customtkinter import CTkLabel, CTkEntry, CTkFrame, CTkButton
-import arabic_reshaper
-from bidi.algorithm import get_display
 
 # Local application imports
 from .index import NextPage
+from .text_shaping import shape_text
 
 class Login:
     """
@@ -55,18 +54,8 @@ class Login:
         """Handle Enter key press in password field."""
         self.login_clicked()
 
-    def arabic(self, text: str) -> str:
-        """
-        Format Arabic text for proper display.
-
-        Args:
-            text (str): The Arabic text to be displayed
-
-        Returns:
-            str: Properly formatted Arabic text
-        """
-        reshaped = arabic_reshaper.reshape(text)
-        return get_display(reshaped)
+    # Format Arabic text for proper display (shared, memoized shaping)
+    arabic = staticmethod(shape_text)
 
     def setup_ui(self):
         """Set up the login page user interface."""
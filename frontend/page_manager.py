@@ -0,0 +1,156 @@
+"""
+Pages of the main window's content area, kept alive between visits.
+
+Opening a page used to destroy the page shown and build the new one from
+scratch, with all its widgets and queries, on every click in the sidebar.
+PageManager builds each page once, in its own container frame, and then only
+hides and shows the containers:
+
+- a page is refreshed when it is shown again after one of the tables it
+  shows has been written (see backend.database.get_table_versions); pages
+  without a refresh function are rebuilt instead
+- at most max_pages pages are kept; showing another one destroys the page
+  shown least recently
+- transient pages (forms that should start empty) are destroyed as soon as
+  another page is shown
+"""
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+from customtkinter import CTkFrame
+
+from backend.database import get_table_versions
+
+# Pages kept alive by default
+DEFAULT_MAX_PAGES = 4
+
+
+class _Page:
+    """A page kept by the PageManager and the table versions it last showed."""
+
+    __slots__ = ("container", "page", "versions")
+
+    def __init__(self, container, versions):
+        self.container = container
+        self.page = None
+        self.versions = versions
+
+
+class PageManager:
+    """Shows one page at a time in a parent frame, keeping visited pages alive.
+
+    Attributes:
+        parent: The frame the pages are shown in (in grid cell 0, 0).
+        max_pages: Maximum number of pages kept alive.
+        current: Name of the page shown, or None.
+    """
+
+    def __init__(self, parent, max_pages: int = DEFAULT_MAX_PAGES):
+        self.parent = parent
+        self.max_pages = max_pages
+        self.current = None
+        self._pages = OrderedDict()  # name -> _Page, least recently shown first
+        self._transient = None       # Container of the transient page shown
+
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+
+    def show(self, name: str, build: Callable, tables: Iterable[str] = (), refresh: Callable = None,
+             keep: bool = True):
+        """Shows a page, building it if it is not kept alive yet.
+
+        Args:
+            name: Identifies the page.
+            build: build(container) creates the page inside the given frame
+                and returns it.
+            tables: Tables whose data the page shows. When one of them has
+                been written since the page was last shown, it is refreshed.
+            refresh: refresh(page) reloads the data of a page that is out of
+                date. When None, such a page is destroyed and built again.
+            keep: Keep the page alive after another page is shown. Transient
+                pages are built again on every visit.
+
+        Returns:
+            The page returned by build.
+        """
+        self.hide()
+        if not keep:
+            self._transient = self._create_container()
+            self._transient.grid(row=0, column=0, sticky="nsew")
+            self.current = name
+            return build(self._transient)
+
+        tables = tuple(tables)
+        entry = self._pages.get(name)
+        if entry is not None and not entry.container.winfo_exists():
+            # Destroyed by someone else (e.g. the window was rebuilt)
+            del self._pages[name]
+            entry = None
+
+        if entry is not None:
+            self._pages.move_to_end(name)
+            # Taken before refreshing: a write landing meanwhile marks the page stale again
+            versions = get_table_versions(*tables)
+            if versions != entry.versions:
+                if refresh is None:
+                    self.discard(name)
+                    entry = None
+                else:
+                    entry.versions = versions
+                    try:
+                        refresh(entry.page)
+                    except Exception as e:
+                        print(f"Error refreshing page '{name}': {e}")
+
+        if entry is None:
+            entry = _Page(self._create_container(), get_table_versions(*tables))
+            self._pages[name] = entry
+            self._evict()
+            try:
+                entry.page = build(entry.container)
+            except Exception:
+                self.discard(name)
+                raise
+
+        entry.container.grid(row=0, column=0, sticky="nsew")
+        self.current = name
+        return entry.page
+
+    def hide(self):
+        """Hides the page shown (a transient one is destroyed)."""
+        if self._transient is not None:
+            self._transient.destroy()
+            self._transient = None
+        entry = self._pages.get(self.current)
+        if entry is not None and entry.container.winfo_exists():
+            entry.container.grid_remove()
+        self.current = None
+
+    def discard(self, name: str):
+        """Destroys a kept page; it is built again the next time it is shown."""
+        entry = self._pages.pop(name, None)
+        if entry is not None:
+            if self.current == name:
+                self.current = None
+            entry.container.destroy()
+
+    def clear(self):
+        """Destroys every page."""
+        self.hide()
+        for name in list(self._pages):
+            self.discard(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pages
+
+    def _create_container(self):
+        container = CTkFrame(self.parent, fg_color="transparent")
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+        return container
+
+    def _evict(self):
+        """Destroys the least recently shown pages beyond max_pages."""
+        while len(self._pages) > self.max_pages:
+            name = next(iter(self._pages))
+            self.discard(name)
@@ -9,6 +9,15 @@ related files, including search modes, academic levels, gender options, and UI s
 # Defines the available modes for searching (e.g., Students, Teachers)
 SEARCH_MODES = ["الطلاب", "المعلمات"]
 
+# Number of results shown per page on the search page (the results table only
+# creates widgets for the rows in view, so a page can be long)
+SEARCH_PAGE_SIZE = 500
+
+# Pause in typing (milliseconds) after which the name filter is searched in
+# the database, so a query runs once per pause rather than once per key.
+# Results already shown are narrowed right away on every key.
+SEARCH_DEBOUNCE_MS = 100
+
 # --- Academic Levels ---
 # Defines the different academic levels available for students and teachers
 ACADEMIC_LEVELS = ["الجميع", "التمهيدي", "الاول المستوى", "الثاني المستوى", "الصغار فصل", "يومي اشتراك"]
@@ -54,6 +63,13 @@ ACTION_BUTTON_STYLE = {
     "width": 50
 }
 
+# Style for delete buttons in result rows
+DELETE_BUTTON_STYLE = {
+    "width": 50,
+    "fg_color": "red",
+    "hover_color": "darkred"
+}
+
 # Style for the teacher salary button
 SALARY_BUTTON_STYLE = {
     "width": 70,
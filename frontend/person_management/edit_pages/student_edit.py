@@ -5,7 +5,9 @@ including personal information, academic details, and fee management.
 """
 import customtkinter as ctk
 from tkinter import messagebox
-from backend.database import update_student
+from backend.database import update_student_by_id
+from backend.dates import parse_date
+from backend.money import to_cents
 from typing import Callable, Dict, Any
 import tkinter as tk
 from ..constants import ACADEMIC_LEVELS, GENDER_OPTIONS, FEE_TYPES
@@ -35,17 +37,6 @@ class EditStudentPage(ctk.CTkFrame):
         self.master.grid_rowconfigure(0, weight=1)
         self.master.grid_columnconfigure(0, weight=1)
 
-    def arabic(self, text: str) -> str:
-        """Handle Arabic text display.
-        
-        Args:
-            text: The text to be displayed in Arabic.
-            
-        Returns:
-            The processed Arabic text.
-        """
-        return text
-
     def setup_ui(self):
         """Set up the UI components for the edit student page.
         
@@ -83,7 +74,7 @@ class EditStudentPage(ctk.CTkFrame):
         # Page title
         title_label = ctk.CTkLabel(
             self,
-            text=self.arabic("تعديل بيانات الطالب"),
+            text="تعديل بيانات الطالب",
             font=("Arial", 22, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, sticky="n", pady=(10, 20))
@@ -97,7 +88,7 @@ class EditStudentPage(ctk.CTkFrame):
         # Save button
         self.save_button = ctk.CTkButton(
             self,
-            text=self.arabic("حفظ التعديلات"),
+            text="حفظ التعديلات",
             font=("Arial", 18),
             height=40,
             width=200,
@@ -108,7 +99,7 @@ class EditStudentPage(ctk.CTkFrame):
     def _setup_personal_info(self):
         """Set up personal information fields (name and national ID)."""
         # Student Name
-        ctk.CTkLabel(self, text=self.arabic(":اسم الطالب"), 
+        ctk.CTkLabel(self, text=":اسم الطالب", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=1, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -117,7 +108,7 @@ class EditStudentPage(ctk.CTkFrame):
         self.name_entry.grid(row=2, column=0, columnspan=2, pady=5, sticky="ew")
 
         # National ID
-        ctk.CTkLabel(self, text=self.arabic(":الرقم القومي"), 
+        ctk.CTkLabel(self, text=":الرقم القومي", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=3, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -128,23 +119,23 @@ class EditStudentPage(ctk.CTkFrame):
     def _setup_academic_info(self):
         """Set up academic information fields (level and gender)."""
         # Academic level and gender labels
-        ctk.CTkLabel(self, text=self.arabic(":الفصل الدراسي"), 
+        ctk.CTkLabel(self, text=":الفصل الدراسي", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=5, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
-        ctk.CTkLabel(self, text=self.arabic(":الجنس"), 
+        ctk.CTkLabel(self, text=":الجنس", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=5, column=0, sticky="e", pady=(10, 2), padx=(0, 10))
 
         # Academic level dropdown
-        levels = [self.arabic(level) for level in ACADEMIC_LEVELS if level != "الجميع"]
+        levels = [level for level in ACADEMIC_LEVELS if level != "الجميع"]
         self.term_var = tk.StringVar(value=self.student_data.get("term", levels[0] if levels else ""))
         self.term_menu = ctk.CTkOptionMenu(self, values=levels, variable=self.term_var)
         self.term_menu.grid(row=6, column=1, sticky="ew", pady=5, padx=(0, 10))
 
         # Gender dropdown
-        genders = [self.arabic(GENDER_OPTIONS["male"]), self.arabic(GENDER_OPTIONS["female"])]
+        genders = [GENDER_OPTIONS["male"], GENDER_OPTIONS["female"]]
         self.gender_var = tk.StringVar(value=self.student_data.get("gender", genders[0] if genders else ""))
         self.gender_menu = ctk.CTkOptionMenu(self, values=genders, variable=self.gender_var)
         self.gender_menu.grid(row=6, column=0, sticky="ew", pady=5, padx=(0, 10))
@@ -152,7 +143,7 @@ class EditStudentPage(ctk.CTkFrame):
     def _setup_contact_info(self):
         """Set up contact information fields (guardian phone numbers)."""
         # Primary guardian phone
-        ctk.CTkLabel(self, text=self.arabic(":هاتف ولي الأمر"), 
+        ctk.CTkLabel(self, text=":هاتف ولي الأمر", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=7, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -161,7 +152,7 @@ class EditStudentPage(ctk.CTkFrame):
         self.phone1_entry.grid(row=8, column=0, columnspan=2, pady=5, sticky="ew")
 
         # Secondary guardian phone (optional)
-        ctk.CTkLabel(self, text=self.arabic(":هاتف ولي أمر آخر*"), 
+        ctk.CTkLabel(self, text=":هاتف ولي أمر آخر*", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=9, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -172,7 +163,7 @@ class EditStudentPage(ctk.CTkFrame):
     def _setup_fees_section(self):
         """Set up the fees management section with fee types and dates."""
         # Fees section title
-        ctk.CTkLabel(self, text=self.arabic(":الرسوم"), 
+        ctk.CTkLabel(self, text=":الرسوم", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=11, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -192,8 +183,8 @@ class EditStudentPage(ctk.CTkFrame):
             fee_header.grid_columnconfigure(idx, weight=1)
 
         # Add column headers
-        headers = [self.arabic("يوم"), self.arabic("شهر"), self.arabic("سنة"), 
-                  self.arabic("المبلغ"), self.arabic("اسم القسط")]
+        headers = ["يوم", "شهر", "سنة", 
+                  "المبلغ", "اسم القسط"]
         for idx, txt in enumerate(headers):
             ctk.CTkLabel(fee_header, text=txt, 
                         font=("Arial", 13, "bold"), 
@@ -212,12 +203,13 @@ class EditStudentPage(ctk.CTkFrame):
             month_entry = ctk.CTkEntry(fee_row_frame, width=35, justify="center")
             year_entry = ctk.CTkEntry(fee_row_frame, width=50, justify="center")
 
-            # Parse and populate existing date values
-            if fee_dates[i]:
-                try:
-                    d, m, y = fee_dates[i].split("/")
-                except ValueError:
-                    d, m, y = "", "", ""
+            # Parse and populate existing date values (stored as YYYY-MM-DD)
+            try:
+                fee_date = parse_date(fee_dates[i])
+            except ValueError:
+                fee_date = None
+            if fee_date:
+                d, m, y = str(fee_date.day), str(fee_date.month), str(fee_date.year)
             else:
                 d, m, y = "", "", ""
 
@@ -241,7 +233,7 @@ class EditStudentPage(ctk.CTkFrame):
             # Fee type label
             ctk.CTkLabel(
                 fee_row_frame,
-                text=self.arabic(FEE_TYPES[i]),
+                text=FEE_TYPES[i],
                 font=("Arial", 13)
             ).grid(row=0, column=4, padx=2, sticky="ew")
 
@@ -251,9 +243,11 @@ class EditStudentPage(ctk.CTkFrame):
         Collects form data, validates required fields, and updates the student record.
         Shows success/error messages and returns to previous page on success.
         """
-        # Get original data for reference
-        original_name = self.student_data.get("name", "")
+        # The student is updated by ID, so students sharing a name are not touched
         student_id = self.student_data.get("id")
+        if student_id is None:
+            messagebox.showerror("خطأ", "لا يمكن تحديث الطالب: معرف الطالب غير موجود.")
+            return
 
         # Collect form data
         name = self.name_entry.get().strip()
@@ -270,16 +264,35 @@ class EditStudentPage(ctk.CTkFrame):
         # Validate required fields
         if not all([name, nid, term, gender, phone1]) and not phone2:
             messagebox.showerror(
-                self.arabic("خطأ"), 
-                self.arabic("من فضلك املأ الحقول المطلوبة على الأقل (الاسم، الرقم القومي، الفصل، الجنس، هاتف ولي الأمر)")
+                "خطأ", 
+                "من فضلك املأ الحقول المطلوبة على الأقل (الاسم، الرقم القومي، الفصل، الجنس، هاتف ولي الأمر)"
             )
             return
 
+        # Validate fee amounts are numbers
+        for fee in fees:
+            try:
+                to_cents(fee)
+            except ValueError:
+                messagebox.showerror(
+                    "خطأ",
+                    "يجب أن تكون جميع مبالغ الرسوم أرقامًا صحيحة."
+                )
+                return
+
+        # Validate fee dates are real dates
+        for fee_date in fee_dates:
+            try:
+                parse_date(fee_date)
+            except ValueError:
+                messagebox.showerror("خطأ", f"تاريخ غير صحيح: {fee_date}")
+                return
+
         # Update student record
-        update_student(original_name, name, nid, term, gender, phone1, phone2, fees, fee_dates)
+        update_student_by_id(student_id, name, nid, term, gender, phone1, phone2, fees, fee_dates)
 
         # Show success message
-        messagebox.showinfo(self.arabic("تم"), self.arabic("تم تحديث بيانات الطالب بنجاح"))
+        messagebox.showinfo("تم", "تم تحديث بيانات الطالب بنجاح")
 
         # Return to previous page
         self.go_back()
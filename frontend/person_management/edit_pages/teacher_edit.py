@@ -34,17 +34,6 @@ class EditTeacherPage(ctk.CTkFrame):
         self.master.grid_rowconfigure(0, weight=1)
         self.master.grid_columnconfigure(0, weight=1)
 
-    def arabic(self, text: str) -> str:
-        """Handle Arabic text display.
-        
-        Args:
-            text: The text to be displayed in Arabic.
-            
-        Returns:
-            The processed Arabic text.
-        """
-        return text
-
     def setup_ui(self):
         """Set up the UI components for the edit teacher page.
         
@@ -81,7 +70,7 @@ class EditTeacherPage(ctk.CTkFrame):
         # Page title
         title_label = ctk.CTkLabel(
             self,
-            text=self.arabic("تعديل بيانات المعلمة"),
+            text="تعديل بيانات المعلمة",
             font=("Arial", 22, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, sticky="n", pady=(10, 20))
@@ -94,7 +83,7 @@ class EditTeacherPage(ctk.CTkFrame):
         # Save Button
         self.save_button = ctk.CTkButton(
             self,
-            text=self.arabic("حفظ التعديلات"),
+            text="حفظ التعديلات",
             font=("Arial", 18),
             height=40,
             width=200,
@@ -105,7 +94,7 @@ class EditTeacherPage(ctk.CTkFrame):
     def _setup_personal_info(self):
         """Set up personal information fields (name and national ID)."""
         # Teacher Name
-        ctk.CTkLabel(self, text=self.arabic(":اسم المعلمة"), 
+        ctk.CTkLabel(self, text=":اسم المعلمة", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=1, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -114,7 +103,7 @@ class EditTeacherPage(ctk.CTkFrame):
         self.name_entry.grid(row=2, column=0, columnspan=2, pady=5, sticky="ew")
 
         # National ID
-        ctk.CTkLabel(self, text=self.arabic(":الرقم القومي"), 
+        ctk.CTkLabel(self, text=":الرقم القومي", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=3, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -125,23 +114,23 @@ class EditTeacherPage(ctk.CTkFrame):
     def _setup_academic_info(self):
         """Set up academic information fields (level and gender)."""
         # Academic level and gender labels
-        ctk.CTkLabel(self, text=self.arabic(":الفصل الدراسي"), 
+        ctk.CTkLabel(self, text=":الفصل الدراسي", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=5, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
-        ctk.CTkLabel(self, text=self.arabic(":الجنس"), 
+        ctk.CTkLabel(self, text=":الجنس", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=5, column=0, sticky="e", pady=(10, 2), padx=(0, 10))
 
         # Academic level dropdown
-        levels = [self.arabic(level) for level in ACADEMIC_LEVELS if level != "الجميع"]
+        levels = [level for level in ACADEMIC_LEVELS if level != "الجميع"]
         self.term_var = tk.StringVar(value=self.teacher_data.get("term", levels[0] if levels else ""))
         self.term_menu = ctk.CTkOptionMenu(self, values=levels, variable=self.term_var)
         self.term_menu.grid(row=6, column=1, sticky="ew", pady=5, padx=(0, 10))
 
         # Gender dropdown
-        genders = [self.arabic(GENDER_OPTIONS["male"]), self.arabic(GENDER_OPTIONS["female"])]
+        genders = [GENDER_OPTIONS["male"], GENDER_OPTIONS["female"]]
         self.gender_var = tk.StringVar(value=self.teacher_data.get("gender", genders[0] if genders else ""))
         self.gender_menu = ctk.CTkOptionMenu(self, values=genders, variable=self.gender_var)
         self.gender_menu.grid(row=6, column=0, sticky="ew", pady=5, padx=(0, 10))
@@ -149,7 +138,7 @@ class EditTeacherPage(ctk.CTkFrame):
     def _setup_contact_info(self):
         """Set up contact information fields (phone numbers)."""
         # Primary phone
-        ctk.CTkLabel(self, text=self.arabic(":هاتف"), 
+        ctk.CTkLabel(self, text=":هاتف", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=7, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -158,7 +147,7 @@ class EditTeacherPage(ctk.CTkFrame):
         self.phone1_entry.grid(row=8, column=0, columnspan=2, pady=5, sticky="ew")
 
         # Secondary phone (optional)
-        ctk.CTkLabel(self, text=self.arabic(":هاتف آخر"), 
+        ctk.CTkLabel(self, text=":هاتف آخر", 
                     font=("Arial", 16, "bold"), 
                     anchor="e", justify="right").grid(
                         row=9, column=1, sticky="e", pady=(10, 2), padx=(0, 10))
@@ -186,8 +175,8 @@ class EditTeacherPage(ctk.CTkFrame):
         # Validate required fields
         if not all([name, nid, term, gender, phone1]):
             messagebox.showerror(
-                self.arabic("خطأ"), 
-                self.arabic("من فضلك املأ الحقول المطلوبة على الأقل (الاسم، الرقم القومي، الفصل، الجنس، هاتف)")
+                "خطأ", 
+                "من فضلك املأ الحقول المطلوبة على الأقل (الاسم، الرقم القومي، الفصل، الجنس، هاتف)"
             )
             return
 
@@ -195,7 +184,7 @@ class EditTeacherPage(ctk.CTkFrame):
         update_teacher_by_id(teacher_id, name, nid, term, gender, phone1, phone2)
 
         # Show success message
-        messagebox.showinfo(self.arabic("تم"), self.arabic("تم تحديث بيانات المعلمة بنجاح"))
+        messagebox.showinfo("تم", "تم تحديث بيانات المعلمة بنجاح")
 
         # Return to previous page
         self.go_back()
@@ -7,13 +7,17 @@ import customtkinter as ctk
 from tkinter import messagebox
 from typing import Callable, Dict, Any, List
 import tkinter as tk
-from ..constants import SEARCH_MODES, ACADEMIC_LEVELS, SEARCH_BUTTON_STYLE, ACTION_BUTTON_STYLE, SALARY_BUTTON_STYLE, TABLE_HEADER_STYLE, TABLE_ROW_STYLE
+from ..constants import SEARCH_MODES, SEARCH_PAGE_SIZE, SEARCH_DEBOUNCE_MS, ACADEMIC_LEVELS, SEARCH_BUTTON_STYLE, ACTION_BUTTON_STYLE, DELETE_BUTTON_STYLE, SALARY_BUTTON_STYLE, TABLE_HEADER_STYLE, TABLE_ROW_STYLE
 from ..student_details_popup import StudentDetailsPopup
 from ..teacher_details_popup import TeacherDetailsPopup
 from ..edit_pages.student_edit import EditStudentPage
 from ..edit_pages.teacher_edit import EditTeacherPage
-from backend.database import get_all_students, get_all_teachers, delete_student_by_name, delete_teacher_by_id
+from backend.database import (
+    search_people, search_words, matches_search_words, delete_student_by_id, delete_teacher_by_id
+)
 from ..teacher_salary_popup import TeacherSalaryPopup
+from frontend.background import run_in_background, LOADING_TEXT
+from frontend.widgets import VirtualTable, Column, Action
 
 class SearchPage(ctk.CTkFrame):
     """Main search interface for finding and managing students and teachers.
@@ -33,26 +37,32 @@ class SearchPage(ctk.CTkFrame):
         super().__init__(master)
         self.master = master
         self.on_back = on_back
+        # Paging state: offset of the first result shown and the total match count
+        self.page_offset = 0
+        self.total_results = 0
+        # Serial number of the first row in the results table
+        self._first_serial = 1
+        # Live search: the name filter last acted on, the pending debounced
+        # search, and the query in flight (results of older queries are dropped)
+        self._typed_filter = ""
+        self._debounce_id = None
+        self._search_future = None
+        self._search_generation = 0
+        # The results shown, kept to narrow them locally while typing: their
+        # (students_mode, term) scope (None when they cannot be narrowed),
+        # name query words, rows and whether they are all the matches
+        self._shown_scope = None
+        self._shown_words = []
+        self._shown_rows = []
+        self._shown_complete = False
         self.setup_ui()
         # Trigger initial search after a short delay to ensure UI is ready
         self.after(100, self.search)
 
-    def arabic(self, text: str) -> str:
-        """Handles potential Arabic text display issues.
-        
-        Args:
-            text: The input string which may contain Arabic characters.
-            
-        Returns:
-            The processed string for display (identity function if no processing needed).
-        """
-        # Assuming Arabic reshaping/bidi handling is done elsewhere or not needed here
-        return text
-
     def setup_ui(self):
         """Sets up the main UI components for the search page.
         
-        Includes the top bar, search filters, and the scrollable results frame.
+        Includes the top bar, search filters, and the results tables.
         """
         # The frame is now 'self' because the class inherits from CTkFrame
         self.configure(fg_color="gray95") # Set background color to very light gray (appears white)
@@ -60,13 +70,15 @@ class SearchPage(ctk.CTkFrame):
         # Configure grid for layout: top bar, filters, and expandable results area
         self.grid_rowconfigure(0, weight=0) # Top bar (fixed height)
         self.grid_rowconfigure(1, weight=0) # Filters (fixed height)
-        self.grid_rowconfigure(2, weight=1) # Scrollable results (expands vertically)
+        self.grid_rowconfigure(2, weight=1) # Results table (expands vertically)
+        self.grid_rowconfigure(3, weight=0) # Pager (fixed height)
         self.grid_columnconfigure(0, weight=1) # Allow the main column to expand horizontally
 
         # Set up individual UI sections
         self._setup_top_bar()
         self._setup_filters()
         self._setup_results_frame()
+        self._setup_pager()
 
     def _setup_top_bar(self):
         """Sets up the top bar with back button and search mode selector."""
@@ -97,7 +109,7 @@ class SearchPage(ctk.CTkFrame):
         self.mode_var = tk.StringVar(value=SEARCH_MODES[0])
         self.mode_menu = ctk.CTkOptionMenu(
             top_bar,
-            values=[self.arabic(mode) for mode in SEARCH_MODES],
+            values=list(SEARCH_MODES),
             variable=self.mode_var,
             command=self.on_mode_change
         )
@@ -116,7 +128,7 @@ class SearchPage(ctk.CTkFrame):
         # Search Button (RTL: Placed on the far right)
         self.search_button = ctk.CTkButton(
             filters_frame,
-            text=self.arabic("بحث"), # "Search"
+            text="بحث", # "Search"
             command=self.search,
             **SEARCH_BUTTON_STYLE
         )
@@ -124,16 +136,18 @@ class SearchPage(ctk.CTkFrame):
 
         # Name filter (RTL: Entry to the left of Search Button)
         self.name_entry = ctk.CTkEntry(filters_frame, width=300, justify="right", 
-                                        font=("Arial", 14), placeholder_text=self.arabic("اسم الطالب أو المعلمة")) # "Student or Teacher Name"
+                                        font=("Arial", 14), placeholder_text="اسم الطالب أو المعلمة") # "Student or Teacher Name"
         self.name_entry.grid(row=0, column=2, padx=5, sticky="ew") # Placed to the left of Search Button
+        # Search as the user types
+        self.name_entry.bind("<KeyRelease>", self._on_name_changed)
 
         # Academic level filter (RTL: Label to the left of Name Entry, Menu to the left of Label)
-        ctk.CTkLabel(filters_frame, text=self.arabic(":المستوى الدراسي"), font=("Arial", 14)).grid(row=0, column=1, padx=5, sticky="e") # Label to the right of menu
+        ctk.CTkLabel(filters_frame, text=":المستوى الدراسي", font=("Arial", 14)).grid(row=0, column=1, padx=5, sticky="e") # Label to the right of menu
         # Levels from constants, excluding the "All" option for display in dropdown
-        levels = [self.arabic(level) for level in ACADEMIC_LEVELS if level != "الجميع"] # Filter out "All"
+        levels = [level for level in ACADEMIC_LEVELS if level != "الجميع"] # Filter out "All"
         # Reverse levels for RTL display in dropdown if needed (depends on CTkOptionMenu behavior)
         # levels.reverse() # Consider reversing if dropdown order is incorrect
-        self.level_var = tk.StringVar(value=self.arabic(ACADEMIC_LEVELS[0])) # Default to "All"
+        self.level_var = tk.StringVar(value=ACADEMIC_LEVELS[0]) # Default to "All"
         self.level_menu = ctk.CTkOptionMenu(
             filters_frame,
             values=levels, # Use filtered levels
@@ -142,12 +156,93 @@ class SearchPage(ctk.CTkFrame):
         self.level_menu.grid(row=0, column=0, padx=5, sticky="ew") # Menu on the far left
 
     def _setup_results_frame(self):
-        """Sets up the scrollable frame to display search results."""
-        # Scrollable frame for results. Height adjusted to fit approx 11 rows.
-        self.results_scroll_frame = ctk.CTkScrollableFrame(self, height=385)
-        self.results_scroll_frame.grid(row=2, column=0, sticky="nsew") # Place in row 2, expanding to fill space
-        # Ensure the inner frame within the scrollable frame expands
-        self.results_scroll_frame.grid_columnconfigure(0, weight=1)
+        """Sets up the student and teacher result tables (one is shown at a time).
+
+        The tables only create widgets for the rows in view and reuse them
+        while scrolling and for the next search's results.
+        """
+        # Columns in RTL grid order: Term | Name | Serial, with the actions on the left
+        columns = [
+            Column("الفصل", 1, lambda index, person: person.get("term", "")), # Term
+            Column("الاسم", 2, lambda index, person: self._display_name(person)), # Name
+            Column("الرقم التسلسلي", 0, lambda index, person: str(self._first_serial + index)), # Serial Number
+        ]
+        table_options = dict(header_style=TABLE_HEADER_STYLE, row_style=TABLE_ROW_STYLE,
+                             actions_title="الإجراءات", height=385) # Height fits approx 11 rows
+
+        self.student_table = VirtualTable(self, columns, actions=[
+            Action("عرض", self.show_student_details, ACTION_BUTTON_STYLE), # View
+            Action("تعديل", self.edit_student, ACTION_BUTTON_STYLE), # Edit
+            Action("حذف", self.delete_student, DELETE_BUTTON_STYLE), # Delete
+        ], **table_options)
+
+        self.teacher_table = VirtualTable(self, columns, actions=[
+            Action("عرض", self.show_teacher_details, ACTION_BUTTON_STYLE), # View
+            Action("تعديل", self.edit_teacher, ACTION_BUTTON_STYLE), # Edit
+            Action("حذف", self.delete_teacher, DELETE_BUTTON_STYLE), # Delete
+            Action("الرواتب", self.show_teacher_salary, SALARY_BUTTON_STYLE), # Salaries
+        ], **table_options)
+
+        for table in (self.student_table, self.teacher_table):
+            table.grid(row=2, column=0, sticky="nsew") # Place in row 2, expanding to fill space
+        self.teacher_table.grid_remove()
+
+    def _setup_pager(self):
+        """Sets up the previous/next page buttons and the result count label."""
+        pager_frame = ctk.CTkFrame(self, fg_color="gray95")
+        pager_frame.grid(row=3, column=0, sticky="ew", pady=(10, 0))
+        # RTL layout: [Next] [Count Label] [Previous]
+        pager_frame.grid_columnconfigure(0, weight=0)
+        pager_frame.grid_columnconfigure(1, weight=1)
+        pager_frame.grid_columnconfigure(2, weight=0)
+
+        self.next_button = ctk.CTkButton(
+            pager_frame,
+            text="التالي", # "Next"
+            command=self.next_page,
+            **SEARCH_BUTTON_STYLE
+        )
+        self.next_button.grid(row=0, column=0, padx=5, sticky="w")
+
+        self.page_label = ctk.CTkLabel(pager_frame, text="", font=("Arial", 13))
+        self.page_label.grid(row=0, column=1, padx=5)
+
+        self.prev_button = ctk.CTkButton(
+            pager_frame,
+            text="السابق", # "Previous"
+            command=self.previous_page,
+            **SEARCH_BUTTON_STYLE
+        )
+        self.prev_button.grid(row=0, column=2, padx=5, sticky="e")
+
+    def _update_pager(self, shown: int):
+        """Updates the result count label and enables/disables the page buttons.
+
+        Args:
+            shown: Number of results displayed on the current page.
+        """
+        if self.total_results:
+            first = self.page_offset + 1
+            last = self.page_offset + shown
+            # "Showing first-last of total"
+            self.page_label.configure(text=f"عرض {first}-{last} من {self.total_results}")
+        else:
+            self.page_label.configure(text="لا توجد نتائج") # "No results"
+        self.prev_button.configure(state="normal" if self.page_offset > 0 else "disabled")
+        has_next = self.page_offset + shown < self.total_results
+        self.next_button.configure(state="normal" if has_next else "disabled")
+
+    def next_page(self):
+        """Shows the next page of results."""
+        if self.page_offset + SEARCH_PAGE_SIZE < self.total_results:
+            self.page_offset += SEARCH_PAGE_SIZE
+            self.refresh_results()
+
+    def previous_page(self):
+        """Shows the previous page of results."""
+        if self.page_offset > 0:
+            self.page_offset = max(0, self.page_offset - SEARCH_PAGE_SIZE)
+            self.refresh_results()
 
     def setup_results_table(self):
         """This method is no longer used for setting up table headers."
@@ -168,235 +263,221 @@ class SearchPage(ctk.CTkFrame):
         self.search()
 
     def search(self):
-        """Performs the search operation based on current filters and mode.
+        """Performs a new search based on current filters and mode.
         
-        Retrieves data from the database and displays the results in the scrollable frame.
+        Starts again from the first page of results.
+        """
+        self.page_offset = 0
+        self.refresh_results()
+
+    # --- Live Search ---
+
+    def _on_name_changed(self, _=None):
+        """Searches as the user types in the name entry.
+
+        Results already shown are narrowed locally at once when the new name
+        filter only adds to the previous one (as for the first key typed
+        over the unfiltered first page). The database is queried after a
+        pause in typing of SEARCH_DEBOUNCE_MS, unless the narrowed rows are
+        already all the matches.
+
+        Args:
+            _: Event data (ignored).
         """
         name_filter = self.name_entry.get().strip()
+        if name_filter == self._typed_filter:
+            return # Cursor movement, modifier keys, ...
+        self._typed_filter = name_filter
+        self._cancel_search()
+
+        if self._narrow_results(name_filter):
+            return
+        self._debounce_id = self.after(SEARCH_DEBOUNCE_MS, self._run_live_search)
+
+    def _run_live_search(self):
+        """Queries the database for the typed name filter (after the debounce pause)."""
+        self._debounce_id = None
+        self.page_offset = 0
+        # The rows shown stay until the new ones arrive, to avoid flicker while typing
+        self.refresh_results(keep_rows=True)
+
+    def _narrow_results(self, name_filter: str) -> bool:
+        """Filters the results shown for a name filter that extends theirs.
+
+        The shown rows are the first matches of their query in id order, so
+        the rows that also match the new filter are the first matches of
+        the new query: they can be shown right away.
+
+        Returns:
+            True if the narrowed rows are all the matches (no query needed).
+        """
+        words = search_words(name_filter)
+        if self._shown_scope != self._current_scope() or (name_filter and not words):
+            return False
+        # Every old word must start one of the new words, or the new matches
+        # are not a subset of the old ones (e.g. a word was deleted)
+        if not all(any(word.startswith(old) for word in words) for old in self._shown_words):
+            return False
+
+        rows = [row for row in self._shown_rows if matches_search_words(row.get("name", ""), words)]
+        self._shown_words = words
+        self._shown_rows = rows
+        students_mode = self._shown_scope[0]
+        if self._shown_complete:
+            self._show_results(students_mode, rows, len(rows), 0)
+            return True
+
+        # More matches follow in the database; the pager is updated when they arrive
+        self._display_results(students_mode, rows)
+        self.page_label.configure(text=LOADING_TEXT)
+        self.prev_button.configure(state="disabled")
+        self.next_button.configure(state="disabled")
+        return False
+
+    def _current_scope(self):
+        """Returns the (students_mode, term) of the current mode and level filters."""
         level_filter = self.level_var.get()
-        mode = self.mode_var.get()
-
-        # Clear previous results from the scrollable frame
-        for widget in self.results_scroll_frame.winfo_children():
-            widget.destroy()
-
-        # Perform search and filter results based on mode
-        if mode == self.arabic(SEARCH_MODES[0]):  # Students mode
-            all_students = get_all_students()
-            # Filter students by name (case-insensitive) and academic level
-            results = [s for s in all_students if
-                       (not name_filter or name_filter.lower() in s.get("name", "").lower()) and # Search only by name
-                       (level_filter == self.arabic(ACADEMIC_LEVELS[0]) or self.arabic(s.get("term", "")) == level_filter)]
-            self.display_student_results(results)
-        else:  # Teachers mode
-            all_teachers = get_all_teachers()
-            # Filter teachers by name (case-insensitive) and academic level
-            results = [t for t in all_teachers if
-                       (not name_filter or name_filter.lower() in t.get("name", "").lower()) and # Search only by name
-                       (level_filter == self.arabic(ACADEMIC_LEVELS[0]) or self.arabic(t.get("term", "")) == level_filter)]
-            self.display_teacher_results(results)
-
-    def display_student_results(self, students: List[Dict[str, Any]]):
-        """Displays the student search results in a table format.
+        students_mode = self.mode_var.get() == SEARCH_MODES[0]
+        # "All" levels means no term filter
+        term = None if level_filter == ACADEMIC_LEVELS[0] else level_filter
+        return students_mode, term
+
+    def _cancel_search(self):
+        """Cancels the pending debounced search and drops the results of the query in flight."""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
+        if self._search_future is not None:
+            # Removes it from the worker's queue if it has not started yet
+            self._search_future.cancel()
+            self._search_future = None
+        self._search_generation += 1
+
+    # --- Querying ---
+
+    def refresh_results(self, keep_position: bool = False, keep_rows: bool = None):
+        """Queries the current page of results and displays it in the results table.
         
+        The name and level filters are applied in the database, which returns
+        only the rows for this page plus the total number of matches. The
+        query runs in the background; a placeholder is shown until it returns.
+        Starting a query drops the results of any query still running.
+
         Args:
-            students: A list of dictionaries, each representing a student record.
+            keep_position: Re-read the page in place (after an edit or delete):
+                the current rows stay shown until the new ones arrive, and the
+                table keeps its scroll position.
+            keep_rows: Keep the current rows shown until the new ones arrive
+                (default: keep_position).
         """
-        # Define headers for student results (order adjusted for RTL display)
-        headers = ["الإجراءات", "الفصل", "الاسم", "الرقم التسلسلي"] # Actions | Name | Term | Serial Number
-   
-
-        # Create header row frame inside the scrollable frame
-        header_frame = ctk.CTkFrame(self.results_scroll_frame, fg_color="gray50") # Add a background color for header
-        # Place the header frame within the scrollable frame, spanning the full width
-        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-
-        # Configure columns for RTL table layout within the header frame (Action | Term | Name | Serial)
-        # Weights adjusted to distribute space more evenly among data columns
-        # These weights must match the weights in the data row frames below
-        header_frame.grid_columnconfigure(0, weight=0) # Action buttons column (fixed width/minimal weight)
-        header_frame.grid_columnconfigure(1, weight=1) # Term column (expands)
-        header_frame.grid_columnconfigure(2, weight=2) # Name column (expands more)
-        header_frame.grid_columnconfigure(3, weight=0) # Serial Number column (fixed width/minimal weight)
-
-        # Place headers from right to left using the map
-        # We iterate through the desired display order of headers and place them in the corresponding RTL grid column
-        display_headers_rtl_order = [headers[3], headers[2], headers[1], headers[0]] # Serial, Term, Name, Actions
-        display_columns_rtl_order = [3, 2, 1, 0] # Corresponding grid columns from right to left
-
-        for i, header_text in enumerate(display_headers_rtl_order):
-             ctk.CTkLabel(
-                header_frame,
-                text=self.arabic(header_text),
-                **TABLE_HEADER_STYLE
-            ).grid(row=0, column=display_columns_rtl_order[i], padx=5, sticky="nsew") # Use nsew sticky for better alignment
-
-        # Display student data rows starting from row 1 (after header)
-        for i, student in enumerate(students, start=1):
-            row_frame = ctk.CTkFrame(self.results_scroll_frame)
-            # Place the row frame within the scrollable frame, spanning the full width
-            # Ensure row in scrollable frame expands vertically
-            self.results_scroll_frame.grid_rowconfigure(i, weight=1)
-            row_frame.grid(row=i, column=0, sticky="ew", pady=2)
-
-            # Configure columns for RTL table layout within the row frame (Action | Term | Name | Serial)
-            # These weights must match the weights in the header frame
-            row_frame.grid_columnconfigure(0, weight=0) # Action buttons column
-            row_frame.grid_columnconfigure(1, weight=1) # Term column
-            row_frame.grid_columnconfigure(2, weight=2) # Name column
-            row_frame.grid_columnconfigure(3, weight=0) # Serial Number column
-
-            # Display Serial Number (far right column in RTL grid)
-            ctk.CTkLabel(row_frame, text=str(i), **TABLE_ROW_STYLE).grid(row=0, column=3, padx=5, sticky="nsew")
-
-            # Display Name (reversed for RTL display, placed in the middle-right column)
-            original_name = student.get("name", "")
-            name_parts = original_name.split()
-            reversed_name_parts = name_parts[::-1] # Reverse the list of parts
-            reversed_name = " ".join(reversed_name_parts) # Join parts with space
-            ctk.CTkLabel(row_frame, text=self.arabic(reversed_name), **TABLE_ROW_STYLE).grid(row=0, column=2, padx=5, sticky="nsew")
-
-            # Display Academic Level (Term) (middle-left column)
-            ctk.CTkLabel(row_frame, text=self.arabic(student.get("term", "")),
-                         **TABLE_ROW_STYLE).grid(row=0, column=1, padx=5, sticky="nsew")
-
-            # Action buttons (Place on the far left column in RTL grid)
-            actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            actions_frame.grid(row=0, column=0, padx=5, sticky="w") # Action buttons on the left, aligned west
-
-            # View details button
-            details_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("عرض"), # View
-                command=lambda s=student: self.show_student_details(s),
-                **ACTION_BUTTON_STYLE
-            )
-            details_button.pack(side="left", padx=2) # Pack to the left within actions_frame
-
-            # Edit button
-            edit_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("تعديل"), # Edit
-                command=lambda s=student: self.edit_student(s),
-                **ACTION_BUTTON_STYLE
-            )
-            edit_button.pack(side="left", padx=2) # Pack to the left within actions_frame
-
-            # Delete button
-            delete_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("حذف"), # Delete
-                command=lambda s=student: self.delete_student(s),
-                fg_color="red",
-                hover_color="darkred",
-                **ACTION_BUTTON_STYLE
-            )
-            delete_button.pack(side="left", padx=2) # Pack to the left within actions_frame
+        if keep_rows is None:
+            keep_rows = keep_position
+        self._cancel_search()
+        generation = self._search_generation
+        # Until the new results arrive, the rows shown may be out of date (an edit or delete)
+        self._shown_scope = None
+
+        name_filter = self.name_entry.get().strip()
+        self._typed_filter = name_filter
+        students_mode, term = self._current_scope()
+        kind = "students" if students_mode else "teachers"
+
+        # Keep the rows' widgets for the new results; show a placeholder meanwhile
+        table = self.student_table if students_mode else self.teacher_table
+        self._show_table(table)
+        if not keep_rows:
+            table.show_message(LOADING_TEXT)
+
+        def on_success(page):
+            if generation == self._search_generation: # Not superseded by a newer search
+                self._search_future = None
+                self._show_results(students_mode, *page, keep_position=keep_position, words=search_words(name_filter), term=term)
+
+        self._search_future = run_in_background(
+            table,
+            self._query_page, kind, name_filter, term, self.page_offset,
+            on_success=on_success
+        )
 
-    def display_teacher_results(self, teachers: List[Dict[str, Any]]):
-        """Displays the teacher search results in a table format.
+    @staticmethod
+    def _query_page(kind: str, name_filter: str, term, offset: int):
+        """Fetches one page of results (runs on the database worker thread).
+
+        Returns:
+            A (results, total, offset) tuple. When the requested page is empty
+            but there are matches (e.g. after a delete), the last page is
+            returned instead, with its offset.
+        """
+        results, total = search_people(kind, name_filter, term, SEARCH_PAGE_SIZE, offset)
+        if not results and offset > 0 and total:
+            offset = (total - 1) // SEARCH_PAGE_SIZE * SEARCH_PAGE_SIZE
+            results, total = search_people(kind, name_filter, term, SEARCH_PAGE_SIZE, offset)
+        return results, total, offset
+
+    def _show_results(self, students_mode: bool, results: List[Dict[str, Any]], total: int, offset: int,
+                      keep_position: bool = False, words: List[str] = None, term=None):
+        """Displays a page of results returned by _query_page.
+
+        When words and term are given (fresh query results), the page is
+        remembered for narrowing while typing; otherwise the narrowing state
+        is left as it is.
+        """
+        self.total_results = total
+        self.page_offset = offset
+        if words is not None:
+            # Only a first page can be narrowed (its rows are the first matches)
+            self._shown_scope = (students_mode, term) if offset == 0 else None
+            self._shown_words = words
+            self._shown_rows = results
+            self._shown_complete = len(results) >= total
+
+        self._display_results(students_mode, results, keep_position=keep_position)
+        self._update_pager(len(results))
+
+    def _display_results(self, students_mode: bool, results: List[Dict[str, Any]], keep_position: bool = False):
+        """Shows results in the student or teacher table, numbered from the page offset."""
+        if students_mode:
+            self.display_student_results(results, first_serial=self.page_offset + 1, keep_position=keep_position)
+        else:
+            self.display_teacher_results(results, first_serial=self.page_offset + 1, keep_position=keep_position)
+
+    def display_student_results(self, students: List[Dict[str, Any]], first_serial: int = 1,
+                                keep_position: bool = False):
+        """Displays the student search results in the student table.
         
         Args:
-            teachers: A list of dictionaries, each representing a teacher record.
+            students: A list of student records.
+            first_serial: Serial number shown for the first row.
+            keep_position: Keep the table's scroll position instead of returning to the top.
         """
-        # Define headers for teacher results (order adjusted for RTL display)
-        headers = ["الإجراءات", "الفصل", "الاسم", "الرقم التسلسلي"] # Actions | Name | Term | Serial Number 
-      
-
-        # Create header row frame inside the scrollable frame
-        header_frame = ctk.CTkFrame(self.results_scroll_frame, fg_color="gray50") # Add a background color for header
-        # Place the header frame within the scrollable frame, spanning the full width
-        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-
-        # Configure columns for RTL table layout within the header frame (Action | Term | Name | Serial)
-        # Weights adjusted to distribute space more evenly among data columns
-        # These weights must match the weights in the data row frames below
-        header_frame.grid_columnconfigure(0, weight=0) # Action buttons column (fixed width/minimal weight)
-        header_frame.grid_columnconfigure(1, weight=1) # Term column (expands)
-        header_frame.grid_columnconfigure(2, weight=2) # Name column (expands more)
-        header_frame.grid_columnconfigure(3, weight=0) # Serial Number column (fixed width/minimal weight)
-
-        # Place headers from right to left using the map
-        display_headers_rtl_order = [headers[3], headers[2], headers[1], headers[0]] # Serial, Term, Name, Actions
-        display_columns_rtl_order = [3, 2, 1, 0] # Corresponding grid columns from right to left
-
-        for i, header_text in enumerate(display_headers_rtl_order):
-             ctk.CTkLabel(
-                header_frame,
-                text=self.arabic(header_text),
-                **TABLE_HEADER_STYLE
-            ).grid(row=0, column=display_columns_rtl_order[i], padx=5, sticky="nsew") # Use nsew sticky for better alignment
-
-        # Display teacher data rows starting from row 1 (after header)
-        for i, teacher in enumerate(teachers, start=1):
-            row_frame = ctk.CTkFrame(self.results_scroll_frame)
-            # Place the row frame within the scrollable frame, spanning the full width
-            # Ensure row in scrollable frame expands vertically
-            self.results_scroll_frame.grid_rowconfigure(i, weight=1)
-            row_frame.grid(row=i, column=0, sticky="ew", pady=2)
-
-            # Configure columns for RTL table layout within the row frame (Action | Term | Name | Serial)
-            # These weights must match the weights in the header frame
-            row_frame.grid_columnconfigure(0, weight=0) # Action buttons column
-            row_frame.grid_columnconfigure(1, weight=1) # Term column
-            row_frame.grid_columnconfigure(2, weight=2) # Name column
-            row_frame.grid_columnconfigure(3, weight=0) # Serial Number column
-
-            # Display Serial Number (far right column in RTL grid)
-            ctk.CTkLabel(row_frame, text=str(i), **TABLE_ROW_STYLE).grid(row=0, column=3, padx=5, sticky="nsew")
-
-            # Display Name (reversed for RTL display, placed in the middle-right column)
-            original_name = teacher.get("name", "")
-            name_parts = original_name.split()
-            reversed_name_parts = name_parts[::-1] # Reverse the list of parts
-            reversed_name = " ".join(reversed_name_parts) # Join parts with space
-            ctk.CTkLabel(row_frame, text=self.arabic(reversed_name), **TABLE_ROW_STYLE).grid(row=0, column=2, padx=5, sticky="nsew")
-
-            # Display Academic Level (Term) (middle-left column)
-            ctk.CTkLabel(row_frame, text=self.arabic(teacher.get("term", "")),
-                         **TABLE_ROW_STYLE).grid(row=0, column=1, padx=5, sticky="nsew")
-
-            # Action buttons (Place on the far left column in RTL grid)
-            actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            actions_frame.grid(row=0, column=0, padx=5, sticky="w") # Action buttons on the left, aligned west
-
-            # View details button
-            details_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("عرض"), # View
-                command=lambda t=teacher: self.show_teacher_details(t),
-                **ACTION_BUTTON_STYLE
-            )
-            details_button.pack(side="left", padx=2) # Pack to the left within actions_frame
-
-            # Edit button
-            edit_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("تعديل"), # Edit
-                command=lambda t=teacher: self.edit_teacher(t),
-                **ACTION_BUTTON_STYLE
-            )
-            edit_button.pack(side="left", padx=2) # Pack to the left within actions_frame
-
-            # Delete button
-            delete_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("حذف"), # Delete
-                command=lambda t=teacher: self.delete_teacher(t),
-                fg_color="red",
-                hover_color="darkred",
-                **ACTION_BUTTON_STYLE
-            )
-            delete_button.pack(side="left", padx=2) # Pack to the left within actions_frame
-
-            # Show Salary button (only for teachers)
-            salary_button = ctk.CTkButton(
-                actions_frame,
-                text=self.arabic("الرواتب"), # Salaries
-                command=lambda t=teacher: self.show_teacher_salary(t),
-                **SALARY_BUTTON_STYLE
-            )
-            salary_button.pack(side="left", padx=2) # Pack to the left within actions_frame
+        self._first_serial = first_serial
+        self._show_table(self.student_table)
+        self.student_table.set_rows(students, keep_position=keep_position)
+
+    def display_teacher_results(self, teachers: List[Dict[str, Any]], first_serial: int = 1,
+                                keep_position: bool = False):
+        """Displays the teacher search results in the teacher table.
+        
+        Args:
+            teachers: A list of teacher records.
+            first_serial: Serial number shown for the first row.
+            keep_position: Keep the table's scroll position instead of returning to the top.
+        """
+        self._first_serial = first_serial
+        self._show_table(self.teacher_table)
+        self.teacher_table.set_rows(teachers, keep_position=keep_position)
+
+    def _show_table(self, table: VirtualTable):
+        """Shows one of the two result tables in the results area and hides the other."""
+        for other in (self.student_table, self.teacher_table):
+            if other is not table:
+                other.grid_remove()
+        table.grid()
+
+    def _display_name(self, person) -> str:
+        """Returns a person's name with its words reversed, for RTL display."""
+        name_parts = person.get("name", "").split()
+        return " ".join(name_parts[::-1])
 
     def show_student_details(self, student: Dict[str, Any]):
         """Shows a popup window with detailed information for a student.
@@ -404,8 +485,8 @@ class SearchPage(ctk.CTkFrame):
         Args:
             student: A dictionary containing the student's data.
         """
-        # Pass self.search as on_close callback to refresh results after closing popup
-        StudentDetailsPopup(self.master, student, on_close=self.search)
+        # Refresh the results in place after closing the popup
+        StudentDetailsPopup(self.master, student, on_close=lambda: self.refresh_results(keep_position=True))
 
     def show_teacher_details(self, teacher: Dict[str, Any]):
         """Shows a popup window with detailed information for a teacher.
@@ -413,7 +494,7 @@ class SearchPage(ctk.CTkFrame):
         Args:
             teacher: A dictionary containing the teacher's data.
         """
-        TeacherDetailsPopup(self.master, teacher, arabic_handler=self.arabic, on_close=self.search)
+        TeacherDetailsPopup(self.master, teacher, on_close=lambda: self.refresh_results(keep_position=True))
 
     def edit_student(self, student: Dict[str, Any]):
         """Navigates to the student edit page.
@@ -458,7 +539,7 @@ class SearchPage(ctk.CTkFrame):
         # Show the search page again by re-gridding it
         self.grid(row=0, column=0, sticky="nsew", padx=20, pady=20) # Re-grid to its original position
         # Refresh the search results to reflect any changes made in the edit page
-        self.search()
+        self.refresh_results(keep_position=True)
 
     def delete_student(self, student: Dict[str, Any]):
         """Deletes a student record after user confirmation.
@@ -467,11 +548,15 @@ class SearchPage(ctk.CTkFrame):
             student: A dictionary containing the student's data to be deleted.
         """
         # Show confirmation dialog in Arabic
-        if messagebox.askyesno(self.arabic("تأكيد الحذف"), self.arabic(f"هل أنت متأكد من حذف الطالب {student.get('name', '')}؟")):
-            # Call backend function to delete student by name
-            delete_student_by_name(student.get('name', ''))
-            # Refresh search results after deletion
-            self.search()
+        if messagebox.askyesno("تأكيد الحذف", f"هل أنت متأكد من حذف الطالب {student.get('name', '')}؟"):
+            student_id = student.get('id')
+            if student_id is not None:
+                # Delete by ID: other students with the same name are kept
+                delete_student_by_id(student_id)
+                # Refresh search results after deletion
+                self.refresh_results(keep_position=True)
+            else:
+                messagebox.showerror("خطأ", "لا يمكن حذف الطالب: معرف الطالب غير موجود.")
 
     def delete_teacher(self, teacher: Dict[str, Any]):
         """Deletes a teacher record after user confirmation.
@@ -480,17 +565,17 @@ class SearchPage(ctk.CTkFrame):
             teacher: A dictionary containing the teacher's data to be deleted.
         """
         # Show confirmation dialog in Arabic
-        if messagebox.askyesno(self.arabic("تأكيد الحذف"), self.arabic(f"هل أنت متأكد من حذف المعلمة {teacher.get('name', '')}؟")):
+        if messagebox.askyesno("تأكيد الحذف", f"هل أنت متأكد من حذف المعلمة {teacher.get('name', '')}؟"):
             # Assuming teacher has an 'id' field for deletion
             teacher_id = teacher.get('id') # Replace 'id' with the actual field name if different
             if teacher_id:
                 # Call backend function to delete teacher by ID
                 delete_teacher_by_id(teacher_id)
                 # Refresh search results after deletion
-                self.search()
+                self.refresh_results(keep_position=True)
             else:
                 # Show error message if teacher ID is missing
-                messagebox.showerror(self.arabic("خطأ"), self.arabic("لا يمكن حذف المعلمة: معرف المعلمة غير موجود.")) # "Error", "Cannot delete teacher: Teacher ID not found."
+                messagebox.showerror("خطأ", "لا يمكن حذف المعلمة: معرف المعلمة غير موجود.") # "Error", "Cannot delete teacher: Teacher ID not found."
 
     def show_teacher_salary(self, teacher: Dict[str, Any]):
         """Shows a popup window with salary details for a teacher.
@@ -498,8 +583,13 @@ class SearchPage(ctk.CTkFrame):
         Args:
             teacher: A dictionary containing the teacher's data.
         """
-        # Pass self.arabic for Arabic handling in the popup and the teacher data
-        TeacherSalaryPopup(self.master, teacher, arabic_handler=self.arabic)
+        # Tk renders the page's Arabic as is, so the popup gets an identity handler
+        TeacherSalaryPopup(self.master, teacher, arabic_handler=lambda text: text)
+
+    def destroy(self):
+        """Cancels pending searches before destroying the page."""
+        self._cancel_search()
+        super().destroy()
 
     def go_back(self):
         """Navigates back to the previous page using the provided callback."""
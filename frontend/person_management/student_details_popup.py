@@ -5,6 +5,8 @@ about a specific student, including personal details and fee payments.
 """
 import customtkinter as ctk
 from typing import Callable, Dict, Any, Optional
+from backend.database import get_student_by_id
+from backend.dates import to_display
 
 class StudentDetailsPopup:
     """A toplevel window to show detailed information about a student.
@@ -19,26 +21,28 @@ class StudentDetailsPopup:
 
         Args:
             master: The parent widget (usually the main application window).
-            student: A dictionary containing the student's data.
+            student: A dictionary containing the student's data. The current
+                record is looked up again by its 'id', so the popup does not
+                show data edited since the search ran.
             on_close: An optional callback function to run when the popup is closed.
         """
         self.main = master
-        self.student = student
+        self.student = self._current_record(student)
         self.on_close = on_close
         self.details_window = None # Initialize window attribute
         self.show()
 
-    def arabic(self, text: str) -> str:
-        """Handles potential Arabic text display issues.
-        
-        Args:
-            text: The input string which may contain Arabic characters.
-            
-        Returns:
-            The processed string for display (identity function if no processing needed).
-        """
-        # Assuming Arabic reshaping/bidi handling is done elsewhere or not needed here
-        return text
+    @staticmethod
+    def _current_record(student: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the student's current record by ID, or the given data if it cannot be read."""
+        student_id = student.get('id')
+        if student_id is None:
+            return student
+        try:
+            return get_student_by_id(student_id) or student
+        except Exception as e:
+            print(f"Error loading student {student_id}: {e}")
+            return student
 
     def show(self):
         """Creates and displays the student details popup window.
@@ -53,7 +57,7 @@ class StudentDetailsPopup:
 
         # Create the toplevel window
         self.details_window = ctk.CTkToplevel(self.main)
-        self.details_window.title(self.arabic(f"تفاصيل الطالب - {self.student.get('name', '')}")) # Set window title
+        self.details_window.title(f"تفاصيل الطالب - {self.student.get('name', '')}") # Set window title
         self.details_window.geometry("400x470") # Set initial size
         self.details_window.resizable(False, False) # Prevent resizing
         self.details_window.transient(self.main)  # Make the popup appear on top of the main window
@@ -86,7 +90,7 @@ class StudentDetailsPopup:
         # Title label for the basic info section
         title_label = ctk.CTkLabel(
             frame,
-            text=self.arabic("معلومات الطالب"), # "Student Information"
+            text="معلومات الطالب", # "Student Information"
             font=("Arial", 20, "bold"),
             text_color="#2D8CFF"
         )
@@ -117,7 +121,7 @@ class StudentDetailsPopup:
             # Text label on the right, expanding to fill space
             ctk.CTkLabel(
                 row_frame,
-                text=self.arabic(text),
+                text=text,
                 font=("Arial", 16),
                 anchor="e", # Anchor text to the right
                 justify="right" # Justify text to the right
@@ -127,7 +131,7 @@ class StudentDetailsPopup:
         # Title label for the fees section
         fees_title = ctk.CTkLabel(
             frame,
-            text=self.arabic("الرسوم الدراسية"), # "Tuition Fees"
+            text="الرسوم الدراسية", # "Tuition Fees"
             font=("Arial", 18, "bold"),
             text_color="#4CAF50"
         )
@@ -151,7 +155,7 @@ class StudentDetailsPopup:
             # Fee name label on the right
             ctk.CTkLabel(
                 row_fee,
-                text=self.arabic(f"{fee_names[i]}:"),
+                text=f"{fee_names[i]}:",
                 font=("Arial", 15, "bold"),
                 width=120,
                 anchor="e" # Anchor to the right
@@ -159,7 +163,7 @@ class StudentDetailsPopup:
             # Fee amount label in the middle
             ctk.CTkLabel(
                 row_fee,
-                text=self.arabic(f"{fees[i]}"),
+                text=f"{fees[i]}",
                 font=("Arial", 15),
                 width=60,
                 anchor="e", # Anchor to the right
@@ -168,7 +172,7 @@ class StudentDetailsPopup:
             # Fee date label on the left
             ctk.CTkLabel(
                 row_fee,
-                text=self.arabic(f"تاريخ الدفع: {fee_dates[i]}"), # "Payment Date"
+                text=f"تاريخ الدفع: {to_display(fee_dates[i])}", # "Payment Date"
                 font=("Arial", 14),
                 anchor="e", # Anchor to the right
                 text_color="#666666"
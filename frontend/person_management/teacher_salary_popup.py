@@ -7,7 +7,10 @@ import customtkinter as ctk
 from tkinter import messagebox
 from typing import Dict, Any, Callable, Optional
 from backend.database import get_teacher_salaries, add_teacher_salary, update_teacher_salary
+from backend.money import Money
+from backend.dates import to_display
 from .utils import DateEntry
+from frontend.widgets import KeyedList
 
 class EditSalaryPopup(ctk.CTkToplevel):
     """Popup window for editing an existing salary entry.
@@ -15,7 +18,7 @@ class EditSalaryPopup(ctk.CTkToplevel):
     Provides a form to modify the amount and date of a specific salary record.
     """
     
-    def __init__(self, master, salary_id: int, current_amount: float, current_date: str, 
+    def __init__(self, master, salary_id: int, current_amount: Money, current_date: str, 
                  arabic_handler: Callable, on_save: Callable):
         """Initialize the EditSalaryPopup.
         
@@ -91,7 +94,7 @@ class EditSalaryPopup(ctk.CTkToplevel):
             
         # Validate amount is a number
         try:
-            amount = float(amount_str)
+            amount = Money.parse(amount_str)
         except ValueError:
             messagebox.showwarning(
                 self.arabic_handler("تحذير"), # "Warning"
@@ -204,6 +207,28 @@ class TeacherSalaryPopup(ctk.CTkToplevel):
         # Configure the inner frame within the scrollable frame to expand horizontally
         self.salaries_scroll_frame.grid_columnconfigure(0, weight=1)
 
+        # --- Create Table Headers for Salaries List (hidden while there are no salaries) ---
+        self.salaries_header = ctk.CTkFrame(self.salaries_scroll_frame) # Frame for headers
+        self.salaries_header.grid(row=0, column=0, sticky="ew", pady=(0, 5)) # Above salary entries
+        # Configure header column weights to match salary entry rows
+        self.salaries_header.grid_columnconfigure(0, weight=1) # Date column
+        self.salaries_header.grid_columnconfigure(1, weight=1) # Amount column
+        self.salaries_header.grid_columnconfigure(2, weight=0)  # Edit button column (fixed size)
+
+        # Place headers (RTL: Edit | Amount | Date)
+        ctk.CTkLabel(self.salaries_header, text=self.arabic_handler("المبلغ"), font=("Arial", 13, "bold")).grid(row=0, column=1, padx=5, sticky="e") # "Amount"
+        ctk.CTkLabel(self.salaries_header, text=self.arabic_handler("التاريخ"), font=("Arial", 13, "bold")).grid(row=0, column=0, padx=5, sticky="w") # "Date"
+        ctk.CTkLabel(self.salaries_header, text=self.arabic_handler("تعديل"), font=("Arial", 13, "bold")).grid(row=0, column=2, padx=5) # "Edit"
+
+        # Message shown instead of the list (no salaries, missing teacher ID)
+        self.salaries_message = ctk.CTkLabel(self.salaries_scroll_frame, text="")
+
+        # Salary rows, patched by salary id when the list is reloaded
+        self.salary_rows = KeyedList(
+            create=self._create_salary_row,
+            place=lambda row_frame, index: row_frame.grid(row=index + 1, column=0, sticky="ew", pady=2)
+        )
+
         # Load and display the initial list of salaries
         self.load_salaries()
 
@@ -222,7 +247,7 @@ class TeacherSalaryPopup(ctk.CTkToplevel):
 
         # Validate amount is a number
         try:
-            amount = float(amount_str)
+            amount = Money.parse(amount_str)
         except ValueError:
             messagebox.showwarning(self.arabic_handler("تحذير"), self.arabic_handler("الرجاء إدخال مبلغ صحيح.")) # "Warning", "Please enter a valid amount."
             return
@@ -249,61 +274,57 @@ class TeacherSalaryPopup(ctk.CTkToplevel):
     def load_salaries(self):
         """Loads and displays existing salaries for the teacher from the database.
         
-        Clears the current list and populates it with updated data.
+        Only the rows of salaries added, edited or removed since the last load
+        are changed; the other rows keep their widgets.
         """
-        # Clear existing entries in the scrollable frame
-        for widget in self.salaries_scroll_frame.winfo_children():
-            widget.destroy()
-
         # Get teacher ID (should be available)
         teacher_id = self.teacher.get('id')
         if teacher_id is None:
             # Display error message if teacher ID is missing
-            ctk.CTkLabel(self.salaries_scroll_frame, text=self.arabic_handler("لا يمكن عرض المرتبات. معرف المعلمة مفقود.")).pack(pady=10) # "Cannot display salaries. Teacher ID is missing."
+            self._show_salaries_message("لا يمكن عرض المرتبات. معرف المعلمة مفقود.") # "Cannot display salaries. Teacher ID is missing."
+            self.salary_rows.clear()
             return
 
         # Retrieve salaries from the database
         salaries = get_teacher_salaries(teacher_id)
 
         if salaries:
-            # --- Create Table Headers for Salaries List ---
-            header_frame = ctk.CTkFrame(self.salaries_scroll_frame) # Frame for headers
-            header_frame.pack(fill="x", pady=(0, 5)) # Pack above salary entries
-            # Configure header column weights to match salary entry rows
-            header_frame.grid_columnconfigure(0, weight=1) # Date column
-            header_frame.grid_columnconfigure(1, weight=1) # Amount column
-            header_frame.grid_columnconfigure(2, weight=0)  # Edit button column (fixed size)
-
-            # Place headers (RTL: Edit | Amount | Date)
-            ctk.CTkLabel(header_frame, text=self.arabic_handler("المبلغ"), font=("Arial", 13, "bold")).grid(row=0, column=1, padx=5, sticky="e") # "Amount"
-            ctk.CTkLabel(header_frame, text=self.arabic_handler("التاريخ"), font=("Arial", 13, "bold")).grid(row=0, column=0, padx=5, sticky="w") # "Date"
-            ctk.CTkLabel(header_frame, text=self.arabic_handler("تعديل"), font=("Arial", 13, "bold")).grid(row=0, column=2, padx=5) # "Edit"
-
-            # --- Display Each Salary Entry ---
-            for salary_id, amount, date in salaries:
-                row_frame = ctk.CTkFrame(self.salaries_scroll_frame) # Frame for each salary row
-                row_frame.pack(fill="x", pady=2)
-                # Configure row column weights to match headers
-                row_frame.grid_columnconfigure(0, weight=1)
-                row_frame.grid_columnconfigure(1, weight=1)
-                row_frame.grid_columnconfigure(2, weight=0)
-
-                # Display amount and date (RTL: Edit | Amount | Date)
-                ctk.CTkLabel(row_frame, text=str(amount), font=("Arial", 13)).grid(row=0, column=1, padx=5, sticky="e")
-                ctk.CTkLabel(row_frame, text=date, font=("Arial", 13)).grid(row=0, column=0, padx=5, sticky="w")
-                
-                # Edit button for the salary entry
-                edit_button = ctk.CTkButton(
-                    row_frame,
-                    text=self.arabic_handler("تعديل"), # "Edit"
-                    width=60,
-                    command=lambda sid=salary_id, amt=amount, dt=date: self.edit_salary(sid, amt, dt) # Pass salary details to edit method
-                )
-                edit_button.grid(row=0, column=2, padx=5)
+            self.salaries_message.grid_remove()
+            self.salaries_header.grid()
         else: # Message if no salaries are recorded
-            ctk.CTkLabel(self.salaries_scroll_frame, text=self.arabic_handler("لا توجد مرتبات مسجلة لهذه المعلمة.")).pack(pady=10) # "No salaries recorded for this teacher."
+            self._show_salaries_message("لا توجد مرتبات مسجلة لهذه المعلمة.") # "No salaries recorded for this teacher."
+        self.salary_rows.update(salaries)
+
+    def _show_salaries_message(self, text: str):
+        """Hides the list header and shows a message in the salaries list."""
+        self.salaries_header.grid_remove()
+        self.salaries_message.configure(text=self.arabic_handler(text))
+        self.salaries_message.grid(row=0, column=0, pady=10)
+
+    def _create_salary_row(self, salary):
+        """Creates the row of one (id, amount, date) salary record (placed by the KeyedList)."""
+        salary_id, amount, date = salary
+        row_frame = ctk.CTkFrame(self.salaries_scroll_frame) # Frame for each salary row
+        # Configure row column weights to match headers
+        row_frame.grid_columnconfigure(0, weight=1)
+        row_frame.grid_columnconfigure(1, weight=1)
+        row_frame.grid_columnconfigure(2, weight=0)
+
+        # Display amount and date (RTL: Edit | Amount | Date)
+        ctk.CTkLabel(row_frame, text=str(amount), font=("Arial", 13)).grid(row=0, column=1, padx=5, sticky="e")
+        ctk.CTkLabel(row_frame, text=to_display(date), font=("Arial", 13)).grid(row=0, column=0, padx=5, sticky="w")
+        
+        # Edit button for the salary entry
+        edit_button = ctk.CTkButton(
+            row_frame,
+            text=self.arabic_handler("تعديل"), # "Edit"
+            width=60,
+            command=lambda: self.edit_salary(salary_id, amount, date) # Pass salary details to edit method
+        )
+        edit_button.grid(row=0, column=2, padx=5)
+        return row_frame
 
-    def edit_salary(self, salary_id: int, current_amount: float, current_date: str):
+    def edit_salary(self, salary_id: int, current_amount: Money, current_date: str):
         """Opens the EditSalaryPopup window to modify a specific salary entry.
         
         Args:
@@ -4,18 +4,20 @@ This module contains helper functions for tasks like Arabic text normalization
 and date handling, as well as custom Tkinter widgets like a DateEntry with
 a calendar popup.
 """
-import unicodedata
 from typing import List, Tuple, Callable, Optional
 import customtkinter as ctk
 import tkinter as tk
 from datetime import datetime, date
 import calendar
 import re
+from backend.arabic import fold_arabic
+from backend.dates import parse_date
 
 def normalize_arabic(text: str) -> str:
     """Normalize Arabic text for consistent searching.
     
-    Removes diacritics and other presentation forms to simplify comparison.
+    Removes diacritics and tatweel, and unifies alef/hamza, taa marbuta and
+    alef maqsura variants, the same way the database search index does.
     
     Args:
         text: The input Arabic string.
@@ -23,9 +25,7 @@ def normalize_arabic(text: str) -> str:
     Returns:
         The normalized string.
     """
-    # Convert the text to a normalized form (NFKD) and encode/decode to remove diacritics.
-    # This helps in searching for Arabic names regardless of diacritics.
-    return unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+    return fold_arabic(text)
 
 def get_fee_dates(fee_date_widgets: List[Tuple]) -> List[str]:
     """Format fee dates from the date entry widgets.
@@ -240,14 +240,16 @@ class DateEntry(ctk.CTkFrame):
         """Sets the date in the entry field using DD-MM-YYYY format.
         
         Args:
-            date_str: The date string to set (expected DD-MM-YYYY).
+            date_str: The date string to set, as stored (YYYY-MM-DD) or as
+                displayed (DD-MM-YYYY). An empty string clears the entry.
         """
         try:
             # Attempt to parse the input date string
-            date = datetime.strptime(date_str, "%d-%m-%Y")
+            date = parse_date(date_str)
             # Clear the entry and insert the parsed and formatted date
             self.entry.delete(0, tk.END)
-            self.entry.insert(0, date.strftime("%d-%m-%Y")) # Ensure consistent format
+            if date:
+                self.entry.insert(0, date.strftime("%d-%m-%Y")) # Ensure consistent format
         except ValueError:
             # If the input string format is incorrect, do nothing or handle error
             pass # Silently fail if format is wrong, keeping existing text or clearing
@@ -4,7 +4,10 @@ Student registration form component.
 import customtkinter as ctk
 from tkinter import messagebox
 import tkinter as tk
-from backend.database import add_student
+from backend.database import add_student, queue_write
+from backend.dates import parse_date
+from backend.money import to_cents
+from frontend.background import when_done
 from .constants import (
     ACADEMIC_LEVELS,
     GENDER_OPTIONS,
@@ -254,12 +257,32 @@ class StudentRegistrationForm:
         for fee in fees:
             if fee:
                 try:
-                    float(fee)
+                    to_cents(fee)
                 except ValueError:
                     messagebox.showerror("خطأ", "يجب أن تكون جميع مبالغ الرسوم أرقامًا صحيحة.", parent=self.master)
                     return
+
+        # Validate fee dates are real dates
+        for fee_date in fee_dates:
+            try:
+                parse_date(fee_date)
+            except ValueError:
+                messagebox.showerror("خطأ", f"تاريخ غير صحيح: {fee_date}", parent=self.master)
+                return
             
-        add_student(name, nid, term, gender, phone1, phone2, fees, fee_dates)
+        # Registrations are entered back to back: queue the write so it is
+        # committed together with the others, and confirm once it is saved
+        self.register_button.configure(state="disabled")
+        when_done(
+            self.frame,
+            queue_write(add_student, name, nid, term, gender, phone1, phone2, fees, fee_dates),
+            on_success=lambda student_id: self._on_registered(),
+            on_error=self._on_register_failed
+        )
+
+    def _on_registered(self):
+        """Confirm a saved registration and clear the form for the next one."""
+        self.register_button.configure(state="normal")
         messagebox.showinfo("نجاح", "تم تسجيل الطالب بنجاح")
         
         # Clear form
@@ -268,6 +291,11 @@ class StudentRegistrationForm:
         clear_entry(self.phone1_entry, "أدخل رقم الهاتف")
         clear_entry(self.phone2_entry, "أدخل رقم الهاتف اخر ان وجد*")
         clear_fee_entries(self.fee_entries, self.fee_date_widgets)
+
+    def _on_register_failed(self, error):
+        """Report a registration that could not be saved (the form is kept)."""
+        self.register_button.configure(state="normal")
+        messagebox.showerror("خطأ", f"فشل تسجيل الطالب: {error}", parent=self.master)
         
     def go_back(self):
         """Handle back button click."""
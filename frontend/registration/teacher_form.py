@@ -4,7 +4,8 @@ Teacher registration form component.
 import customtkinter as ctk
 from tkinter import messagebox
 import tkinter as tk
-from backend.database import add_teacher
+from backend.database import add_teacher, queue_write
+from frontend.background import when_done
 from .constants import (
     ACADEMIC_LEVELS,
     GENDER_OPTIONS,
@@ -176,7 +177,18 @@ class TeacherRegistrationForm:
         if not validate_required_fields(name, nid, phone1, phone2):
             return
             
-        add_teacher(name, nid, term, gender, phone1, phone2)
+        # Queued with the other registrations; confirmed once it is saved
+        self.register_button.configure(state="disabled")
+        when_done(
+            self.frame,
+            queue_write(add_teacher, name, nid, term, gender, phone1, phone2),
+            on_success=lambda result: self._on_registered(),
+            on_error=self._on_register_failed
+        )
+
+    def _on_registered(self):
+        """Confirm a saved registration and clear the form for the next one."""
+        self.register_button.configure(state="normal")
         messagebox.showinfo("نجاح", "تم تسجيل المعلمة بنجاح")
         
         # Clear form
@@ -184,6 +196,11 @@ class TeacherRegistrationForm:
         clear_entry(self.nid_entry, "أدخل الرقم القومي")
         clear_entry(self.phone1_entry, "أدخل رقم الهاتف")
         clear_entry(self.phone2_entry, "أدخل رقم هاتف آخر إن وجد*")
+
+    def _on_register_failed(self, error):
+        """Report a registration that could not be saved (the form is kept)."""
+        self.register_button.configure(state="normal")
+        messagebox.showerror("خطأ", f"فشل تسجيل المعلمة: {error}", parent=self.master)
         
     def go_back(self):
         """Handle back button click."""
@@ -62,9 +62,10 @@ def get_fee_dates(date_widgets: List[Tuple]) -> List[str]:
         date_widgets: List of date widget tuples (day, month, year)
         
     Returns:
-        List of date strings in DD/MM/YYYY format
+        List of date strings in DD/MM/YYYY format ("" where the date is incomplete)
     """
-    return [
-        f"{day.get().strip()}/{month.get().strip()}/{year.get().strip()}"
-        for day, month, year in date_widgets
-    ] 
\ No newline at end of file
+    dates = []
+    for day, month, year in date_widgets:
+        parts = [day.get().strip(), month.get().strip(), year.get().strip()]
+        dates.append("/".join(parts) if all(parts) else "")
+    return dates 
\ No newline at end of file
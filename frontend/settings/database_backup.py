@@ -4,9 +4,9 @@ This module handles database backup operations including local and Google Drive
 """
 
 import os
-import shutil
+import tempfile
 import customtkinter
-from customtkinter import CTkProgressBar, CTkLabel
+from customtkinter import CTkProgressBar, CTkLabel, CTkButton
 from datetime import datetime, timedelta, timezone
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -14,6 +14,11 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 import pickle
 from backend import database
+from frontend.background import TaskCancelled, run_task
+
+# Upload size per request to Google Drive; progress and cancellation are
+# checked between chunks (must be a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 class DatabaseBackup:
     """
@@ -54,33 +59,54 @@ class DatabaseBackup:
         if not os.path.exists(backup_path):
             os.makedirs(backup_path)
 
-    def backup_database(self, backup_path, progress_callback=None, completion_callback=None, is_automatic=False):
+    def backup_database(self, backup_path, progress_callback=None, token=None):
         """
         Backup the database file to the specified location.
         
+        Runs on a background task thread, so it must not touch any widget.
+        
         Args:
             backup_path: Path where backup should be saved
-            progress_callback: Function to update progress
-            completion_callback: Function to call when backup is complete
-            is_automatic: Whether this is an automatic backup
+            progress_callback: Function called with the fraction copied so far
+            token: Optional CancellationToken; checked between copy steps
+            
+        Returns:
+            A (success, message) tuple for the user.
+            
+        Raises:
+            TaskCancelled: If the token was cancelled (the partial copy is removed).
         """
+        destination_path = os.path.join(backup_path, self.db_file)
+
+        def on_step(fraction):
+            if token:
+                token.raise_if_cancelled()
+            if progress_callback:
+                progress_callback(fraction)
+
         try:
             self.create_backup_folder(backup_path)
             source_path = os.path.join(os.getcwd(), self.db_file)
-            destination_path = os.path.join(backup_path, self.db_file)
             
+            if not os.path.exists(source_path):
+                raise FileNotFoundError(source_path)
+
             if os.path.exists(destination_path):
                 os.remove(destination_path)
                 
-            shutil.copy2(source_path, destination_path)
+            # Use SQLite's backup API rather than a file copy: the database runs in
+            # WAL mode, so recent changes may still live in the -wal file
+            database.backup_database_to(destination_path, on_step)
             self.last_backup_time = datetime.now()
             self.save_last_backup_time(backup_path)
             
-            if completion_callback and not is_automatic:
-                completion_callback(True, "تم حفظ البيانات محلياً بنجاح")
+            return True, "تم حفظ البيانات محلياً بنجاح"
+        except TaskCancelled:
+            if os.path.exists(destination_path):
+                os.remove(destination_path)
+            raise
         except Exception as e:
-            if completion_callback and not is_automatic:
-                completion_callback(False, f"حدث خطأ أثناء حفظ البيانات محلياً: {str(e)}")
+            return False, f"حدث خطأ أثناء حفظ البيانات محلياً: {str(e)}"
 
     def setup_google_drive(self, auth_callback=None):
         """
@@ -220,28 +246,32 @@ class DatabaseBackup:
         except Exception:
             return False
 
-    def backup_to_google_drive(self, progress_callback=None, completion_callback=None, auth_callback=None):
+    def backup_to_google_drive(self, progress_callback=None, token=None):
         """
         Backup database to Google Drive.
         
+        Runs on a background task thread, so it must not touch any widget.
+        The connection must already be authorized (see setup_google_drive).
+        
         Args:
-            progress_callback: Function to update progress
-            completion_callback: Function to call when backup is complete
-            auth_callback: Callback function for authentication
+            progress_callback: Function called with the fraction uploaded so far
+            token: Optional CancellationToken; checked between upload chunks
+            
+        Returns:
+            A (success, message) tuple for the user.
+            
+        Raises:
+            TaskCancelled: If the token was cancelled.
         """
         try:
             if not self.drive_service:
-                if not self.setup_google_drive(auth_callback):
-                    if completion_callback:
-                        completion_callback(False, "فشل الاتصال بـ Google Drive")
-                    return
+                if not self.setup_google_drive() or not self.drive_service:
+                    return False, "فشل الاتصال بـ Google Drive"
 
             folder_id = self._get_or_create_folder(self.drive_folder_name)
             
             if not folder_id:
-                if completion_callback:
-                    completion_callback(False, "فشل إنشاء أو العثور على مجلد النسخ الاحتياطي على Google Drive")
-                return
+                return False, "فشل إنشاء أو العثور على مجلد النسخ الاحتياطي على Google Drive"
 
             file_metadata = {
                 'name': f'students_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.db',
@@ -251,31 +281,74 @@ class DatabaseBackup:
             database_file_path = os.path.join(os.getcwd(), self.db_file)
 
             if not os.path.exists(database_file_path):
-                if completion_callback:
-                    completion_callback(False, f"ملف قاعدة البيانات غير موجود: {self.db_file}")
-                return
+                return False, f"ملف قاعدة البيانات غير موجود: {self.db_file}"
+
+            self._upload_snapshot(file_metadata, progress_callback, token)
+            
+            self.cleanup_google_drive_backups()
+
+            return True, "تم حفظ البيانات على Google Drive بنجاح"
+                
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            return False, f"حدث خطأ أثناء حفظ البيانات على Google Drive: {str(e)}"
+
+    def _upload_snapshot(self, file_metadata, progress_callback=None, token=None):
+        """
+        Upload a consistent snapshot of the database to Google Drive.
+
+        The live database file cannot be uploaded as it is: in WAL mode recent
+        changes may still live in the -wal file, and writes during the upload
+        would change the file under it. The snapshot is written to a temporary
+        file with SQLite's backup API, uploaded, and then removed.
+
+        Args:
+            file_metadata: Drive metadata (name, parents) of the new file
+            progress_callback: Function called with the fraction uploaded so far
+            token: Optional CancellationToken; checked between snapshot steps and upload chunks
+
+        Raises:
+            TaskCancelled: If the token was cancelled.
+        """
+        def on_step(fraction):
+            if token:
+                token.raise_if_cancelled()
+
+        fd, snapshot_path = tempfile.mkstemp(prefix="students_backup_", suffix=".db")
+        os.close(fd)
+        media = None
+        try:
+            database.backup_database_to(snapshot_path, on_step)
 
             media = MediaFileUpload(
-                database_file_path,
+                snapshot_path,
                 mimetype='application/octet-stream',
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True
             )
             
-            file = self.drive_service.files().create(
+            request = self.drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, modifiedTime'
-            ).execute()
-            
-            self.cleanup_google_drive_backups()
-
-            if completion_callback:
-                completion_callback(True, "تم حفظ البيانات على Google Drive بنجاح")
-                
-        except Exception as e:
-            if completion_callback:
-                completion_callback(False, f"حدث خطأ أثناء حفظ البيانات على Google Drive: {str(e)}")
-            raise
+            )
+            # Upload chunk by chunk so progress can be shown and the user can cancel
+            response = None
+            while response is None:
+                if token:
+                    token.raise_if_cancelled()
+                status, response = request.next_chunk()
+                if status and progress_callback:
+                    progress_callback(status.progress())
+        finally:
+            if media is not None:
+                # The upload keeps the file open; close it so it can be removed (Windows)
+                media.stream().close()
+            try:
+                os.remove(snapshot_path)
+            except OSError as e:
+                print(f"Could not remove backup snapshot {snapshot_path}: {e}")
 
     def cleanup_google_drive_backups(self):
         """Cleanup old backups from Google Drive."""
@@ -363,11 +436,19 @@ class DatabaseBackup:
         except Exception:
             return None
 
-    def show_backup_progress(self):
-        """Show progress bar and status during backup."""
+    def show_backup_progress(self, on_cancel=None):
+        """
+        Show a progress window during backup.
+        
+        Args:
+            on_cancel: Called when the user presses Cancel or closes the window
+            
+        Returns:
+            The progress window; update it with set_progress().
+        """
         self.progress_window = customtkinter.CTkToplevel(self.parent_frame)
         self.progress_window.title("حفظ البيانات")
-        self.progress_window.geometry("400x150")
+        self.progress_window.geometry("400x170")
         self.progress_window.transient(self.parent_frame)
         self.progress_window.grab_set()
         
@@ -388,20 +469,22 @@ class DatabaseBackup:
             font=("Arial", 14)
         )
         status_label.pack(pady=10)
-        
-        self.progress_window.after(100, self.update_progress)
+
+        if on_cancel:
+            CTkButton(
+                self.progress_window,
+                text="إلغاء",
+                font=("Arial", 14),
+                command=on_cancel
+            ).pack(pady=(0, 10))
+            self.progress_window.protocol("WM_DELETE_WINDOW", on_cancel)
         
         return self.progress_window
 
-    def update_progress(self):
-        """Update progress bar in the main thread."""
-        if self.progress_window and self.progress_bar:
-            current = self.progress_bar.get()
-            if current < 1.0:
-                self.progress_bar.set(current + 0.1)
-                self.progress_window.after(100, self.update_progress)
-            else:
-                self.progress_window.destroy()
+    def set_progress(self, fraction):
+        """Update the progress bar (main thread only)."""
+        if self.progress_window and self.progress_window.winfo_exists() and self.progress_bar:
+            self.progress_bar.set(min(max(fraction, 0.0), 1.0))
 
     def check_and_backup(self):
         """Check if automatic backup is needed and perform it if necessary."""
@@ -423,11 +506,15 @@ class DatabaseBackup:
             saved_path = database.get_setting('local_backup_path')
 
             if saved_path:
-                self.backup_database(saved_path, is_automatic=True)
-                self.save_last_backup_time(os.path.join(os.getcwd(), "System_Backup", "last_backup.txt"))
+                run_task(self.parent_frame, self._automatic_backup, saved_path)
 
         self.parent_frame.after(3600000, self.check_and_backup)
 
+    def _automatic_backup(self, context, saved_path):
+        """Background task for the automatic backup (results are not shown)."""
+        self.backup_database(saved_path, token=context.token)
+        self.save_last_backup_time(os.path.join(os.getcwd(), "System_Backup", "last_backup.txt"))
+
     def start_automatic_backup(self):
         """Start the automatic backup system."""
         self.check_and_backup()
@@ -6,14 +6,13 @@ This module handles the settings interface and backup operations.
 # Third-party imports
 import customtkinter
 from customtkinter import CTkFrame, CTkLabel, CTkButton, CTkEntry, CTkTextbox
-import arabic_reshaper
-from bidi.algorithm import get_display
-import threading
 import tkinter.messagebox as messagebox
 import tkinter.filedialog as filedialog
 
 # Local imports
 from .database_backup import DatabaseBackup
+from frontend.background import CancellationToken, call_in_ui, run_task
+from frontend.text_shaping import shape_text
 from backend import database
 
 class SettingsPage(CTkFrame):
@@ -60,18 +59,17 @@ class SettingsPage(CTkFrame):
         self.load_saved_backup_path()
         self.db_backup.start_automatic_backup()
 
-    def arabic(self, text: str) -> str:
-        """
-        Convert and display Arabic text properly.
+        # Keep the path entry in step with the saved setting, e.g. when it is
+        # changed by another instance of the application
+        database.get_settings_store().add_observer(self._observe_setting)
 
-        Args:
-            text: The Arabic text to be displayed
+    def destroy(self):
+        """Stops observing the settings before the page is destroyed."""
+        database.get_settings_store().remove_observer(self._observe_setting)
+        super().destroy()
 
-        Returns:
-            Properly formatted Arabic text
-        """
-        reshaped = arabic_reshaper.reshape(text)
-        return get_display(reshaped)
+    # Format Arabic text for proper display (shared, memoized shaping)
+    arabic = staticmethod(shape_text)
 
     def setup_ui(self):
         """Set up the settings page user interface."""
@@ -186,6 +184,22 @@ class SettingsPage(CTkFrame):
             self.local_backup_path_entry.delete(0, "end")
             self.local_backup_path_entry.insert(0, saved_path)
 
+    def _observe_setting(self, key, value):
+        """Settings observer: hands the change to the Tk thread.
+
+        The store calls observers on whichever thread noticed the change.
+        """
+        call_in_ui(self, self._on_setting_changed, key, value)
+
+    def _on_setting_changed(self, key, value):
+        """Shows a new saved backup path in the entry (on the Tk thread)."""
+        if key != 'local_backup_path' or self.local_backup_path_entry is None:
+            return
+        if self.local_backup_path_entry.get().strip() != (value or ""):
+            self.local_backup_path_entry.delete(0, "end")
+            if value:
+                self.local_backup_path_entry.insert(0, value)
+
     def backup_database(self):
         """Handle database backup process using the user-specified path."""
         backup_path = self.local_backup_path_entry.get().strip()
@@ -194,25 +208,54 @@ class SettingsPage(CTkFrame):
             messagebox.showwarning("تحذير", ("الرجاء تحديد مسار الحفظ المحلي أولاً."))
             return
 
-        progress_window = self.db_backup.show_backup_progress()
-
         def on_backup_complete(success, message):
-            if progress_window and progress_window.winfo_exists():
-                progress_window.after(100, progress_window.destroy)
+            if success:
+                messagebox.showinfo("نجاح", message)
+            else:
+                messagebox.showerror("خطأ", message)
 
-            def show_message():
-                if success:
-                    messagebox.showinfo("نجاح", message)
-                else:
-                    messagebox.showerror("خطأ", message)
+        self._run_backup_task(self.db_backup.backup_database, backup_path, on_done=on_backup_complete)
+
+    def _run_backup_task(self, backup, *args, on_done):
+        """
+        Run a backup function as a cancellable background task behind the progress window.
 
-            self.after(0, show_message)
+        Args:
+            backup: DatabaseBackup method returning (success, message); it is called
+                with *args plus progress_callback and token keyword arguments
+            *args: Arguments for the backup function
+            on_done: Called on the main thread with (success, message)
+        """
+        token = CancellationToken()
+        progress_window = self.db_backup.show_backup_progress(on_cancel=token.cancel)
+
+        def close_progress():
+            if progress_window.winfo_exists():
+                progress_window.destroy()
 
-        threading.Thread(
-            target=self.db_backup.backup_database,
-            args=(backup_path, None, on_backup_complete),
-            daemon=True
-        ).start()
+        def on_success(result):
+            close_progress()
+            on_done(*result)
+
+        def on_error(error):
+            close_progress()
+            messagebox.showerror("خطأ", f"حدث خطأ أثناء النسخ الاحتياطي: {str(error)}")
+
+        def on_cancel():
+            close_progress()
+            messagebox.showinfo("إلغاء", "تم إلغاء النسخ الاحتياطي")
+
+        # Callbacks go to the main window so the result is still shown if the
+        # user leaves the settings page while the backup runs
+        run_task(
+            self.main_window,
+            lambda context: backup(*args, progress_callback=context.report_progress, token=context.token),
+            on_success=on_success,
+            on_error=on_error,
+            on_progress=lambda fraction, message: self.db_backup.set_progress(fraction),
+            on_cancel=on_cancel,
+            token=token
+        )
 
     def show_auth_window(self, auth_url):
         """
@@ -306,60 +349,63 @@ class SettingsPage(CTkFrame):
                 ("الرجاء إدخال كود التحقق")
             )
             return
-            
-        def auth_thread():
-            success = self.db_backup.complete_google_drive_auth(verification_code)
+
+        def on_auth_complete(success):
             if success:
-                self.auth_window.destroy()
+                if self.auth_window and self.auth_window.winfo_exists():
+                    self.auth_window.destroy()
                 self.backup_to_google_drive()
             else:
                 messagebox.showerror(
                     ("خطأ"),
                     ("فشل في إكمال المصادقة. الرجاء المحاولة مرة أخرى.")
                 )
-                
-        threading.Thread(target=auth_thread, daemon=True).start()
+
+        run_task(
+            self.main_window,
+            lambda context: self.db_backup.complete_google_drive_auth(verification_code),
+            on_success=on_auth_complete,
+            on_error=lambda error: on_auth_complete(False)
+        )
 
     def backup_to_drive(self):
         """Handle Google Drive backup with OOB authentication."""
-        def auth_callback(auth_url):
-            self.show_auth_window(auth_url)
-            
-        if not self.db_backup.setup_google_drive(auth_callback):
-            messagebox.showerror(
-                ("خطأ"),
-                ("فشل في الاتصال بـ Google Drive")
+        def connect(context):
+            # The authorization window is opened on the main thread
+            return self.db_backup.setup_google_drive(
+                lambda auth_url: context.call_in_ui(self.show_auth_window, auth_url)
             )
-        else:
-            self.backup_to_google_drive()
+
+        def on_connected(connected):
+            if not connected:
+                messagebox.showerror(
+                    ("خطأ"),
+                    ("فشل في الاتصال بـ Google Drive")
+                )
+            elif self.db_backup.drive_service:
+                self.backup_to_google_drive()
+            # Otherwise the authorization window is open; the backup starts
+            # once the verification code is confirmed
+
+        run_task(
+            self.main_window,
+            connect,
+            on_success=on_connected,
+            on_error=lambda error: on_connected(False)
+        )
 
     def backup_to_google_drive(self):
         """Perform the actual backup to Google Drive."""
-        progress_window = self.db_backup.show_backup_progress()
-
         def on_backup_complete(success, message):
-            if progress_window and progress_window.winfo_exists():
-                progress_window.destroy()
-            
             if success:
-                self.show_backup_result(success, message, progress_window)
+                self.show_backup_result(success, message, None)
             else:
                 messagebox.showerror(
                     ("خطأ"),
                     (message)
                 )
 
-        def backup_thread():
-            try:
-                self.db_backup.backup_to_google_drive(
-                    progress_callback=None,
-                    completion_callback=on_backup_complete,
-                    auth_callback=self.show_auth_window
-                )
-            except Exception as e:
-                on_backup_complete(False, f"حدث خطأ أثناء النسخ الاحتياطي: {str(e)}")
-
-        threading.Thread(target=backup_thread, daemon=True).start()
+        self._run_backup_task(self.db_backup.backup_to_google_drive, on_done=on_backup_complete)
 
     def show_backup_result(self, success, message, progress_window):
         """Show backup result message."""
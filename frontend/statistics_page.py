@@ -13,6 +13,11 @@ from tkinter import messagebox
 from customtkinter import CTkFrame, CTkLabel, CTkButton
 # Local application imports
 from backend.database import get_detailed_statistics
+from .background import run_in_background, create_loading_label, LOADING_TEXT
+from .text_shaping import SHAPED_ACADEMIC_LEVELS, shape_text, shape_texts
+
+# Column headers of the students-by-term table, shaped once
+TERM_TABLE_HEADERS = tuple(shape_texts(["إجمالي الرسوم:", "عدد الطلاب:", "الفصل:"]))
 
 class StatisticsPage:
     """
@@ -36,20 +41,8 @@ class StatisticsPage:
         self.on_back = on_back
         self.setup_ui()
 
-    def arabic(self, text: str) -> str:
-        """
-        Format Arabic text for proper display.
-
-        Args:
-            text (str): The Arabic text to be displayed
-
-        Returns:
-            str: Properly formatted Arabic text
-        """
-        import arabic_reshaper
-        from bidi.algorithm import get_display
-        reshaped = arabic_reshaper.reshape(text)
-        return get_display(reshaped)
+    # Format Arabic text for proper display (shared, memoized shaping)
+    arabic = staticmethod(shape_text)
 
     def setup_ui(self):
         """Set up the statistics page user interface."""
@@ -107,15 +100,29 @@ class StatisticsPage:
         title.grid(row=0, column=1, pady=(10, 20), sticky="n")
 
     def _load_and_display_statistics(self):
-        """Load statistics data and display it in the UI."""
-        try:
-            self.stats = get_detailed_statistics()
-            self.display_statistics()
-        except Exception as e:
-            messagebox.showerror(
-                "خطأ",
-                f"حدث خطأ أثناء جلب البيانات: {str(e)}"
-            )
+        """Load statistics data in the background and display it when it arrives."""
+        self.loading_label = create_loading_label(self.main_frame, self.arabic(LOADING_TEXT))
+        self.loading_label.grid(row=1, column=0, columnspan=2, pady=40)
+        run_in_background(
+            self.main_frame,
+            get_detailed_statistics,
+            on_success=self._on_statistics_loaded,
+            on_error=self._on_statistics_error
+        )
+
+    def _on_statistics_loaded(self, stats):
+        """Replace the loading placeholder with the statistics sections."""
+        self.loading_label.destroy()
+        self.stats = stats
+        self.display_statistics()
+
+    def _on_statistics_error(self, error):
+        """Report a failure to load the statistics."""
+        self.loading_label.destroy()
+        messagebox.showerror(
+            "خطأ",
+            f"حدث خطأ أثناء جلب البيانات: {str(error)}"
+        )
 
     def display_statistics(self):
         """Display all statistics sections."""
@@ -205,11 +212,10 @@ class StatisticsPage:
         students_title.grid(row=0, column=0, columnspan=3, pady=10, padx=10, sticky="e")
         
         # Column headers
-        headers = ["إجمالي الرسوم:", "عدد الطلاب:", "الفصل:"]
-        for col, header in enumerate(headers):
+        for col, header in enumerate(TERM_TABLE_HEADERS):
             CTkLabel(
                 students_frame,
-                text=self.arabic(header),
+                text=header,
                 font=("Arial", 18, "bold"),
                 justify="right",
                 text_color="#4CAF50"
@@ -217,11 +223,13 @@ class StatisticsPage:
         
         # Display students data
         students_by_term = self.stats["students_by_term"]
-        for row_idx, (term, data) in enumerate(students_by_term.items(), start=2):
+        # Terms are academic levels, shaped at import; other terms are shaped here
+        shaped_terms = [SHAPED_ACADEMIC_LEVELS.get(term) or shape_text(term) for term in students_by_term]
+        for row_idx, (term, data) in enumerate(zip(shaped_terms, students_by_term.values()), start=2):
             # Term name
             CTkLabel(
                 students_frame,
-                text=self.arabic(term),
+                text=term,
                 font=("Arial", 20),
                 justify="right",
                 text_color="#333333"
@@ -255,11 +263,13 @@ class StatisticsPage:
             color: Color for labels
             start_row: Starting row index
         """
-        for i, (label, value) in enumerate(data):
+        labels = shape_texts(f"{label}:" for label, _ in data)
+        values = shape_texts(value for _, value in data)
+        for i, (label, value) in enumerate(zip(labels, values)):
             # Label
             CTkLabel(
                 parent,
-                text=self.arabic(f"{label}:"),
+                text=label,
                 font=("Arial", 18, "bold"),
                 anchor="e",
                 justify="right",
@@ -269,7 +279,7 @@ class StatisticsPage:
             # Value
             CTkLabel(
                 parent,
-                text=self.arabic(value),
+                text=value,
                 font=("Arial", 20),
                 anchor="w",
                 justify="left",
@@ -277,11 +287,8 @@ class StatisticsPage:
             ).grid(row=i+start_row, column=0, padx=10, pady=8, sticky="w")
 
     def go_back(self):
-        """Handle navigation back to the previous page."""
+        """Handle navigation back to the previous page (which hides this one)."""
         try:
-            for widget in self.main.winfo_children():
-                widget.destroy()
-
             if self.on_back:
                 self.on_back()
         except Exception:
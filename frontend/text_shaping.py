@@ -0,0 +1,71 @@
+"""
+Arabic text shaping for display, shared by all pages.
+
+Tk draws Arabic letters unjoined and left to right, so the pages pass their
+Arabic text through arabic_reshaper (joined letter forms) and python-bidi
+(visual order) before showing it. The same texts (titles, headers, terms,
+button labels) are shaped again on every render, once per label and once per
+row of a list. shape_text keeps the shaped texts in one bounded LRU cache for
+the whole process, so each distinct text is shaped once.
+
+The texts of the constants used across the pages (academic levels, search
+modes, fee types) are shaped when this module is imported. They map each raw
+text to its shaped form, so a page keeps the raw text for the database (a
+level is a term) and shows the shaped one.
+"""
+from functools import lru_cache
+from typing import Iterable, List
+
+import arabic_reshaper
+from bidi.algorithm import get_display
+
+from .person_management.constants import ACADEMIC_LEVELS, SEARCH_MODES, FEE_TYPES
+
+# Distinct texts kept shaped: the fixed texts of the pages plus the most
+# recently shown names, descriptions, dates, ...
+SHAPE_CACHE_SIZE = 4096
+
+# --- Shaping ---
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def _shape(text: str) -> str:
+    return get_display(arabic_reshaper.reshape(text))
+
+def shape_text(text) -> str:
+    """Returns text with its Arabic letters joined and in display order.
+
+    Args:
+        text: The text to shape; anything else than a str is converted with
+            str() ("" for None).
+    """
+    if not isinstance(text, str):
+        text = "" if text is None else str(text)
+    return _shape(text)
+
+def shape_texts(texts: Iterable) -> List[str]:
+    """Shapes a batch of texts, e.g. the cells of a list being rendered.
+
+    Texts repeated within the batch (the same term on many rows, ...) are
+    looked up once.
+    """
+    shaped = {}
+    result = []
+    for text in texts:
+        if text not in shaped:
+            shaped[text] = shape_text(text)
+        result.append(shaped[text])
+    return result
+
+def get_shape_cache_info():
+    """Returns the cache statistics (hits, misses, maxsize, currsize)."""
+    return _shape.cache_info()
+
+def clear_shape_cache():
+    """Empties the cache of shaped texts."""
+    _shape.cache_clear()
+
+# --- Pre-shaped Constants ---
+
+SHAPED_ACADEMIC_LEVELS = dict(zip(ACADEMIC_LEVELS, shape_texts(ACADEMIC_LEVELS)))
+SHAPED_SEARCH_MODES = dict(zip(SEARCH_MODES, shape_texts(SEARCH_MODES)))
+SHAPED_FEE_TYPES = dict(zip(FEE_TYPES, shape_texts(FEE_TYPES)))
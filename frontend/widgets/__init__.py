@@ -0,0 +1,7 @@
+"""
+Reusable widgets shared by the application's pages.
+"""
+from .keyed_list import KeyedList
+from .virtual_table import VirtualTable, Column, Action
+
+__all__ = ['KeyedList', 'VirtualTable', 'Column', 'Action']
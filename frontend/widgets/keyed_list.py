@@ -0,0 +1,99 @@
+"""Keyed reconciliation of list views.
+
+The list views used to destroy every row and build the list again after any
+edit or delete. KeyedList remembers which row widgets show which record, by
+the record's primary key, and patches the view when new data arrives:
+
+- records that are new get a row (create + place)
+- records that are gone have their row destroyed
+- records whose data changed get their row rebuilt
+- unchanged records keep their widgets; they are only placed again when
+  their position in the list moved (e.g. the rows after a deleted one)
+
+Deleting one record therefore destroys one row and builds nothing.
+"""
+from collections import namedtuple
+from typing import Callable, Iterable
+
+# What a KeyedList keeps per record: the record, its row widget(s), its position
+_Row = namedtuple("_Row", ["item", "handle", "index"])
+
+
+def _destroy(handle):
+    """Destroys a row's widget, or each widget of a tuple/list of them."""
+    if isinstance(handle, (tuple, list)):
+        for widget in handle:
+            widget.destroy()
+    else:
+        handle.destroy()
+
+
+class KeyedList:
+    """The rows of a list view, reconciled with new records by primary key.
+
+    Attributes:
+        create: create(item) builds the row for a record and returns its widget,
+            or a tuple of widgets (cells gridded straight into a table frame).
+        place: place(handle, index) puts a row at a position in the list.
+        key: key(item) returns the record's primary key (default: item[0]).
+    """
+
+    def __init__(self, create: Callable, place: Callable, key: Callable = None):
+        self.create = create
+        self.place = place
+        self.key = key or (lambda item: item[0])
+        self._rows = {}  # key -> _Row
+
+    def update(self, items: Iterable) -> dict:
+        """Patches the rendered rows to show items, in order.
+
+        Records are compared with ==, so the backend.records types and
+        plain tuples work as they are.
+
+        Returns:
+            Counts of the rows "inserted", "removed", "changed" (rebuilt) and
+            "moved" (placed again) by this update.
+
+        Raises:
+            ValueError: If two items have the same key.
+        """
+        counts = {"inserted": 0, "removed": 0, "changed": 0, "moved": 0}
+        old_rows = self._rows
+        new_rows = {}
+        try:
+            for index, item in enumerate(items):
+                key = self.key(item)
+                if key in new_rows:
+                    raise ValueError(f"duplicate key in list items: {key!r}")
+                old = old_rows.pop(key, None)
+                if old is not None and old.item == item:
+                    handle = old.handle
+                    if old.index != index:
+                        self.place(handle, index)
+                        counts["moved"] += 1
+                else:
+                    if old is not None:
+                        _destroy(old.handle)
+                        counts["changed"] += 1
+                    else:
+                        counts["inserted"] += 1
+                    handle = self.create(item)
+                    self.place(handle, index)
+                new_rows[key] = _Row(item, handle, index)
+        finally:
+            # Rows of records no longer listed (or left over when an error
+            # interrupted the update) are removed
+            for old in old_rows.values():
+                _destroy(old.handle)
+                counts["removed"] += 1
+            self._rows = new_rows
+        return counts
+
+    def clear(self):
+        """Destroys every row."""
+        for row in self._rows.values():
+            _destroy(row.handle)
+        self._rows = {}
+
+    def __len__(self):
+        return len(self._rows)
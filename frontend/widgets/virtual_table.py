@@ -0,0 +1,283 @@
+"""Virtualized table widget.
+
+Building one frame, several labels and buttons for every row of a long list
+costs seconds and thousands of Tk widgets, and all of them have to be
+destroyed again before the next list can be shown. VirtualTable only creates
+the rows that fit in its visible area (plus a few rows of overscan) and
+reuses them: scrolling, or showing a new list, binds other rows of data to
+the same widgets by index instead of creating new ones.
+
+The table scrolls one row at a time, with the mouse wheel or the scrollbar.
+Columns are laid out left to right in the order given; the action buttons,
+if any, sit in the leftmost column (the right-to-left layout of the app's
+tables).
+"""
+import math
+import sys
+from collections import namedtuple
+from typing import List, Sequence
+
+import customtkinter as ctk
+
+# A data column: header title, grid weight, and text(index, row) -> str
+Column = namedtuple("Column", ["title", "weight", "text"])
+
+# A button shown on every row: label, command(row) and extra CTkButton options
+Action = namedtuple("Action", ["text", "command", "style"], defaults=[None])
+
+# Rows created beyond the fully visible ones (the partly visible last row,
+# and a taller window or the next scroll step find them already bound)
+DEFAULT_OVERSCAN = 3
+
+# Vertical padding around each row, in pixels (as the row frames had before)
+ROW_PADY = 2
+
+# Rows moved per mouse wheel notch
+WHEEL_ROWS = 3
+
+
+class _Slot:
+    """The widgets of one recycled row and the data index they currently show."""
+
+    __slots__ = ("frame", "labels", "texts", "index")
+
+    def __init__(self, frame, labels):
+        self.frame = frame
+        self.labels = labels
+        self.texts = [None] * len(labels)  # Last text set on each label
+        self.index = None
+
+
+class VirtualTable(ctk.CTkFrame):
+    """A scrolling table that keeps widgets only for its visible rows.
+
+    Attributes:
+        columns: The data columns, left to right.
+        actions: Buttons shown on every row, in the leftmost column.
+        overscan: Rows kept bound beyond the visible area.
+    """
+
+    def __init__(self, master, columns: Sequence[Column], actions: Sequence[Action] = (),
+                 header_style: dict = None, row_style: dict = None, header_color: str = "gray50",
+                 actions_title: str = "الإجراءات", height: int = 200, row_height: int = 36,
+                 overscan: int = DEFAULT_OVERSCAN, **kwargs):
+        """Initialize the table.
+
+        Args:
+            master: The parent widget.
+            columns: Data columns, left to right.
+            actions: Row buttons, left to right.
+            header_style: CTkLabel options for the header labels.
+            row_style: CTkLabel options for the cell labels.
+            header_color: Background color of the header row.
+            actions_title: Header title of the actions column ("Actions").
+            height: Height of the rows area in pixels (it also stretches with the layout).
+            row_height: Estimated row height in pixels, used until a row has been laid out.
+            overscan: Rows kept bound beyond the visible area.
+            **kwargs: Options for the table's CTkFrame.
+        """
+        super().__init__(master, **kwargs)
+        self.columns = list(columns)
+        self.actions = list(actions)
+        self.overscan = overscan
+        self._header_style = header_style or {}
+        self._row_style = row_style or {}
+        self._row_height = row_height
+
+        self._rows = []
+        self._first = 0     # Index of the row shown at the top
+        self._visible = 1   # Rows that fit entirely in the body
+        self._slots = []
+        self._message = None
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._build_header(header_color, actions_title)
+
+        # The body does not grow with its rows: rows past its bottom edge are clipped
+        self._body = ctk.CTkFrame(self, fg_color="transparent", height=height)
+        self._body.grid(row=1, column=0, sticky="nsew")
+        self._body.grid_propagate(False)
+        self._body.grid_columnconfigure(0, weight=1)
+        self._body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self._body)
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=1, column=1, sticky="ns")
+
+    # --- Layout ---
+
+    def _configure_columns(self, frame):
+        """Gives a header or row frame the table's column weights."""
+        offset = 1 if self.actions else 0
+        if self.actions:
+            frame.grid_columnconfigure(0, weight=0)
+        for i, column in enumerate(self.columns):
+            frame.grid_columnconfigure(i + offset, weight=column.weight)
+
+    def _build_header(self, header_color, actions_title):
+        """Creates the header row."""
+        header = ctk.CTkFrame(self, fg_color=header_color)
+        header.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+        self._configure_columns(header)
+        offset = 1 if self.actions else 0
+        if self.actions:
+            ctk.CTkLabel(header, text=actions_title, **self._header_style).grid(
+                row=0, column=0, padx=5, sticky="nsew")
+        for i, column in enumerate(self.columns):
+            ctk.CTkLabel(header, text=column.title, **self._header_style).grid(
+                row=0, column=i + offset, padx=5, sticky="nsew")
+
+    def _create_slot(self, position: int) -> _Slot:
+        """Creates the widgets of one row; they are reused for every row shown in this position."""
+        frame = ctk.CTkFrame(self._body)
+        self._configure_columns(frame)
+        self._bind_wheel(frame)
+
+        offset = 0
+        if self.actions:
+            offset = 1
+            actions_frame = ctk.CTkFrame(frame, fg_color="transparent")
+            actions_frame.grid(row=0, column=0, padx=5, sticky="w")
+            self._bind_wheel(actions_frame)
+            for action in self.actions:
+                button = ctk.CTkButton(
+                    actions_frame,
+                    text=action.text,
+                    # Resolved on click, so the button always acts on the row now shown
+                    command=lambda a=action, p=position: self._run_action(a, p),
+                    **(action.style or {})
+                )
+                button.pack(side="left", padx=2)
+                self._bind_wheel(button)
+
+        labels = []
+        for i in range(len(self.columns)):
+            label = ctk.CTkLabel(frame, text="", **self._row_style)
+            label.grid(row=0, column=i + offset, padx=5, sticky="nsew")
+            self._bind_wheel(label)
+            labels.append(label)
+        return _Slot(frame, labels)
+
+    def _row_pixels(self) -> int:
+        """Height of one row including its padding, measured once a row exists."""
+        if self._slots:
+            measured = self._slots[0].frame.winfo_reqheight()
+            if measured > 1:
+                return measured + 2 * ROW_PADY
+        return self._row_height
+
+    def _on_resize(self, event=None):
+        """Recomputes how many rows fit and shows them."""
+        height = self._body.winfo_height()
+        if height <= 1:
+            return
+        # A partly visible last row is covered by the overscan
+        visible = max(1, math.floor(height / self._row_pixels()))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    # --- Data ---
+
+    def set_rows(self, rows: List, keep_position: bool = False):
+        """Shows a new list of rows.
+
+        Args:
+            rows: The row objects; cells are produced by each column's text().
+            keep_position: Keep the current scroll position (e.g. after a refresh)
+                instead of returning to the top.
+        """
+        self._rows = rows
+        if not keep_position:
+            self._first = 0
+        self._hide_message()
+        self._render()
+
+    def show_message(self, text: str):
+        """Hides the rows and shows a message (e.g. "Loading...") in the body."""
+        self._rows = []
+        self._first = 0
+        self._render()
+        if self._message is None:
+            self._message = ctk.CTkLabel(self._body, text=text, font=("Arial", 14))
+        else:
+            self._message.configure(text=text)
+        self._message.grid(row=0, column=0, pady=20)
+
+    def _hide_message(self):
+        if self._message is not None:
+            self._message.grid_remove()
+
+    def scroll_to(self, index: int):
+        """Scrolls so that the row at index is at the top (as far as possible)."""
+        first = max(0, min(index, len(self._rows) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _render(self):
+        """Binds the rows from self._first onward to the row widgets."""
+        self._first = max(0, min(self._first, len(self._rows) - self._visible))
+        needed = min(self._visible + self.overscan, len(self._rows))
+        while len(self._slots) < needed:
+            self._slots.append(self._create_slot(len(self._slots)))
+
+        for position, slot in enumerate(self._slots):
+            index = self._first + position
+            if position < needed and index < len(self._rows):
+                self._bind_slot(slot, index)
+                if slot.index is None:
+                    slot.frame.grid(row=position, column=0, sticky="ew", pady=ROW_PADY)
+                slot.index = index
+            elif slot.index is not None:
+                slot.frame.grid_remove()
+                slot.index = None
+        self._update_scrollbar()
+
+    def _bind_slot(self, slot: _Slot, index: int):
+        """Shows row `index` in a slot, configuring only the labels whose text changed."""
+        row = self._rows[index]
+        for i, column in enumerate(self.columns):
+            text = column.text(index, row)
+            if slot.texts[i] != text:
+                slot.labels[i].configure(text=text)
+                slot.texts[i] = text
+
+    def _run_action(self, action: Action, position: int):
+        """Runs an action button's command with the row its slot currently shows."""
+        index = self._slots[position].index
+        if index is not None and index < len(self._rows):
+            action.command(self._rows[index])
+
+    # --- Scrolling ---
+
+    def _update_scrollbar(self):
+        total = len(self._rows)
+        if total <= self._visible:
+            self._scrollbar.set(0.0, 1.0)
+        else:
+            self._scrollbar.set(self._first / total, (self._first + self._visible) / total)
+
+    def _on_scrollbar(self, command, value, unit=None):
+        """Scrollbar callback: ("moveto", fraction) or ("scroll", steps, "units"/"pages")."""
+        if command == "moveto":
+            self.scroll_to(round(float(value) * len(self._rows)))
+        elif command == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_to(self._first + int(value) * step)
+
+    def _bind_wheel(self, widget):
+        """Scrolls the table when the mouse wheel turns over widget."""
+        if sys.platform.startswith("linux"):
+            widget.bind("<Button-4>", lambda e: self.scroll_to(self._first - WHEEL_ROWS), add="+")
+            widget.bind("<Button-5>", lambda e: self.scroll_to(self._first + WHEEL_ROWS), add="+")
+        else:
+            widget.bind("<MouseWheel>", self._on_mouse_wheel, add="+")
+
+    def _on_mouse_wheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small step counts
+        notches = event.delta / 120 if sys.platform.startswith("win") else event.delta
+        direction = -1 if notches > 0 else 1
+        self.scroll_to(self._first + direction * max(1, round(abs(notches))) * WHEEL_ROWS)
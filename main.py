@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 from frontend.login import Login
 from backend.init_db import init_database
+from backend.database import close_connections, close_write_queue
+from backend.worker import shutdown_worker
 
 class Main:
     """Main application class responsible for setting up the main window and managing the application flow."""
@@ -155,6 +157,12 @@ class Main:
         
         # Start the main event loop
         self.main_window.mainloop()
+        
+        # Commit any queued writes, stop the background database worker,
+        # then release the pooled connections
+        close_write_queue()
+        shutdown_worker()
+        close_connections()
 
 if __name__ == "__main__":
     # Initialize the database before starting the application